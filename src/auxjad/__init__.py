@@ -38,6 +38,7 @@ from .score.Context import Context, Staff, StaffGroup, Voice
 from .score.HarmonicNote import HarmonicNote
 from .score.Score import Score
 from .spanners.piano_pedal import piano_pedal
+from .utils.batch_output import batch_output
 from .utils.staff_splitter import staff_splitter
 
 __author__ = "Gilberto Agostinho <gilbertohasnofb@gmail.com>"
@@ -73,5 +74,6 @@ __all__ = [
     "StaffGroup",
     "Voice",
     "piano_pedal",
+    "batch_output",
     "staff_splitter",
 ]
@@ -1,6 +1,10 @@
 import random
+from bisect import bisect_right
+from itertools import accumulate
 from typing import Any
 
+from ._make_rng import _make_rng
+
 
 class CartographySelector:
     r"""A selector used to store, manipulate, and select objects using a
@@ -74,14 +78,15 @@ class CartographySelector:
     :meth:`__call__` and argument ``no_repeat``:
         Calling the selector with the optional keyword argument ``no_repeat``
         set to ``True`` will forbid immediate repetitions among consecutive
-        calls.
+        calls. The previously selected element is excluded from the
+        distribution, so that each call draws a single random number.
 
         >>> selector = auxjad.CartographySelector([0, 1, 2, 3, 4])
         >>> result = ""
         >>> for _ in range(30):
         ...     result += str(selector(no_repeat=True))
         >>> result
-        210421021020304024230120241202
+        201042103210102040402423023032
 
     :attr:`decay_rate`:
         The keyword argument :attr:`decay_rate` can be used to set a different
@@ -107,6 +112,18 @@ class CartographySelector:
         >>> result
         '000001002100000201001030000100'
 
+    :meth:`draw`:
+        Use :meth:`draw` to select ``k`` elements at once. The output is the
+        same as calling the selector ``k`` times with the same value of
+        ``no_repeat``.
+
+        >>> selector = auxjad.CartographySelector([0, 1, 2, 3, 4])
+        >>> result = selector.draw(1000, no_repeat=True)
+        >>> len(result)
+        1000
+        >>> selector.previous_result == result[-1]
+        True
+
     :meth:`drop_first_and_append`:
         This is a type of content transformation, it drops the first element of
         :attr:`contents`, shifts all others leftwards, and appends the new
@@ -288,9 +305,14 @@ class CartographySelector:
 
     __slots__ = (
         "_contents",
+        "_offset",
+        "_contents_is_shared",
         "_decay_rate",
         "_previous_index",
         "_weights",
+        "_cumulative_weights",
+        "_seed",
+        "_rng",
     )
 
     # ---------- INITIALISER ----------
@@ -300,7 +322,9 @@ class CartographySelector:
         contents: list[Any],
         *,
         decay_rate: float = 0.75,
+        seed: int | random.Random | None = None,
     ) -> None:
+        self.seed = seed
         if not isinstance(contents, list):
             raise TypeError("'contents' must be 'list'")
         if not isinstance(decay_rate, float):
@@ -308,6 +332,8 @@ class CartographySelector:
         if decay_rate <= 0.0 or decay_rate > 1.0:
             raise ValueError("'decay_rate' must be larger than 0.0 and less than or equal to 1.0")
         self._contents = contents[:]
+        self._offset = 0
+        self._contents_is_shared = False
         self._previous_index = None
         self._decay_rate = decay_rate
         self._generate_weights()
@@ -316,7 +342,7 @@ class CartographySelector:
 
     def __repr__(self) -> str:
         r"""Returns interpreter representation of :attr:`contents`."""
-        return str(self._contents)
+        return str(self.contents)
 
     def __len__(self) -> int:
         r"""Returns the length of :attr:`contents`."""
@@ -332,20 +358,8 @@ class CartographySelector:
         """
         if not isinstance(no_repeat, bool):
             raise TypeError("'no_repeat' must be 'bool")
-        if not no_repeat:
-            new_index = random.choices(
-                [n for n in range(self.__len__())],
-                weights=self._weights,
-            )[0]
-        else:
-            new_index = self._previous_index
-            while new_index == self._previous_index:
-                new_index = random.choices(
-                    [n for n in range(self.__len__())],
-                    weights=self._weights,
-                )[0]
-        self._previous_index = new_index
-        return self._contents[self._previous_index]
+        self._previous_index = self._choose_index(no_repeat=no_repeat)
+        return self._contents[self._ring_index(self._previous_index)]
 
     def __next__(self) -> Any:
         r"""Calls the selection process and outputs one element of
@@ -360,7 +374,9 @@ class CartographySelector:
         r"""Returns one or more elements of :attr:`contents` through indexing
         or slicing.
         """
-        return self._contents[key]
+        if isinstance(key, int):
+            return self._contents[self._ring_index(key)]
+        return self.contents[key]
 
     def __setitem__(
         self,
@@ -370,7 +386,10 @@ class CartographySelector:
         r"""Assigns values to one or more elements of :attr:`contents` through
         indexing or slicing.
         """
-        self._contents[key] = value
+        if isinstance(key, int):
+            self._contents[self._ring_index(key)] = value
+        else:
+            self.contents[key] = value
         self._generate_weights()
 
     def __delitem__(
@@ -380,11 +399,34 @@ class CartographySelector:
         r"""Deletes one or more elements of :attr:`contents` through indexing
         or slicing.
         """
-        del self._contents[key]
+        del self.contents[key]
         self._generate_weights()
 
     # ---------- PUBLIC METHODS ----------
 
+    def draw(
+        self,
+        k: int,
+        *,
+        no_repeat: bool = False,
+    ) -> list[Any]:
+        r"""Calls the selection process ``k`` times and outputs a :obj:`list`
+        with the selected elements of :attr:`contents`. The result is the same
+        as calling the selector ``k`` times with the same value of
+        ``no_repeat``.
+        """
+        if not isinstance(k, int):
+            raise TypeError("first positional argument must be 'int'")
+        if k <= 0:
+            raise ValueError("first positional argument must be a positive 'int'")
+        if not isinstance(no_repeat, bool):
+            raise TypeError("'no_repeat' must be 'bool")
+        results = []
+        for _ in range(k):
+            self._previous_index = self._choose_index(no_repeat=no_repeat)
+            results.append(self._contents[self._ring_index(self._previous_index)])
+        return results
+
     def drop_first_and_append(
         self,
         new_element: Any,
@@ -393,7 +435,13 @@ class CartographySelector:
         :attr:`contents`, shifts all others leftwards, and appends the new
         element to the last index.
         """
-        self._contents = self._contents[1:] + [new_element]
+        self._unshare_contents()
+        if not self._contents:
+            self._contents.append(new_element)
+            self._generate_weights()
+            return
+        self._contents[self._offset] = new_element
+        self._offset = (self._offset + 1) % len(self._contents)
 
     def drop_n_and_append(
         self,
@@ -406,7 +454,28 @@ class CartographySelector:
         :attr:`contents`, shifts all the next elements one position lefwards,
         and appends the new element at the last index.
         """
-        self._contents = self._contents[:n] + self._contents[n + 1 :] + [new_element]
+        self._unshare_contents()
+        size = len(self._contents)
+        if not 0 <= n < size:
+            contents = self._contents[self._offset :] + self._contents[: self._offset]
+            self._offset = 0
+            self._contents = contents[:n] + contents[n + 1 :] + [new_element]
+            self._generate_weights()
+            return
+        # shifting whichever side of the dropped element is shorter
+        if n < size - n:
+            for index in range(n, 0, -1):
+                self._contents[self._ring_index(index)] = self._contents[
+                    self._ring_index(index - 1)
+                ]
+            self._contents[self._offset] = new_element
+            self._offset = (self._offset + 1) % size
+        else:
+            for index in range(n, size - 1):
+                self._contents[self._ring_index(index)] = self._contents[
+                    self._ring_index(index + 1)
+                ]
+            self._contents[self._ring_index(size - 1)] = new_element
 
     def drop_last_and_prepend(
         self,
@@ -416,7 +485,13 @@ class CartographySelector:
         :attr:`contents`, shifts all others rightwards, and then prepends
         the new element to the first index.
         """
-        self._contents = [new_element] + self._contents[:-1]
+        self._unshare_contents()
+        if not self._contents:
+            self._contents.append(new_element)
+            self._generate_weights()
+            return
+        self._offset = (self._offset - 1) % len(self._contents)
+        self._contents[self._offset] = new_element
 
     def rotate(
         self,
@@ -428,10 +503,13 @@ class CartographySelector:
         keyword argument ``anticlockwise`` is set to ``True``, the rotation
         will be in the opposite direction.
         """
+        if not self._contents:
+            return
+        self._unshare_contents()
         if not anticlockwise:
-            self._contents = self._contents[1:] + self._contents[:1]
+            self._offset = (self._offset + 1) % len(self._contents)
         else:
-            self._contents = self._contents[-1:] + self._contents[:-1]
+            self._offset = (self._offset - 1) % len(self._contents)
 
     def mirror_swap(
         self,
@@ -443,8 +521,9 @@ class CartographySelector:
         the same distance from the centre of the :attr:`contents` (in terms of
         number of indeces), and are located at either side of this centre.
         """
-        self._contents[index], self._contents[-1 - index] = (
-            self._contents[-1 - index],
+        index, complementary_index = self._ring_index(index), self._ring_index(-1 - index)
+        self._contents[index], self._contents[complementary_index] = (
+            self._contents[complementary_index],
             self._contents[index],
         )
 
@@ -456,14 +535,67 @@ class CartographySelector:
         the operation and it would not result in any changes.
         """
         max_index = self.__len__() // 2 - 1
-        self.mirror_swap(random.randint(0, max_index))
+        self.mirror_swap(self._rng.randint(0, max_index))
 
     def shuffle(self) -> None:
         r"""Shuffles the position of the elements of :attr:`contents`."""
-        random.shuffle(self._contents)
+        self._rng.shuffle(self.contents)
 
     # ---------- PRIVATE METHODS ----------
 
+    def _unshare_contents(self) -> None:
+        r"""Copies the ring buffer if it has been returned by :attr:`contents`,
+        so that transformations which shift elements within the buffer do not
+        change lists previously read from that property.
+        """
+        if self._contents_is_shared:
+            self._contents = self._contents[:]
+            self._contents_is_shared = False
+
+    def _ring_index(
+        self,
+        index: int,
+    ) -> int:
+        r"""Converts an index of :attr:`contents` into an index of the ring
+        buffer in which the elements are stored. Content transformations
+        which shift all elements only move the offset of the first element
+        in this buffer.
+        """
+        size = len(self._contents)
+        if not -size <= index < size:
+            raise IndexError("list index out of range")
+        return (self._offset + index) % size
+
+    def _choose_index(
+        self,
+        *,
+        no_repeat: bool,
+    ) -> int:
+        r"""Selects an index by bisecting the cached cumulative weights with
+        the same single random number as :func:`random.choices`. When
+        ``no_repeat`` is ``True``, the previous index is excluded from the
+        distribution, so that a single random number is still drawn.
+        """
+        cumulative_weights = self._cumulative_weights
+        if not cumulative_weights:
+            raise IndexError("cannot select from empty 'contents'")
+        max_index = len(cumulative_weights) - 1
+        total = cumulative_weights[-1] + 0.0
+        excluded_index = self._previous_index
+        if not no_repeat or excluded_index is None or excluded_index > max_index:
+            return bisect_right(cumulative_weights, self._rng.random() * total, 0, max_index)
+        if max_index == 0:
+            raise ValueError("'no_repeat' requires 'contents' with at least two elements")
+        excluded_weight = self._weights[excluded_index]
+        value = self._rng.random() * (total - excluded_weight)
+        if excluded_index == 0 or value >= cumulative_weights[excluded_index - 1]:
+            value += excluded_weight
+        new_index = bisect_right(cumulative_weights, value, 0, max_index)
+        if new_index == excluded_index:
+            # rounding errors at the boundary of the excluded index
+            new_index = excluded_index + 1 if excluded_index < max_index else excluded_index - 1
+        return new_index
+
     def _generate_weights(self) -> None:
         r"""Given a decay rate, this method generates the :attr:`weights` of
         individual indeces.
@@ -471,12 +603,17 @@ class CartographySelector:
         self._weights = []
         for n in range(self.__len__()):
             self._weights.append(self._decay_rate**n)
+        self._cumulative_weights = list(accumulate(self._weights))
 
     # ---------- PUBLIC PROPERTIES ----------
 
     @property
     def contents(self) -> list[Any]:
         r"""The :obj:`list` from which the selector picks elements."""
+        if self._offset != 0:
+            self._contents = self._contents[self._offset :] + self._contents[: self._offset]
+            self._offset = 0
+        self._contents_is_shared = True
         return self._contents
 
     @contents.setter
@@ -487,6 +624,8 @@ class CartographySelector:
         if not isinstance(contents, list):
             raise TypeError("'contents' must be 'list")
         self._contents = contents[:]
+        self._offset = 0
+        self._contents_is_shared = False
         self._generate_weights()
 
     @property
@@ -524,7 +663,7 @@ class CartographySelector:
     def previous_result(self) -> Any:
         r"""Read-only property, returns the previously output element."""
         if self._previous_index is not None:
-            return self._contents[self._previous_index]
+            return self._contents[self._ring_index(self._previous_index)]
         else:
             return self._previous_index
 
@@ -532,3 +671,20 @@ class CartographySelector:
     def weights(self) -> list[float]:
         r"""Read-only property, returns the weight vector."""
         return self._weights
+
+    @property
+    def seed(self) -> int | random.Random | None:
+        r"""Seed of the random number generator which selects elements and
+        performs random content transformations. Takes an :obj:`int`, an
+        instance of :class:`random.Random`, or ``None`` (default) for the
+        global :mod:`random` module.
+        """
+        return self._seed
+
+    @seed.setter
+    def seed(
+        self,
+        seed: int | random.Random | None,
+    ) -> None:
+        self._rng = _make_rng(seed)
+        self._seed = seed
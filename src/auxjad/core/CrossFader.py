@@ -5,6 +5,7 @@ import abjad
 
 from .. import mutate
 from .Fader import Fader
+from ._make_rng import _make_rng
 
 
 class CrossFader:
@@ -1632,6 +1633,41 @@ class CrossFader:
             } %! abjad.LilyPondFile._get_formatted_blocks()
 
         ..  figure:: ../_images/CrossFader-5qvaan79w8p.png
+
+    Precomputing masks:
+        Set :attr:`precompute_masks` to ``True`` to make :meth:`output_all` and
+        :meth:`output_n` compute the masks of both faders for the whole process
+        before applying them to the contents. Each fader then applies a mask
+        only when it differs from its previous one, so that the windows
+        repeated because of :attr:`initial_repetitions`,
+        :attr:`final_repetitions`, or :attr:`repetition_chance` are simply
+        copied. The output is the same as when this property is set to
+        ``False`` (default).
+
+        >>> fade_out_container = abjad.Container(r"e'8 fs'4. r2")
+        >>> fade_in_container = abjad.Container(r"c''2 d''2")
+        >>> fader = auxjad.CrossFader(fade_out_container,
+        ...                           fade_in_container,
+        ...                           initial_repetitions=3,
+        ...                           final_repetitions=3,
+        ...                           precompute_masks=True,
+        ...                           )
+        >>> selection_a, selection_b = fader.output_all()
+
+    Render cache:
+        Set :attr:`render_cache_size` to the maximum number of windows to be
+        cached by each fader, and windows of repeated masks will not be
+        notated again. Each output is a new copy of the cached window. The
+        properties :attr:`render_cache_hits` and :attr:`render_cache_misses`
+        count the windows of both faders that were and were not found in their
+        caches, and :meth:`clear_render_cache` empties both caches and resets
+        these counters.
+
+        >>> fader = auxjad.CrossFader(fade_out_container,
+        ...                           fade_in_container,
+        ...                           render_cache_size=100,
+        ...                           )
+        >>> selection_a, selection_b = fader.output_all()
     """
 
     # ---------- CLASS VARIABLES ----------
@@ -1659,6 +1695,10 @@ class CrossFader:
         "_rewrite_tuplets",
         "_fade_in_first",
         "_fade_out_last",
+        "_precompute_masks",
+        "_render_cache_size",
+        "_seed",
+        "_rng",
     )
 
     # ---------- INITIALISER ----------
@@ -1680,15 +1720,20 @@ class CrossFader:
         boundary_depth: int | None = None,
         maximum_dot_count: int | None = None,
         rewrite_tuplets: bool = True,
+        precompute_masks: bool = False,
+        render_cache_size: int | None = None,
+        seed: int | random.Random | None = None,
     ) -> None:
+        self.seed = seed
         if not isinstance(fade_out_contents, abjad.Container):
             raise TypeError("'fade_out_contents' must be 'abjad.Container' or child class")
         if not isinstance(fade_in_contents, abjad.Container):
             raise TypeError("'fade_in_contents' must be 'abjad.Container' or child class")
         self._fade_out_contents = fade_out_contents
         self._fade_in_contents = fade_in_contents
-        self._fader_out = Fader(self._fade_out_contents, mode="out")
-        self._fader_in = Fader(self._fade_in_contents, mode="in")
+        fader_seed = None if self._seed is None else self._rng
+        self._fader_out = Fader(self._fade_out_contents, mode="out", seed=fader_seed)
+        self._fader_in = Fader(self._fade_in_contents, mode="in", seed=fader_seed)
         self._faders = (self._fader_in, self._fader_out)
         self._is_first_window = True
         self._is_first_process = True
@@ -1706,6 +1751,8 @@ class CrossFader:
         self.final_repetitions = final_repetitions
         self.repetition_chance = repetition_chance
         self.weighted_duration = weighted_duration
+        self.precompute_masks = precompute_masks
+        self.render_cache_size = render_cache_size
 
     # ---------- SPECIAL METHODS ----------
 
@@ -1747,13 +1794,23 @@ class CrossFader:
         self.reset()
         dummy_container_a = abjad.Container()
         dummy_container_b = abjad.Container()
-        while True:
-            try:
-                result_a, result_b = self.__call__()
-                dummy_container_a.extend(result_a)
-                dummy_container_b.extend(result_b)
-            except StopIteration:
-                break
+        if self._precompute_masks:
+            masks = []
+            while True:
+                try:
+                    self._cross_fade_process(render=False)
+                    masks.append((self._fader_out._mask[:], self._fader_in._mask[:]))
+                except StopIteration:
+                    break
+            self._render_masks(dummy_container_a, dummy_container_b, masks)
+        else:
+            while True:
+                try:
+                    result_a, result_b = self.__call__()
+                    dummy_container_a.extend(result_a)
+                    dummy_container_b.extend(result_b)
+                except StopIteration:
+                    break
         mutate.remove_repeated_time_signatures(dummy_container_a[:])
         mutate.remove_repeated_time_signatures(dummy_container_b[:])
         mutate.remove_repeated_dynamics(dummy_container_a[:])
@@ -1777,13 +1834,23 @@ class CrossFader:
         self.reset()
         dummy_container_a = abjad.Container()
         dummy_container_b = abjad.Container()
-        for _ in range(n):
-            try:
-                result_a, result_b = self.__call__()
-                dummy_container_a.extend(result_a)
-                dummy_container_b.extend(result_b)
-            except StopIteration:
-                break
+        if self._precompute_masks:
+            masks = []
+            for _ in range(n):
+                try:
+                    self._cross_fade_process(render=False)
+                    masks.append((self._fader_out._mask[:], self._fader_in._mask[:]))
+                except StopIteration:
+                    break
+            self._render_masks(dummy_container_a, dummy_container_b, masks)
+        else:
+            for _ in range(n):
+                try:
+                    result_a, result_b = self.__call__()
+                    dummy_container_a.extend(result_a)
+                    dummy_container_b.extend(result_b)
+                except StopIteration:
+                    break
         mutate.remove_repeated_time_signatures(dummy_container_a[:])
         mutate.remove_repeated_time_signatures(dummy_container_b[:])
         mutate.remove_repeated_dynamics(dummy_container_a[:])
@@ -1802,13 +1869,26 @@ class CrossFader:
         self._fader_in.reset()
         self._fader_out.reset()
 
+    def clear_render_cache(self) -> None:
+        r"""Empties the render caches of both faders and resets their hit and
+        miss counters.
+        """
+        self._fader_in.clear_render_cache()
+        self._fader_out.clear_render_cache()
+
     # ---------- PRIVATE METHODS ----------
 
-    def _cross_fade_process(self) -> None:
-        r"""Processes both faders according to the cross fade process."""
+    def _cross_fade_process(
+        self,
+        *,
+        render: bool = True,
+    ) -> None:
+        r"""Processes both faders according to the cross fade process. When
+        ``render`` is ``False``, only the masks of the faders are processed.
+        """
         if self._is_first_window:
-            self._fader_out()
-            self._fader_in()
+            self._call_fader(self._fader_out, render)
+            self._call_fader(self._fader_in, render)
             self._initial_repetitions_counter += 1
             self._is_first_window = False
         elif self._initial_repetitions_counter < self._initial_repetitions:
@@ -1822,32 +1902,71 @@ class CrossFader:
             if (
                 self._is_first_process
                 or self._repetition_chance == 0.0
-                or random.random() > self._repetition_chance
+                or self._rng.random() > self._repetition_chance
             ):
                 if self._fade_in_first and self._is_first_process:
-                    self._fader_in()
+                    self._call_fader(self._fader_in, render)
                     self._is_first_process = False
                 elif (
                     self._fade_out_last
-                    and sum(self._fader_out._mask) == 1
+                    and self._fader_out._count_ones() == 1
                     and not self._fader_in._done
                 ):
-                    self._fader_in()
+                    self._call_fader(self._fader_in, render)
                 else:
                     try:
-                        random_fader = random.choices(
+                        random_fader = self._rng.choices(
                             self._faders,
                             weights=self._weights,
                         )[0]
-                        random_fader()
+                        self._call_fader(random_fader, render)
                     except StopIteration:
                         other_fader = self._faders[0]
                         if other_fader is random_fader:
                             other_fader = self._faders[1]
-                        other_fader()
+                        self._call_fader(other_fader, render)
                     finally:
                         self._is_first_process = False
 
+    def _render_masks(
+        self,
+        container_a: abjad.Container,
+        container_b: abjad.Container,
+        masks: list[tuple[list[int]]],
+    ) -> None:
+        r"""Applies each pair of a :obj:`list` of precomputed masks to the
+        contents of both faders and extends ``container_a`` and
+        ``container_b`` with the resulting windows. A fader only applies its
+        mask when it differs from its previous one, with its window being
+        copied otherwise.
+        """
+        previous_masks = (None, None)
+        for current_masks in masks:
+            for fader, mask, previous_mask in zip(
+                (self._fader_out, self._fader_in),
+                current_masks,
+                previous_masks,
+            ):
+                if mask != previous_mask:
+                    fader._render_mask(mask)
+            previous_masks = current_masks
+            result_a, result_b = self.current_window
+            container_a.extend(result_a)
+            container_b.extend(result_b)
+
+    @staticmethod
+    def _call_fader(
+        fader: Fader,
+        render: bool,
+    ) -> None:
+        r"""Calls the fading process of a fader for one iteration. When
+        ``render`` is ``False``, only its mask is processed.
+        """
+        if render:
+            fader()
+        else:
+            fader._process_mask()
+
     def _get_lilypond_format(self) -> str:
         r"""Returns interpreter representation of  :attr:`contents`."""
         return self.__repr__()
@@ -2129,6 +2248,82 @@ class CrossFader:
         self._fader_in.rewrite_tuplets = rewrite_tuplets
         self._fader_out.rewrite_tuplets = rewrite_tuplets
 
+    @property
+    def precompute_masks(self) -> bool:
+        r"""If ``True`` then :meth:`output_all` and :meth:`output_n` will first
+        compute the masks of both faders for the whole process and only then
+        apply them to their contents, applying identical consecutive masks only
+        once.
+        """
+        return self._precompute_masks
+
+    @precompute_masks.setter
+    def precompute_masks(
+        self,
+        precompute_masks: bool,
+    ) -> None:
+        if not isinstance(precompute_masks, bool):
+            raise TypeError("'precompute_masks' must be 'bool'")
+        self._precompute_masks = precompute_masks
+
+    @property
+    def render_cache_size(self) -> int | None:
+        r"""Maximum number of windows kept in the render cache of each fader.
+        When set to an :obj:`int`, the windows of both contents are cached by
+        their mask and notation options, and repeated masks are not notated
+        again; once a cache is full, its least recently used windows are
+        discarded. Default is ``None``, which disables the caches.
+        """
+        return self._render_cache_size
+
+    @render_cache_size.setter
+    def render_cache_size(
+        self,
+        render_cache_size: int | None,
+    ) -> None:
+        if render_cache_size is not None:
+            if not isinstance(render_cache_size, int):
+                raise TypeError("'render_cache_size' must be 'int' or 'None'")
+            if render_cache_size < 1:
+                raise ValueError("'render_cache_size' must be greater than zero")
+        self._render_cache_size = render_cache_size
+        self._fader_in.render_cache_size = render_cache_size
+        self._fader_out.render_cache_size = render_cache_size
+
+    @property
+    def render_cache_hits(self) -> int:
+        r"""Read-only property, returns the number of windows of both faders
+        that were found in their render caches.
+        """
+        return self._fader_in.render_cache_hits + self._fader_out.render_cache_hits
+
+    @property
+    def render_cache_misses(self) -> int:
+        r"""Read-only property, returns the number of windows of both faders
+        that were not found in their render caches.
+        """
+        return self._fader_in.render_cache_misses + self._fader_out.render_cache_misses
+
+    @property
+    def seed(self) -> int | random.Random | None:
+        r"""Seed of the random number generator which chooses the fader
+        processed at each iteration and, shared with both faders, the notes to
+        be faded. Takes an :obj:`int`, an instance of :class:`random.Random`,
+        or ``None`` (default) for the global :mod:`random` module.
+        """
+        return self._seed
+
+    @seed.setter
+    def seed(
+        self,
+        seed: int | random.Random | None,
+    ) -> None:
+        self._rng = _make_rng(seed)
+        self._seed = seed
+        if hasattr(self, "_faders"):
+            for fader in self._faders:
+                fader.seed = None if seed is None else self._rng
+
     # ---------- PRIVATE PROPERTIES ----------
 
     @property
@@ -1,4 +1,6 @@
 import copy
+from array import array
+from itertools import islice
 from typing import Any, Iterator
 
 
@@ -215,9 +217,9 @@ class DeBruijnGenerator:
 
     :attr:`algorithm`:
         Thee are multiple algorithms which can generate de Bruijn sequences, which can be selected
-        using :attr:`algorithm`. Currently, options include ``"pcr1"`` or ``"pcr2"``. Both produce
-        valid de Bruijn sequences but differ for most combinations of order and alphabet size.
-        :attr:`algorithm` defaults to ``"pcr1"``.
+        using :attr:`algorithm`. Currently, options include ``"pcr1"``, ``"pcr2"``, or ``"fkm"``.
+        All produce valid de Bruijn sequences but differ for most combinations of order and
+        alphabet size. :attr:`algorithm` defaults to ``"pcr1"``.
 
         >>> db_generator = auxjad.DeBruijnGenerator(
         ...     [0, 1, 2],
@@ -228,6 +230,56 @@ class DeBruijnGenerator:
         >>> db_generator.output_all()
         [0, 0, 1, 1, 0, 2, 1, 2, 2]
 
+        The ``"fkm"`` algorithm (by Fredricksen, Kessler, and Maiorana) concatenates all Lyndon
+        words whose lengths divide :attr:`order` in lexicographic order, outputting the
+        lexicographically smallest de Bruijn sequence. It takes constant amortised time per
+        element, which makes it the fastest option for large orders and alphabets.
+
+        >>> db_generator = auxjad.DeBruijnGenerator(
+        ...     [0, 1, 2],
+        ...     order=2,
+        ...     algorithm="fkm",
+        ...     cyclic=True,
+        ... )
+        >>> db_generator.output_all()
+        [0, 0, 1, 0, 2, 1, 1, 2, 2]
+
+    :attr:`lazy`:
+        By default, the full de Bruijn sequence is generated whenever the generator is reset, which
+        for large orders and alphabets means generating millions of elements before the first one
+        is output. Set :attr:`lazy` to ``True`` to generate elements one at a time as they are
+        output instead, keeping only the current state of the :attr:`algorithm` in memory.
+        :attr:`sequence_length` is computed arithmetically in both cases.
+
+        >>> db_generator = auxjad.DeBruijnGenerator(
+        ...     list(range(12)),
+        ...     order=6,
+        ...     algorithm="fkm",
+        ...     lazy=True,
+        ... )
+        >>> db_generator.sequence_length
+        2985989
+        >>> db_generator.output_n(8)
+        [0, 0, 0, 0, 0, 0, 1, 0]
+
+    :meth:`element_at`, :meth:`window_position`, and :meth:`seek`:
+        Use :meth:`element_at` to read any element of the sequence and :meth:`window_position` to
+        find the position at which a subgroup of :attr:`order` elements starts, without changing
+        the state of the generator. :meth:`seek` moves the generator to a position of the sequence,
+        so that generation can be resumed from any point. Each window of the sequence is encoded as
+        an integer, so after an index is built once both lookups take constant time.
+
+        >>> db_generator = auxjad.DeBruijnGenerator([0, 1, 2], order=2, cyclic=True)
+        >>> db_generator.sequence
+        [0, 0, 1, 0, 2, 1, 1, 2, 2]
+        >>> db_generator.element_at(4)
+        2
+        >>> db_generator.window_position([2, 1])
+        4
+        >>> db_generator.seek(4)
+        >>> db_generator.output_n(3)
+        [2, 1, 1]
+
     :attr:`order`:
         The :attr:`order` can be changed after initialisation. This regenerates the sequence.
 
@@ -345,12 +397,16 @@ class DeBruijnGenerator:
         "_cyclic",
         "_sequence",
         "_sequence_length",
+        "_lazy",
+        "_symbol_stream",
+        "_symbols",
+        "_window_positions",
         "_last_selected_index_of_sequence",
         "_previous_element",
         "_previous_element_index",
     )
 
-    _DE_BRUIJN_ALGORITHMS = ["pcr1", "pcr2"]
+    _DE_BRUIJN_ALGORITHMS = ["pcr1", "pcr2", "fkm"]
 
     # ---------- INITIALISER ----------
 
@@ -361,6 +417,7 @@ class DeBruijnGenerator:
         order: int,
         algorithm: str = "pcr1",
         cyclic: bool = False,
+        lazy: bool = False,
     ) -> None:
         if not isinstance(contents, list):
             raise TypeError("'contents' must be 'list'")
@@ -378,6 +435,8 @@ class DeBruijnGenerator:
             )
         if not isinstance(cyclic, bool):
             raise TypeError("'cyclic' must be 'bool'")
+        if not isinstance(lazy, bool):
+            raise TypeError("'lazy' must be 'bool'")
         # initialising using attributes, not properties, due to ordering constraints. This is
         # because self._generate_sequence() is called when setting any of the attributes below, and
         # this function requires the other attributes to have valid values.
@@ -385,6 +444,7 @@ class DeBruijnGenerator:
         self._algorithm = algorithm
         self._cyclic = cyclic
         self._order = order
+        self._lazy = lazy
         self._previous_element = None
         self._previous_element_index = None
         self._last_selected_index_of_sequence = None
@@ -410,11 +470,16 @@ class DeBruijnGenerator:
             next_index = 0
         else:
             next_index = self._last_selected_index_of_sequence + 1
-            if next_index >= len(self._sequence):
+            if next_index >= self._sequence_length:
                 raise StopIteration("sequence has been exhausted")
         self._last_selected_index_of_sequence = next_index
 
-        self._previous_element_index = self._sequence[self._last_selected_index_of_sequence]
+        if self._lazy:
+            if next_index == 0:
+                self._symbol_stream = self._iterate_symbols()
+            self._previous_element_index = next(self._symbol_stream)
+        else:
+            self._previous_element_index = self._sequence[self._last_selected_index_of_sequence]
         self._previous_element = self._contents[self._previous_element_index]
 
         return self.previous_element
@@ -477,6 +542,12 @@ class DeBruijnGenerator:
         if self._last_selected_index_of_sequence is None:
             self._last_selected_index_of_sequence = self.sequence_length - 1
             return self.sequence
+        if self._lazy:
+            output_sequence = [
+                copy.deepcopy(self._contents[index]) for index in self._symbol_stream
+            ]
+            self._last_selected_index_of_sequence = self.sequence_length - 1
+            return output_sequence
         output_sequence = self.sequence[self._last_selected_index_of_sequence + 1 :]
         self._last_selected_index_of_sequence = self.sequence_length - 1
         return output_sequence
@@ -497,13 +568,57 @@ class DeBruijnGenerator:
                 )
         return output_list
 
+    def element_at(self, index: int) -> Any:
+        r"""Returns the element at position ``index`` of the de Bruijn sequence mapped to
+        :attr:`contents`, without changing the state of the generator.
+        """
+        index = self._validate_sequence_index(index)
+        return copy.deepcopy(self._contents[self._symbol_at(index)])
+
+    def window_position(self, window: list[Any]) -> int:
+        r"""Returns the position in the de Bruijn sequence at which a given subgroup of
+        :attr:`order` elements of :attr:`contents` starts.
+        """
+        if not isinstance(window, list):
+            raise TypeError("first positional argument must be 'list'")
+        if len(window) != self._order:
+            raise ValueError("first positional argument must have the same length as 'order'")
+        window_code = 0
+        for element in window:
+            if element not in self._contents:
+                raise ValueError("elements of first positional argument must be in 'contents'")
+            window_code = window_code * self.__len__() + self._contents.index(element)
+        self._build_index()
+        return self._window_positions[window_code]
+
+    def seek(self, index: int) -> None:
+        r"""Moves the generator to a position of the de Bruijn sequence, so that the next call
+        outputs the element at position ``index``.
+        """
+        index = self._validate_sequence_index(index)
+        if index == 0:
+            self._last_selected_index_of_sequence = None
+            self._previous_element = None
+            self._previous_element_index = None
+            self._symbol_stream = None
+            return
+        self._last_selected_index_of_sequence = index - 1
+        self._previous_element_index = self._symbol_at(index - 1)
+        self._previous_element = self._contents[self._previous_element_index]
+        if self._lazy:
+            if self._symbols is not None:
+                self._symbol_stream = islice(self._symbols, index, None)
+            else:
+                self._symbol_stream = islice(self._iterate_symbols(), index, None)
+
     def reset(self) -> None:
         r"""Resets the generator to its initial state and regenerates the sequence.
 
         Resets :attr:`last_selected_index_of_sequence` to ``None`` and clears
         :attr:`previous_element` and :attr:`previous_element_index`. Regenerates :attr:`sequence` by
-        calling :meth:`_generate_sequence`. This method is called automatically whenever
-        :attr:`contents`, :attr:`order`, :attr:`algorithm`, or :attr:`cyclic` are changed.
+        calling :meth:`_generate_sequence` (unless :attr:`lazy` is ``True``). This method is called
+        automatically whenever :attr:`contents`, :attr:`order`, :attr:`algorithm`, :attr:`cyclic`,
+        or :attr:`lazy` are changed.
         """
         self._last_selected_index_of_sequence = None
         self._previous_element = None
@@ -513,8 +628,77 @@ class DeBruijnGenerator:
     # ---------- PRIVATE METHODS ----------
 
     def _generate_sequence(self) -> None:
-        r"""Generates the full de Bruijn sequence. Uses a specified :attr:`algorithm` for selecting
-        the next symbol in the sequence, and maps it to the correct element of :attr:`contents`.
+        r"""Computes the length of the de Bruijn sequence and, unless :attr:`lazy` is ``True``,
+        generates the full sequence.
+        """
+        self._sequence_length = self.__len__() ** self._order
+        if not self._cyclic:
+            self._sequence_length += self._order - 1
+        self._symbol_stream = None
+        self._symbols = None
+        self._window_positions = None
+        if self._lazy:
+            self._sequence = None
+        else:
+            self._sequence = list(self._iterate_symbols())
+
+    def _validate_sequence_index(self, index: int) -> int:
+        r"""Checks an index of the de Bruijn sequence, returning it as a non-negative value."""
+        if not isinstance(index, int):
+            raise TypeError("first positional argument must be 'int'")
+        if not -self._sequence_length <= index < self._sequence_length:
+            raise IndexError("first positional argument is out of range of the sequence")
+        return index % self._sequence_length
+
+    def _symbol_at(self, index: int) -> int:
+        r"""Returns the symbol (i.e. index of :attr:`contents`) at a position of the de Bruijn
+        sequence.
+        """
+        if self._sequence is not None:
+            return self._sequence[index]
+        self._build_index()
+        return self._symbols[index]
+
+    def _build_index(self) -> None:
+        r"""Builds the index used for random access to the de Bruijn sequence, unless it has
+        already been built since the last reset.
+
+        The symbols of the sequence are stored in a compact :obj:`array` when :attr:`lazy` is
+        ``True``. Each window of :attr:`order` symbols is encoded as an integer in base
+        alphabet size, updated as the window rolls through the sequence, and the position at which
+        each window starts is stored in an :obj:`array` indexed by these codes. Since every window
+        occurs exactly once within the first ``alphabet_size ** order`` positions (wrapping around
+        for cyclic sequences), both lookups take constant time.
+        """
+        if self._window_positions is not None:
+            return
+        alphabet_size = self.__len__()
+        if self._sequence is not None:
+            self._symbols = self._sequence
+        else:
+            if alphabet_size <= 2**8:
+                typecode = "B"
+            elif alphabet_size <= 2**16:
+                typecode = "H"
+            else:
+                typecode = "L"
+            self._symbols = array(typecode, self._iterate_symbols())
+        n_windows = alphabet_size**self._order
+        window_positions = array("q", bytes(8 * n_windows))
+        window_code = 0
+        for position in range(self._order - 1):
+            window_code = window_code * alphabet_size + self._symbols[position]
+        for position in range(n_windows):
+            last_symbol = self._symbols[(position + self._order - 1) % n_windows]
+            window_code = (window_code * alphabet_size + last_symbol) % n_windows
+            window_positions[window_code] = position
+        self._window_positions = window_positions
+
+    def _iterate_symbols(self) -> Iterator[int]:
+        r"""Iterates through the symbols of the de Bruijn sequence (i.e. indices of
+        :attr:`contents`). Uses a specified :attr:`algorithm` for selecting the next symbol in the
+        sequence. Only the current window (or Lyndon word, for the FKM algorithm) is kept in
+        memory.
 
         Both PCR1 and PCR2 algorithms start with a window of length :attr:`order` filled with 0s,
         e.g. for ``order = 4`` the window is ``[0, 0, 0, 0]``. Both algorithms work by dropping the
@@ -535,27 +719,71 @@ class DeBruijnGenerator:
         output sequence thus ends with a series of ``x``'s. However,  :attr:`cyclic` is set to
         ``False``, the algorithm append order - 1 zeroes at the end of the sequence.
         """
+        order = self._order
+        alphabet_size = self.__len__()
+        if self._algorithm == "fkm":
+            yield from self._fkm_symbols(order, alphabet_size)
+            # The sequence starts with order times zeroes, so the non-cyclic sequence ends with
+            # order - 1 zeroes just like PCR1 and PCR2.
+            if not self._cyclic:
+                yield from [0] * (order - 1)
+            return
         generator_name = "_" + self._algorithm + "_generator"
         successor_generator = getattr(self, generator_name)
-        window = [0] * self._order
-        self._sequence = []
+        window = [0] * order
+        # The window is also encoded as a base alphabet_size integer which is updated as the
+        # window rolls, so that checking for a window filled with zeroes takes constant time.
+        window_code = 0
+        leading_place_value = alphabet_size ** (order - 1)
 
         while True:
-            self._sequence.append(window[0])
+            yield window[0]
             next_symbol = successor_generator(
                 window,
-                self._order,
-                self.__len__(),  # length of contents = alphabet size
+                order,
+                alphabet_size,  # length of contents = alphabet size
             )
-            window = window[1:] + [next_symbol]
-            if all(symbol == 0 for symbol in window):
+            window_code = (window_code - window[0] * leading_place_value) * alphabet_size
+            window_code += next_symbol
+            del window[0]
+            window.append(next_symbol)
+            if window_code == 0:
                 break
 
         # If not cyclic, we must get order - 1 zeroes to append at the end of both PCR1 and PCR2.
         # Since window now contains order times zeroes, we simply extend the sequence by this window
         # minus one element.
         if not self._cyclic:
-            self._sequence.extend(window[:-1])
+            yield from window[:-1]
+
+    @staticmethod
+    def _fkm_symbols(order: int, alphabet_size: int) -> Iterator[int]:
+        r"""Iterates through the cyclic de Bruijn sequence using the Fredricksen-Kessler-Maiorana
+        (FKM) construction.
+
+        Lyndon words are generated in lexicographic order by incrementing the last symbol of the
+        current word, extending it periodically to length ``order``, and then removing trailing
+        maximum symbols. Concatenating the words whose lengths divide ``order`` results in the
+        lexicographically smallest de Bruijn sequence, in constant amortised time per symbol.
+
+        Args:
+            order (int): Order of the de Bruijn sequence.
+            alphabet_size (int): Number of distinct symbols in alphabet.
+
+        Yields:
+            int: The next symbol of the cyclic de Bruijn sequence.
+        """
+        max_symbol = alphabet_size - 1
+        word = [-1]
+        while word:
+            word[-1] += 1
+            word_length = len(word)
+            if order % word_length == 0:
+                yield from word
+            while len(word) < order:
+                word.append(word[-word_length])
+            while word and word[-1] == max_symbol:
+                word.pop()
 
     @staticmethod
     def _pcr1_generator(window: list[int], order: int, alphabet_size: int) -> int:
@@ -705,8 +933,8 @@ class DeBruijnGenerator:
         r"""Return ``True`` if and only if ``sequence`` is a necklace (its own lexicographically
         minimal rotation).
 
-        Pads with a leading zero so that period arithmetic uses 1-based positions, keeping ``i``
-        and ``period_candidate`` (:math:`p` in the original C implementation) directly comparable.
+        Uses 0-based positions, so that ``period_candidate`` (:math:`p` in the original C
+        implementation) is compared with ``i + 1`` and no padded copy of ``sequence`` is made.
 
         Args:
             sequence (list[int]): The sequence to test (0-based values).
@@ -715,15 +943,12 @@ class DeBruijnGenerator:
             bool: ``True`` if ``sequence`` is a necklace, ``False`` otherwise.
         """
         n = len(sequence)
-        # Pad with a leading zero so that period arithmetic in the loop below uses 1-based
-        # positions, keeping i and period_candidate directly comparable
-        padded_sequence = [0] + sequence
         period_candidate = 1
-        for i in range(2, n + 1):
-            if padded_sequence[i - period_candidate] > padded_sequence[i]:
+        for i in range(1, n):
+            if sequence[i - period_candidate] > sequence[i]:
                 return False
-            if padded_sequence[i - period_candidate] < padded_sequence[i]:
-                period_candidate = i
+            if sequence[i - period_candidate] < sequence[i]:
+                period_candidate = i + 1
         return n % period_candidate == 0
 
     # ---------- PUBLIC PROPERTIES ----------
@@ -750,7 +975,7 @@ class DeBruijnGenerator:
     @property
     def algorithm(self) -> str:
         r"""Thee are multiple algorithms which can generate de Bruijn sequences. Current options
-        include ``"pcr1"`` or ``"pcr2"``.
+        include ``"pcr1"``, ``"pcr2"``, or ``"fkm"``.
         """
         return self._algorithm
 
@@ -837,6 +1062,24 @@ class DeBruijnGenerator:
         self._cyclic = cyclic
         self.reset()
 
+    @property
+    def lazy(self) -> bool:
+        r""":obj:`bool` representing whether the sequence is generated on demand, defaulting to
+        ``False``. When ``True``, elements are generated one at a time as they are output instead
+        of the full sequence being generated whenever the generator is reset.
+        """
+        return self._lazy
+
+    @lazy.setter
+    def lazy(
+        self,
+        lazy: bool,
+    ) -> None:
+        if not isinstance(lazy, bool):
+            raise TypeError("'lazy' must be 'bool'")
+        self._lazy = lazy
+        self.reset()
+
     @property
     def previous_element_index(self) -> int | None:
         r"""Read-only property, returns the index in :attr:`contents` of the previously output
@@ -861,13 +1104,20 @@ class DeBruijnGenerator:
 
     @property
     def sequence(self) -> list[Any]:
-        r"""Read-only property, returns the de Bruijn sequence mapped to :attr:`contents`."""
+        r"""Read-only property, returns the de Bruijn sequence mapped to :attr:`contents`. If
+        :attr:`lazy` is ``True``, the sequence is generated anew each time this property is read.
+        """
+        if self._lazy:
+            return [copy.deepcopy(self._contents[index]) for index in self._iterate_symbols()]
         return [copy.deepcopy(self._contents[index]) for index in self._sequence]
 
     @property
     def sequence_length(self) -> int:
-        r"""Read-only property, returns the length of the de Bruijn sequence."""
-        return len(self._sequence)
+        r"""Read-only property, returns the length of the de Bruijn sequence. It is computed
+        arithmetically from the :attr:`order` and the alphabet size, so it is available without
+        generating the sequence.
+        """
+        return self._sequence_length
 
     @property
     def _done(self) -> bool:
@@ -876,4 +1126,4 @@ class DeBruijnGenerator:
         """
         if self._last_selected_index_of_sequence is None:
             return False
-        return self._last_selected_index_of_sequence >= len(self._sequence) - 1
+        return self._last_selected_index_of_sequence >= self._sequence_length - 1
@@ -1,9 +1,11 @@
 import random
+from collections import OrderedDict
 from typing import Iterator
 
 import abjad
 
 from .. import get, mutate
+from ._make_rng import _make_rng
 
 
 class Echoer:
@@ -1409,6 +1411,22 @@ class Echoer:
             }
 
         ..  figure:: ../_images/Echoer-lkhKFVuUgx.png
+
+    Render cache:
+        Set :attr:`render_cache_size` to the maximum number of windows to be
+        cached, and windows of repeated masks (such as the ones caused by
+        :attr:`repetition_chance`) will not be notated again. Each output is a
+        new copy of the cached window. The properties
+        :attr:`render_cache_hits` and :attr:`render_cache_misses` count the
+        windows that were and were not found in the cache, and
+        :meth:`clear_render_cache` empties the cache and resets both counters.
+
+        >>> container = abjad.Container(r"c'4\mf d'4 e'2")
+        >>> echoer = auxjad.Echoer(container,
+        ...                        repetition_chance=0.5,
+        ...                        render_cache_size=10,
+        ...                        )
+        >>> notes = echoer.output_all()
     """
 
     # ---------- CLASS VARIABLES ----------
@@ -1435,6 +1453,12 @@ class Echoer:
         "_fuse_across_groups_of_beats",
         "_fuse_quadruple_meter",
         "_fuse_triple_meter",
+        "_render_cache",
+        "_render_cache_size",
+        "_render_cache_hits",
+        "_render_cache_misses",
+        "_seed",
+        "_rng",
     )
 
     _dynamic_name_to_dynamic_ordinal = {
@@ -1500,7 +1524,14 @@ class Echoer:
         fuse_across_groups_of_beats: bool = True,
         fuse_quadruple_meter: bool = True,
         fuse_triple_meter: bool = True,
+        render_cache_size: int | None = None,
+        seed: int | random.Random | None = None,
     ) -> None:
+        self._render_cache = OrderedDict()
+        self._render_cache_hits = 0
+        self._render_cache_misses = 0
+        self.render_cache_size = render_cache_size
+        self.seed = seed
         self.min_dynamic = min_dynamic
         self.max_steps = max_steps
         self.contents = contents
@@ -1535,7 +1566,7 @@ class Echoer:
         r"""Calls the echo process for one iteration, returning an
         |abjad.Selection|.
         """
-        if self._repetition_chance == 0.0 or random.random() > self._repetition_chance:
+        if self._repetition_chance == 0.0 or self._rng.random() > self._repetition_chance:
             if not self._is_first_window or self._process_on_first_call:
                 self._soften_mask()
         self._mask_to_selection()
@@ -1595,12 +1626,47 @@ class Echoer:
         self._is_first_window = True
         self._get_mask()
 
+    def clear_render_cache(self) -> None:
+        r"""Empties the render cache and resets its hit and miss counters."""
+        self._render_cache.clear()
+        self._render_cache_hits = 0
+        self._render_cache_misses = 0
+
     # ---------- PRIVATE METHODS ----------
 
     def _mask_to_selection(self) -> None:
-        r"""Applies the mask to :attr:`contents`."""
+        r"""Applies the mask to :attr:`contents`, looking up the resulting
+        window in the render cache first when it is enabled. The least recently
+        used windows are discarded when the cache is full.
+        """
+        apply_mask = not self._is_first_window or self._process_on_first_call
+        if self._render_cache_size is None:
+            window = self._render_window(apply_mask)
+        else:
+            key = (tuple(self._mask), apply_mask, self._get_notation_options())
+            try:
+                window = self._render_cache[key]
+            except KeyError:
+                self._render_cache_misses += 1
+                window = self._render_window(apply_mask)
+                self._render_cache[key] = window
+                if len(self._render_cache) > self._render_cache_size:
+                    self._render_cache.popitem(last=False)
+            else:
+                self._render_cache_hits += 1
+                self._render_cache.move_to_end(key)
+        self._current_window = window
+        self._is_first_window = False
+
+    def _render_window(
+        self,
+        apply_mask: bool,
+    ) -> abjad.Selection:
+        r"""Returns a selection with :attr:`contents`, with the mask applied
+        to it if ``apply_mask`` is ``True``.
+        """
         dummy_container = abjad.mutate.copy(self._contents)
-        if not self._is_first_window or self._process_on_first_call:
+        if apply_mask:
             logical_ties = abjad.select(dummy_container).logical_ties(
                 pitched=True,
             )
@@ -1639,9 +1705,26 @@ class Echoer:
         if self._use_multimeasure_rests:
             mutate.rests_to_multimeasure_rest(dummy_container[:])
         # output
-        self._current_window = dummy_container[:]
+        window = dummy_container[:]
         dummy_container[:] = []
-        self._is_first_window = False
+        return window
+
+    def _get_notation_options(self) -> tuple:
+        r"""Returns a :obj:`tuple` with the properties which affect how a mask
+        is notated, used in the keys of the render cache.
+        """
+        return (
+            self._disable_rewrite_meter,
+            self._use_multimeasure_rests,
+            self._boundary_depth,
+            self._maximum_dot_count,
+            self._rewrite_tuplets,
+            self._prettify_rewrite_meter,
+            self._extract_trivial_tuplets,
+            self._fuse_across_groups_of_beats,
+            self._fuse_quadruple_meter,
+            self._fuse_triple_meter,
+        )
 
     def _get_lilypond_format(self) -> str:
         r"""Returns interpreter representation of  :attr:`contents`."""
@@ -1679,7 +1762,7 @@ class Echoer:
 
     def _soften_mask(self) -> list[int | None]:
         r"""Lowers the dynamics of the mask by one level."""
-        for n in range(random.randint(1, self._max_steps)):
+        for n in range(self._rng.randint(1, self._max_steps)):
             if any(item is not None for item in self._mask):
                 self._mask = [
                     self._soften_dynamic(
@@ -1775,6 +1858,7 @@ class Echoer:
             do_not_use_none=True,
         )
         mutate.enforce_time_signature(self._contents, time_signatures)
+        self._render_cache.clear()
         dummy_container = abjad.mutate.copy(contents)
         self._current_window = dummy_container[:]
         dummy_container[:] = []
@@ -2050,6 +2134,63 @@ class Echoer:
             raise ValueError("'repetition_chance' must be between 0.0 and 1.0")
         self._repetition_chance = repetition_chance
 
+    @property
+    def render_cache_size(self) -> int | None:
+        r"""Maximum number of windows kept in the render cache. When set to an
+        :obj:`int`, the windows output by this class are cached by their mask
+        and notation options, and repeated masks are not notated again; once
+        the cache is full, the least recently used windows are discarded.
+        Default is ``None``, which disables the cache.
+        """
+        return self._render_cache_size
+
+    @render_cache_size.setter
+    def render_cache_size(
+        self,
+        render_cache_size: int | None,
+    ) -> None:
+        if render_cache_size is not None:
+            if not isinstance(render_cache_size, int):
+                raise TypeError("'render_cache_size' must be 'int' or 'None'")
+            if render_cache_size < 1:
+                raise ValueError("'render_cache_size' must be greater than zero")
+            while len(self._render_cache) > render_cache_size:
+                self._render_cache.popitem(last=False)
+        else:
+            self._render_cache.clear()
+        self._render_cache_size = render_cache_size
+
+    @property
+    def render_cache_hits(self) -> int:
+        r"""Read-only property, returns the number of windows that were found
+        in the render cache.
+        """
+        return self._render_cache_hits
+
+    @property
+    def render_cache_misses(self) -> int:
+        r"""Read-only property, returns the number of windows that were not
+        found in the render cache.
+        """
+        return self._render_cache_misses
+
+    @property
+    def seed(self) -> int | random.Random | None:
+        r"""Seed of the random number generator which sets the number of steps
+        and the repetitions of the echo process. Takes an :obj:`int`, an
+        instance of :class:`random.Random`, or ``None`` (default) for the
+        global :mod:`random` module.
+        """
+        return self._seed
+
+    @seed.setter
+    def seed(
+        self,
+        seed: int | random.Random | None,
+    ) -> None:
+        self._rng = _make_rng(seed)
+        self._seed = seed
+
     # ---------- PRIVATE PROPERTIES ----------
 
     @property
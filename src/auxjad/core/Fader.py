@@ -1,10 +1,13 @@
 import random
-from typing import Any, Iterator
+from collections import OrderedDict
+from typing import Iterator
 
 import abjad
 
 from .. import get, mutate
 from ..score.ArtificialHarmonic import ArtificialHarmonic
+from ._FenwickTree import _FenwickTree
+from ._make_rng import _make_rng
 
 
 class Fader:
@@ -1407,6 +1410,71 @@ class Fader:
             }
 
         ..  figure:: ../_images/Fader-lkhKFVuUgx.png
+
+    Precomputing masks:
+        When running the whole process with :meth:`output_all` or
+        :meth:`output_n`, set :attr:`precompute_masks` to ``True`` to compute
+        all masks of the fading process before applying any of them to
+        :attr:`contents`. Identical consecutive masks, such as the ones caused
+        by :attr:`repetition_chance`, are then applied only once and their
+        windows are copied for each repetition. The output is the same as when
+        this property is set to ``False`` (default).
+
+        >>> container = abjad.Container(r"c'4 d'4 e'2")
+        >>> fader = auxjad.Fader(container,
+        ...                      repetition_chance=0.5,
+        ...                      precompute_masks=True,
+        ...                      )
+        >>> notes = fader.output_all()
+        >>> staff = abjad.Staff(notes)
+        >>> abjad.show(staff)
+
+        ..  docs::
+
+            \new Staff
+            {
+                \time 4/4
+                c'4
+                d'4
+                e'2
+                r4
+                d'4
+                e'2
+                r4
+                d'4
+                e'2
+                r4
+                d'4
+                r2
+                R1
+            }
+
+    Render cache:
+        Fading processes often revisit the same masks, for instance when
+        :attr:`repetition_chance` is used or when the whole process is output
+        multiple times. Set :attr:`render_cache_size` to the maximum number of
+        windows to be cached, and windows of repeated masks will not be
+        notated again. Each window is cached together with the properties
+        which affect its notation, such as :attr:`boundary_depth`, and each
+        output is a new copy of the cached window. The properties
+        :attr:`render_cache_hits` and :attr:`render_cache_misses` count the
+        windows that were and were not found in the cache.
+
+        >>> container = abjad.Container(r"c'4 d'4 e'4 f'4")
+        >>> fader = auxjad.Fader(container,
+        ...                      render_cache_size=100,
+        ...                      seed=2,
+        ...                      )
+        >>> for _ in range(3):
+        ...     fader.reset()
+        ...     notes = fader.output_all()
+        >>> fader.render_cache_hits
+        7
+        >>> fader.render_cache_misses
+        8
+
+        Use :meth:`clear_render_cache` to empty the cache and reset both
+        counters.
     """
 
     # ---------- CLASS VARIABLES ----------
@@ -1418,6 +1486,8 @@ class Fader:
         "_max_steps",
         "_disable_rewrite_meter",
         "_mask",
+        "_mask_tree",
+        "_changed_mask_indices",
         "_is_first_window",
         "_time_signatures",
         "_omit_time_signatures",
@@ -1433,6 +1503,18 @@ class Fader:
         "_fuse_across_groups_of_beats",
         "_fuse_quadruple_meter",
         "_fuse_triple_meter",
+        "_seed",
+        "_rng",
+        "_logical_ties",
+        "_mask_table",
+        "_masked_contents",
+        "_masked_logical_ties",
+        "_applied_mask",
+        "_precompute_masks",
+        "_render_cache",
+        "_render_cache_size",
+        "_render_cache_hits",
+        "_render_cache_misses",
     )
 
     # ---------- INITIALISER ----------
@@ -1458,7 +1540,15 @@ class Fader:
         fuse_across_groups_of_beats: bool = True,
         fuse_quadruple_meter: bool = True,
         fuse_triple_meter: bool = True,
+        precompute_masks: bool = False,
+        render_cache_size: int | None = None,
+        seed: int | random.Random | None = None,
     ) -> None:
+        self._render_cache = OrderedDict()
+        self._render_cache_hits = 0
+        self._render_cache_misses = 0
+        self.render_cache_size = render_cache_size
+        self.seed = seed
         self.mode = mode
         self.max_steps = max_steps
         self.contents = contents
@@ -1478,6 +1568,7 @@ class Fader:
         self.process_on_first_call = process_on_first_call
         self.include_empty_measures = include_empty_measures
         self.repetition_chance = repetition_chance
+        self.precompute_masks = precompute_masks
         self._is_first_window = True
 
     # ---------- SPECIAL METHODS ----------
@@ -1488,29 +1579,13 @@ class Fader:
 
     def __len__(self) -> int:
         r"""Returns the number of notes of :attr:`contents`."""
-        length = 0
-        logical_ties = abjad.select(self._contents).logical_ties(pitched=True)
-        for logical_tie in logical_ties:
-            if isinstance(logical_tie.head, ArtificialHarmonic):
-                length += 1
-            elif isinstance(logical_tie.head, abjad.Chord):
-                length += len(logical_tie.head.written_pitches)
-            else:
-                length += 1
-        return length
+        return len(self._mask_table)
 
     def __call__(self) -> abjad.Selection:
         r"""Calls the fading process for one iteration, returning an
         |abjad.Selection|.
         """
-        if self._repetition_chance == 0.0 or random.random() > self._repetition_chance:
-            if not self._is_first_window or self._process_on_first_call:
-                if self._mode == "out":
-                    self._remove_element()
-                else:
-                    self._add_element()
-            elif not self._include_empty_measures and self._mode == "in":
-                self._add_element()
+        self._process_mask()
         self._mask_to_selection()
         return self.current_window
 
@@ -1533,10 +1608,19 @@ class Fader:
         |abjad.Selection|.
         """
         dummy_container = abjad.Container()
-        while True:
-            dummy_container.append(self.__call__())
-            if self._done:
-                break
+        if self._precompute_masks:
+            masks = []
+            while True:
+                self._process_mask()
+                masks.append(self._mask[:])
+                if self._done:
+                    break
+            self._render_masks(dummy_container, masks)
+        else:
+            while True:
+                dummy_container.append(self.__call__())
+                if self._done:
+                    break
         mutate.remove_repeated_time_signatures(dummy_container[:])
         mutate.remove_repeated_dynamics(dummy_container[:])
         output = dummy_container[:]
@@ -1555,8 +1639,15 @@ class Fader:
         if n <= 0:
             raise ValueError("first positional argument must be a positive 'int'")
         dummy_container = abjad.Container()
-        for _ in range(n):
-            dummy_container.append(self.__call__())
+        if self._precompute_masks:
+            masks = []
+            for _ in range(n):
+                self._process_mask()
+                masks.append(self._mask[:])
+            self._render_masks(dummy_container, masks)
+        else:
+            for _ in range(n):
+                dummy_container.append(self.__call__())
         mutate.remove_repeated_time_signatures(dummy_container[:])
         mutate.remove_repeated_dynamics(dummy_container[:])
         output = dummy_container[:]
@@ -1569,88 +1660,166 @@ class Fader:
         """
         self._is_first_window = True
         if self._mode == "out":
-            self._mask = [1 for _ in range(self.__len__())]
+            self._set_mask([1 for _ in range(self.__len__())])
         else:
-            self._mask = [0 for _ in range(self.__len__())]
+            self._set_mask([0 for _ in range(self.__len__())])
 
     def random_mask(self) -> None:
         r"""Creates a mask randomly filled with ``1``'s and ``0``'s."""
         self._is_first_window = True
-        self._mask = [random.randint(0, 1) for _ in range(self.__len__())]
+        self._set_mask([self._rng.randint(0, 1) for _ in range(self.__len__())])
 
     def shuffle_mask(self) -> None:
         r"""Shuffles the current mask."""
         self._is_first_window = True
-        random.shuffle(self._mask)
+        mask = self._mask[:]
+        self._rng.shuffle(mask)
+        self._set_mask(mask)
+
+    def clear_render_cache(self) -> None:
+        r"""Empties the render cache and resets its hit and miss counters."""
+        self._render_cache.clear()
+        self._render_cache_hits = 0
+        self._render_cache_misses = 0
 
     # ---------- PRIVATE METHODS ----------
 
+    def _process_mask(self) -> None:
+        r"""Applies one iteration of the fading process to the mask, without
+        applying the mask to :attr:`contents`.
+        """
+        if self._repetition_chance == 0.0 or self._rng.random() > self._repetition_chance:
+            if not self._is_first_window or self._process_on_first_call:
+                if self._mode == "out":
+                    self._remove_element()
+                else:
+                    self._add_element()
+            elif not self._include_empty_measures and self._mode == "in":
+                self._add_element()
+        self._is_first_window = False
+
+    def _render_masks(
+        self,
+        container: abjad.Container,
+        masks: list[list[int]],
+    ) -> None:
+        r"""Applies each mask of a :obj:`list` of precomputed masks to
+        :attr:`contents` and appends the resulting windows to ``container``.
+        Identical consecutive masks are applied only once, with their window
+        being copied for the repetitions.
+        """
+        previous_mask = None
+        for mask in masks:
+            if mask != previous_mask:
+                self._render_mask(mask)
+                previous_mask = mask
+            container.append(self.current_window)
+
+    def _render_mask(
+        self,
+        mask: list[int],
+    ) -> None:
+        r"""Sets the mask to a precomputed mask and applies it to
+        :attr:`contents`.
+        """
+        for index, element in enumerate(mask):
+            self._set_mask_element(index, element)
+        self._mask_to_selection()
+
+    def _set_mask(
+        self,
+        mask: list[int],
+    ) -> None:
+        r"""Sets the mask, also storing it in a tree of cumulative counts of
+        ``1``'s which allows counting them and finding the index of their
+        n-th occurrence in logarithmic time.
+        """
+        self._mask = mask[:]
+        self._mask_tree = _FenwickTree(self._mask)
+        self._changed_mask_indices = None
+
+    def _set_mask_element(
+        self,
+        index: int,
+        element: int,
+    ) -> None:
+        r"""Sets an element of the mask, updating the tree of cumulative
+        counts and keeping track of the changed indices.
+        """
+        if self._mask[index] == element:
+            return
+        self._mask[index] = element
+        self._mask_tree.add(index, 1 if element == 1 else -1)
+        if self._changed_mask_indices is not None:
+            self._changed_mask_indices.add(index)
+
+    def _count_ones(self) -> int:
+        r"""Returns the number of ``1``'s in the mask."""
+        return self._mask_tree.total()
+
     def _remove_element(self) -> None:
         r"""Sets a random element of the mask to ``0``."""
-        for n in range(random.randint(1, self._max_steps)):
-            if 1 in self._mask:
-                total_count = sum(self._mask)
-                random_count = random.randint(0, total_count - 1)
-                index = self._get_index_of_nth_occurrence(
-                    self._mask,
-                    element=1,
-                    count=random_count,
-                )
-                self._mask[index] = 0
+        for n in range(self._rng.randint(1, self._max_steps)):
+            total_count = self._count_ones()
+            if total_count > 0:
+                random_count = self._rng.randint(0, total_count - 1)
+                # index of the n-th occurrence of 1
+                index = self._mask_tree.search(random_count)
+                self._set_mask_element(index, 0)
             elif n == 0:
                 raise StopIteration("'current_window' is already empty")
 
     def _add_element(self) -> None:
         r"""Sets a random element of the mask to ``1``."""
-        for n in range(random.randint(1, self._max_steps)):
-            if 0 in self._mask:
-                total_count = self.__len__() - sum(self._mask)
-                random_count = random.randint(0, total_count - 1)
-                index = self._get_index_of_nth_occurrence(
-                    self._mask,
-                    element=0,
-                    count=random_count,
+        for n in range(self._rng.randint(1, self._max_steps)):
+            total_count = self.__len__() - self._count_ones()
+            if total_count > 0:
+                random_count = self._rng.randint(0, total_count - 1)
+                # index of the n-th occurrence of 0, each node of the tree
+                # covering a number of elements given by its lowest set bit
+                mask_tree = self._mask_tree
+                index = mask_tree.search_nodes(
+                    random_count,
+                    lambda node: (node & -node) - mask_tree.node(node),
                 )
-                self._mask[index] = 1
+                self._set_mask_element(index, 1)
             elif n == 0:
                 raise StopIteration("'current_window' is already full")
 
     def _mask_to_selection(self) -> None:
-        r"""Applies the mask to :attr:`contents`."""
-        dummy_container = abjad.mutate.copy(self._contents)
-        logical_ties = abjad.select(dummy_container).logical_ties(pitched=True)
-        mask_index = 0
-        for logical_tie in logical_ties:
-            if isinstance(logical_tie.head, abjad.Chord) and not isinstance(
-                logical_tie.head, ArtificialHarmonic
-            ):
-                chord_len = len(logical_tie.head.written_pitches)
-                if 1 not in self._mask[mask_index : mask_index + chord_len]:
-                    self._convert_pitched_logical_tie_to_rest(logical_tie)
-                    mask_index += chord_len
-                else:
-                    new_written_pitches = []
-                    for written_pitch in logical_tie.head.written_pitches:
-                        if self._mask[mask_index] != 0:
-                            new_written_pitches.append(written_pitch)
-                        mask_index += 1
-                    if len(new_written_pitches) > 1:
-                        for leaf in logical_tie:
-                            leaf.written_pitches = new_written_pitches
-                    else:
-                        for leaf in logical_tie:
-                            note = abjad.Note(
-                                new_written_pitches[0],
-                                leaf.written_duration,
-                            )
-                            for indicator in abjad.get.indicators(leaf):
-                                abjad.attach(indicator, note)
-                            abjad.mutate.replace(leaf, note)
-            elif self._mask[mask_index] == 0:
-                self._convert_pitched_logical_tie_to_rest(logical_tie)
-                mask_index += 1
-            else:
-                mask_index += 1
+        r"""Applies the mask to :attr:`contents`, looking up the resulting
+        window in the render cache first when it is enabled. The least recently
+        used windows are discarded when the cache is full.
+        """
+        if self._render_cache_size is None:
+            self._current_window = self._render_window()
+            return
+        key = (tuple(self._mask), self._get_notation_options())
+        try:
+            window = self._render_cache[key]
+        except KeyError:
+            self._render_cache_misses += 1
+            window = self._render_window()
+            self._render_cache[key] = window
+            if len(self._render_cache) > self._render_cache_size:
+                self._render_cache.popitem(last=False)
+        else:
+            self._render_cache_hits += 1
+            self._render_cache.move_to_end(key)
+        self._current_window = window
+
+    def _render_window(self) -> abjad.Selection:
+        r"""Returns a selection with the mask applied to :attr:`contents`. A
+        copy of :attr:`contents` with the previous mask applied to it is kept
+        between calls, so that only the leaves of the logical ties with changed
+        elements of the mask are rebuilt. The passes which follow (repositioning
+        dynamics and slurs, rewriting the meter, and making multi-measure rests)
+        still run on a new copy of the whole masked contents at every call, so
+        their cost is proportional to the length of :attr:`contents`. Use
+        :attr:`render_cache_size` to skip them for repeated masks.
+        """
+        self._update_masked_contents()
+        dummy_container = abjad.mutate.copy(self._masked_contents)
         # handling dynamics and slurs and empty tuplets
         mutate.reposition_dynamics(dummy_container[:])
         mutate.reposition_slurs(dummy_container[:])
@@ -1671,19 +1840,131 @@ class Fader:
         if self._use_multimeasure_rests:
             mutate.rests_to_multimeasure_rest(dummy_container[:])
         # output
-        self._current_window = dummy_container[:]
+        window = dummy_container[:]
         dummy_container[:] = []
-        self._is_first_window = False
+        return window
+
+    def _get_notation_options(self) -> tuple:
+        r"""Returns a :obj:`tuple` with the properties which affect how a mask
+        is notated, used in the keys of the render cache.
+        """
+        return (
+            self._disable_rewrite_meter,
+            self._use_multimeasure_rests,
+            self._boundary_depth,
+            self._maximum_dot_count,
+            self._rewrite_tuplets,
+            self._prettify_rewrite_meter,
+            self._extract_trivial_tuplets,
+            self._fuse_across_groups_of_beats,
+            self._fuse_quadruple_meter,
+            self._fuse_triple_meter,
+        )
+
+    def _index_logical_ties(self) -> None:
+        r"""Makes a table mapping each element of the mask to the index of its
+        pitched logical tie in :attr:`contents` and to its slot within that
+        logical tie (which is the index of the pitch for chords, and ``0``
+        otherwise). Artificial harmonics take a single element of the mask.
+        """
+        self._logical_ties = []
+        self._mask_table = []
+        logical_ties = abjad.select(self._contents).logical_ties(pitched=True)
+        for logical_tie_index, logical_tie in enumerate(logical_ties):
+            self._logical_ties.append(list(logical_tie))
+            if isinstance(logical_tie.head, abjad.Chord) and not isinstance(
+                logical_tie.head, ArtificialHarmonic
+            ):
+                n_slots = len(logical_tie.head.written_pitches)
+            else:
+                n_slots = 1
+            for slot in range(n_slots):
+                self._mask_table.append((logical_tie_index, slot))
+        self._masked_contents = None
+        self._masked_logical_ties = None
+        self._applied_mask = None
+
+    def _update_masked_contents(self) -> None:
+        r"""Updates the copy of :attr:`contents` with the mask applied to it,
+        replacing only the leaves of the logical ties whose elements of the
+        mask have changed since the last update.
+        """
+        if self._masked_contents is None:
+            self._masked_contents = abjad.mutate.copy(self._contents)
+            self._masked_logical_ties = [
+                list(logical_tie)
+                for logical_tie in abjad.select(self._masked_contents).logical_ties(pitched=True)
+            ]
+            self._applied_mask = [1 for _ in range(self.__len__())]
+        if self._changed_mask_indices is None:
+            changed_mask_indices = range(self.__len__())
+        else:
+            changed_mask_indices = sorted(self._changed_mask_indices)
+        changed_logical_ties = []
+        for index in changed_mask_indices:
+            if self._applied_mask[index] != self._mask[index]:
+                logical_tie_index, slot = self._mask_table[index]
+                if not changed_logical_ties or changed_logical_ties[-1][0] != logical_tie_index:
+                    changed_logical_ties.append((logical_tie_index, index - slot))
+        for logical_tie_index, mask_index in changed_logical_ties:
+            leaves = self._make_masked_logical_tie(logical_tie_index, mask_index)
+            for old_leaf, new_leaf in zip(self._masked_logical_ties[logical_tie_index], leaves):
+                abjad.mutate.replace(old_leaf, new_leaf)
+            self._masked_logical_ties[logical_tie_index] = leaves
+        self._applied_mask = self._mask[:]
+        self._changed_mask_indices = set()
+
+    def _make_masked_logical_tie(
+        self,
+        logical_tie_index: int,
+        mask_index: int,
+    ) -> list[abjad.Leaf]:
+        r"""Makes new leaves for a logical tie of :attr:`contents` according to
+        its elements of the mask (starting at ``mask_index``), converting it
+        into rests when they are all ``0``'s and removing the pitches of chords
+        set to ``0``.
+        """
+        leaves = [abjad.mutate.copy(leaf) for leaf in self._logical_ties[logical_tie_index]]
+        head = leaves[0]
+        if isinstance(head, abjad.Chord) and not isinstance(head, ArtificialHarmonic):
+            chord_len = len(head.written_pitches)
+            chord_mask = self._mask[mask_index : mask_index + chord_len]
+            if 1 not in chord_mask:
+                return [self._make_rest(leaf) for leaf in leaves]
+            new_written_pitches = [
+                written_pitch
+                for written_pitch, element in zip(head.written_pitches, chord_mask)
+                if element != 0
+            ]
+            if len(new_written_pitches) > 1:
+                for leaf in leaves:
+                    leaf.written_pitches = new_written_pitches
+                return leaves
+            notes = []
+            for leaf in leaves:
+                note = abjad.Note(
+                    new_written_pitches[0],
+                    leaf.written_duration,
+                )
+                for indicator in abjad.get.indicators(leaf):
+                    abjad.attach(indicator, note)
+                notes.append(note)
+            return notes
+        if self._mask[mask_index] == 0:
+            return [self._make_rest(leaf) for leaf in leaves]
+        return leaves
 
     def _get_lilypond_format(self) -> str:
         r"""Returns interpreter representation of  :attr:`contents`."""
         return self.__repr__()
 
     @staticmethod
-    def _convert_pitched_logical_tie_to_rest(
-        logical_tie: abjad.LogicalTie,
-    ) -> None:
-        r"""Converts all leaves of a pitched logical tie into rests."""
+    def _make_rest(
+        leaf: abjad.Leaf,
+    ) -> abjad.Rest:
+        r"""Makes a rest with the duration of a pitched leaf, keeping the
+        indicators of the leaf which are relevant to rests.
+        """
         indicators_tuple = (
             abjad.BarLine,
             abjad.Clef,
@@ -1707,12 +1988,11 @@ class Fader:
             abjad.StopTextSpan,
             abjad.TimeSignature,
         )
-        for leaf in logical_tie:
-            rest = abjad.Rest(leaf.written_duration)
-            for indicator in abjad.get.indicators(leaf):
-                if isinstance(indicator, indicators_tuple):
-                    abjad.attach(indicator, rest)
-            abjad.mutate.replace(leaf, rest)
+        rest = abjad.Rest(leaf.written_duration)
+        for indicator in abjad.get.indicators(leaf):
+            if isinstance(indicator, indicators_tuple):
+                abjad.attach(indicator, rest)
+        return rest
 
     @staticmethod
     def _remove_all_time_signatures(
@@ -1723,18 +2003,6 @@ class Fader:
             if abjad.get.effective(leaf, abjad.TimeSignature):
                 abjad.detach(abjad.TimeSignature, leaf)
 
-    @staticmethod
-    def _get_index_of_nth_occurrence(
-        input_list: list[Any],
-        *,
-        element: Any,
-        count: int,
-    ) -> int:
-        r"""Returns the index of the nth occurence of an element in a
-        :obj:`list`.
-        """
-        return tuple(index for index, item in enumerate(input_list) if item == element)[count]
-
     # ---------- PUBLIC PROPERTIES ----------
 
     @property
@@ -1760,6 +2028,8 @@ class Fader:
             do_not_use_none=True,
         )
         mutate.enforce_time_signature(self._contents, time_signatures)
+        self._index_logical_ties()
+        self._render_cache.clear()
         dummy_container = abjad.mutate.copy(contents)
         self._current_window = dummy_container[:]
         dummy_container[:] = []
@@ -1809,9 +2079,9 @@ class Fader:
     @property
     def mask(self) -> list[int]:
         r"""Mask with ``1``'s and ``0``'s representing the notes of
-        :attr:`contents`.
+        :attr:`contents`. Reading this property returns a copy of the mask.
         """
-        return self._mask
+        return self._mask[:]
 
     @mask.setter
     def mask(
@@ -1826,7 +2096,7 @@ class Fader:
             raise ValueError(
                 "'mask' must have the same length as the number of logical ties in 'contents'"
             )
-        self._mask = mask
+        self._set_mask(mask)
         self._is_first_window = True
 
     @property
@@ -2057,6 +2327,80 @@ class Fader:
             raise ValueError("'repetition_chance' must be between 0.0 and 1.0")
         self._repetition_chance = repetition_chance
 
+    @property
+    def precompute_masks(self) -> bool:
+        r"""If ``True`` then :meth:`output_all` and :meth:`output_n` will first
+        compute all masks of the fading process and only then apply them to
+        :attr:`contents`, applying identical consecutive masks only once.
+        """
+        return self._precompute_masks
+
+    @precompute_masks.setter
+    def precompute_masks(
+        self,
+        precompute_masks: bool,
+    ) -> None:
+        if not isinstance(precompute_masks, bool):
+            raise TypeError("'precompute_masks' must be 'bool'")
+        self._precompute_masks = precompute_masks
+
+    @property
+    def render_cache_size(self) -> int | None:
+        r"""Maximum number of windows kept in the render cache. When set to an
+        :obj:`int`, the windows output by this class are cached by their mask
+        and notation options, and repeated masks are not notated again; once
+        the cache is full, the least recently used windows are discarded.
+        Default is ``None``, which disables the cache.
+        """
+        return self._render_cache_size
+
+    @render_cache_size.setter
+    def render_cache_size(
+        self,
+        render_cache_size: int | None,
+    ) -> None:
+        if render_cache_size is not None:
+            if not isinstance(render_cache_size, int):
+                raise TypeError("'render_cache_size' must be 'int' or 'None'")
+            if render_cache_size < 1:
+                raise ValueError("'render_cache_size' must be greater than zero")
+            while len(self._render_cache) > render_cache_size:
+                self._render_cache.popitem(last=False)
+        else:
+            self._render_cache.clear()
+        self._render_cache_size = render_cache_size
+
+    @property
+    def render_cache_hits(self) -> int:
+        r"""Read-only property, returns the number of windows that were found
+        in the render cache.
+        """
+        return self._render_cache_hits
+
+    @property
+    def render_cache_misses(self) -> int:
+        r"""Read-only property, returns the number of windows that were not
+        found in the render cache.
+        """
+        return self._render_cache_misses
+
+    @property
+    def seed(self) -> int | random.Random | None:
+        r"""Seed of the random number generator which picks the notes to be
+        faded and the repeated windows. Takes an :obj:`int`, an instance of
+        :class:`random.Random`, or ``None`` (default) for the global
+        :mod:`random` module.
+        """
+        return self._seed
+
+    @seed.setter
+    def seed(
+        self,
+        seed: int | random.Random | None,
+    ) -> None:
+        self._rng = _make_rng(seed)
+        self._seed = seed
+
     # ---------- PRIVATE PROPERTIES ----------
 
     @property
@@ -2068,8 +2412,8 @@ class Fader:
         """
         if self._mode == "out":
             if self._include_empty_measures:
-                return 1 not in self._mask
+                return self._count_ones() == 0
             else:
-                return sum(self._mask) <= 1
+                return self._count_ones() <= 1
         else:
-            return 0 not in self._mask
+            return self._count_ones() == self.__len__()
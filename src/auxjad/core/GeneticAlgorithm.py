@@ -1,5 +1,14 @@
 import random
-from typing import Iterator
+from array import array
+from collections import OrderedDict
+from typing import Callable, Iterator
+
+from ._make_rng import _make_rng
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class GeneticAlgorithm:
@@ -173,6 +182,100 @@ class GeneticAlgorithm:
         ["A", "B", "E", "D", "E"]
         ["A", "B", "D", "D", "E"]
 
+    :attr:`use_numpy`:
+        For large populations or long targets, set :attr:`use_numpy` to
+        ``True``. The population is then stored as a matrix of gene indices,
+        and scoring, sorting, crossover, and mutation are each performed as a
+        single vectorised NumPy operation over the whole population. Random
+        draws are made by a NumPy generator seeded from :attr:`seed`, so the
+        results differ from the ones of the default implementation. If NumPy
+        is not installed, this property has no effect.
+
+        >>> ga = auxjad.GeneticAlgorithm(
+        ...     target=["A", "B", "C", "D", "E"],
+        ...     genes=["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"],
+        ...     population_size=5000,
+        ...     use_numpy=True,
+        ... )
+        >>> ga.use_numpy
+        True
+
+    :attr:`fitness_cache_size`:
+        Individuals often repeat across generations, either because they are
+        kept as parents (see :attr:`keep_n_parents`) or because the crossover
+        process recreates them. Set :attr:`fitness_cache_size` to the maximum
+        number of scores to be cached, and repeated individuals will not be
+        evaluated again. The properties :attr:`fitness_cache_hits` and
+        :attr:`fitness_cache_misses` count the evaluations that were and were
+        not found in the cache.
+
+        >>> ga = auxjad.GeneticAlgorithm(
+        ...     target=["A", "B", "C", "D", "E"],
+        ...     genes=["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"],
+        ...     keep_n_parents=5,
+        ...     fitness_cache_size=1000,
+        ... )
+        >>> for _ in range(10):
+        ...     ga()
+        >>> ga.fitness_cache_hits
+        785
+        >>> ga.fitness_cache_misses
+        215
+
+        Use :meth:`clear_fitness_cache` to empty the cache and reset both
+        counters.
+
+    :attr:`fitness_function`:
+        Instead of the built-in evaluation function, the population can be
+        scored by any callable set as :attr:`fitness_function`. It is called
+        once per generation with the whole population and the :attr:`target`,
+        and it must return a :obj:`list` with one score per individual. Higher
+        scores indicate fitter individuals. Since it receives all individuals
+        at once, its computation can be vectorised or parallelised. When
+        :attr:`fitness_cache_size` is set, only individuals missing from the
+        cache are passed to it.
+
+        >>> def count_matches(population, target):
+        ...     return [
+        ...         sum(gene == target_gene
+        ...             for gene, target_gene in zip(individual, target))
+        ...         / len(target)
+        ...         for individual in population
+        ...     ]
+        >>> ga = auxjad.GeneticAlgorithm(
+        ...     target=["A", "B", "C", "D", "E"],
+        ...     genes=["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"],
+        ...     fitness_function=count_matches,
+        ... )
+        >>> for _ in range(10):
+        ...     ga()
+        >>> ga.fittest_individual
+        ["A", "B", "C", "D", "E"]
+        >>> ga.fittest_individual_score
+        1.0
+
+    :meth:`run_until`:
+        Instead of calling the genetic algorithm a fixed number of times, use
+        :meth:`run_until` to iterate it up to a maximum number of generations,
+        stopping early when the score of the fittest individual reaches
+        ``target_score`` or when it has not improved for ``patience``
+        generations. It returns the number of generations run. The score of
+        the fittest individual and the mean score of each generation are
+        recorded in :attr:`best_score_history` and
+        :attr:`mean_score_history`.
+
+        >>> ga = auxjad.GeneticAlgorithm(
+        ...     target=["A", "B", "C", "D", "E"],
+        ...     genes=["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"],
+        ... )
+        >>> ga.run_until(100, target_score=1.0, patience=10)
+        11
+        >>> ga.fittest_individual
+        ["A", "B", "C", "D", "E"]
+        >>> ga.best_score_history
+        array('d', [0.44960000000000006, 0.648, 0.648, 0.68, 0.68, 0.68, 0.68,
+        0.68, 0.8400000000000001, 0.8400000000000001, 1.0])
+
     :meth:`reset`:
         Use the :meth:`reset` method to reset the genetic algorithm at any
         point:
@@ -211,9 +314,23 @@ class GeneticAlgorithm:
         "_mutation_index",
         "_evaluation_index",
         "_target_indices",
+        "_gene_indices",
+        "_evaluation_powers",
         "_scores",
         "_generation_number",
         "_population",
+        "_population_indices",
+        "_seed",
+        "_rng",
+        "_use_numpy",
+        "_numpy_rng",
+        "_fitness_cache",
+        "_fitness_cache_size",
+        "_fitness_cache_hits",
+        "_fitness_cache_misses",
+        "_fitness_function",
+        "_best_score_history",
+        "_mean_score_history",
     )
 
     # ---------- INITIALISER ----------
@@ -230,7 +347,17 @@ class GeneticAlgorithm:
         mutation_chance: float = 0.2,
         mutation_index: float = 0.1,
         evaluation_index: float = 0.2,
+        seed: int | random.Random | None = None,
+        use_numpy: bool = False,
+        fitness_cache_size: int | None = None,
+        fitness_function: Callable[[list, list], list] | None = None,
     ) -> None:
+        self.seed = seed
+        self._fitness_cache = OrderedDict()
+        self._fitness_cache_hits = 0
+        self._fitness_cache_misses = 0
+        self.fitness_cache_size = fitness_cache_size
+        self.fitness_function = fitness_function
         if not isinstance(genes, list):
             raise TypeError("'genes' must be 'list'")
         if not isinstance(target, list):
@@ -238,8 +365,9 @@ class GeneticAlgorithm:
         if any(value not in genes for value in target):
             raise ValueError("'target' must only contain elements present in 'genes'")
         self._genes = genes
+        self._index_genes()
         self._target = target
-        self._target_indices = [self._genes.index(gene) for gene in self._target]
+        self._target_indices = self._genes_to_indices(self._target)
         self.initial_individual = initial_individual
         self.population_size = population_size
         self.select_n_parents = select_n_parents
@@ -249,7 +377,11 @@ class GeneticAlgorithm:
         self.evaluation_index = evaluation_index
         self._generation_number = None
         self._population = None
+        self._population_indices = None
         self._scores = None
+        self._best_score_history = array("d")
+        self._mean_score_history = array("d")
+        self.use_numpy = use_numpy
 
     # ---------- SPECIAL METHODS ----------
 
@@ -270,6 +402,7 @@ class GeneticAlgorithm:
         self._generate_population()
         self._score_population()
         self._sort_population_by_evaluation()
+        self._record_score_history()
 
     def __next__(self) -> None:
         r"""Calls the genetic algorithm process for one iteration. Creates a
@@ -289,7 +422,57 @@ class GeneticAlgorithm:
         r"""Resets that genetic algorithm."""
         self._generation_number = None
         self._population = None
+        self._population_indices = None
+        self._numpy_rng = None
         self._scores = None
+        self._best_score_history = array("d")
+        self._mean_score_history = array("d")
+        self.clear_fitness_cache()
+
+    def run_until(
+        self,
+        max_generations: int,
+        *,
+        target_score: float | None = None,
+        patience: int | None = None,
+    ) -> int:
+        r"""Calls the genetic algorithm process for up to ``max_generations``
+        iterations, stopping early once the score of the fittest individual
+        reaches ``target_score`` or has not improved for ``patience``
+        consecutive generations. Returns the number of generations run.
+        """
+        if not isinstance(max_generations, int):
+            raise TypeError("first positional argument must be 'int'")
+        if max_generations <= 0:
+            raise ValueError("first positional argument must be a positive 'int'")
+        if target_score is not None and not isinstance(target_score, (int, float)):
+            raise TypeError("'target_score' must be 'float' or 'None'")
+        if patience is not None:
+            if not isinstance(patience, int):
+                raise TypeError("'patience' must be 'int' or 'None'")
+            if patience <= 0:
+                raise ValueError("'patience' must be a positive 'int'")
+        best_score = None
+        n_stale_generations = 0
+        for n_generations in range(1, max_generations + 1):
+            self.__call__()
+            score = self._scores[0]
+            if target_score is not None and score >= target_score:
+                break
+            if best_score is None or score > best_score:
+                best_score = score
+                n_stale_generations = 0
+            else:
+                n_stale_generations += 1
+                if patience is not None and n_stale_generations >= patience:
+                    break
+        return n_generations
+
+    def clear_fitness_cache(self) -> None:
+        r"""Empties the fitness cache and resets its hit and miss counters."""
+        self._fitness_cache.clear()
+        self._fitness_cache_hits = 0
+        self._fitness_cache_misses = 0
 
     # ---------- PRIVATE METHODS ----------
 
@@ -299,6 +482,8 @@ class GeneticAlgorithm:
         mutation processes and scores each individual using the evaluation
         function.
         """
+        if self._numpy_enabled and self._numpy_rng is None:
+            self._numpy_rng = np.random.default_rng(self._rng.getrandbits(64))
         if self._generation_number is None:
             self._generation_number = 0
             self._generate_initial_individual()
@@ -312,28 +497,39 @@ class GeneticAlgorithm:
         :attr:`population_size` and whose genes are randomly chosen from
         :attr:`genes`.
         """
-        self._population = []
+        if self._numpy_enabled:
+            self._generate_initial_individual_array()
+            return
+        n_genes = len(self._genes)
+        self._population_indices = []
         for _ in range(self._population_size):
             if self._initial_individual is None:
-                individual = [random.choice(self._genes) for _ in range(self.__len__())]
+                individual = [self._rng.randrange(n_genes) for _ in range(self.__len__())]
             else:
-                individual = self._initial_individual[:]
-            self._population.append(individual)
+                individual = self._genes_to_indices(self._initial_individual)
+            self._population_indices.append(individual)
+        self._population = None
+
+    def _record_score_history(self) -> None:
+        r"""Appends the best and the mean scores of the current generation to
+        the score history.
+        """
+        self._best_score_history.append(self._scores[0])
+        self._mean_score_history.append(sum(self._scores) / len(self._scores))
 
     def _evaluate(
         self,
-        individual: list,
+        individual: list[int],
     ) -> float:
-        r"""Evaluates all genes of a given individual, returning a
-        :obj:`float`. The higher the value, the fitter the individual is, with
-        ``1.0`` being a perfect fit. Use :attr:`evaluation_index` to tweak the
-        behaviour of this function.
+        r"""Evaluates all genes of a given individual (in index form),
+        returning a :obj:`float`. The higher the value, the fitter the
+        individual is, with ``1.0`` being a perfect fit. Use
+        :attr:`evaluation_index` to tweak the behaviour of this function.
         """
+        powers = self._evaluation_powers
         individual_score = 0
-        individual_indices = [self.genes.index(gene) for gene in individual]
-        for gene, target_gene in zip(individual_indices, self._target_indices):
-            difference = abs(gene - target_gene)
-            individual_score += self._evaluation_index**difference
+        for gene, target_gene in zip(individual, self._target_indices):
+            individual_score += powers[abs(gene - target_gene)]
         individual_score /= self.__len__()
         return individual_score
 
@@ -341,32 +537,112 @@ class GeneticAlgorithm:
         r"""Sorts the population (and their scores) according to the evaluation
         of its individuals.
         """
-        zipped_lists = list(zip(self._scores, self._population))
-        zipped_lists.sort(
-            key=lambda tuple_pair: tuple_pair[0],
-            reverse=True,
-        )
-        self._population = [gene for _, gene in zipped_lists]
-        self._scores = [score for score, _ in zipped_lists]
+        if self._numpy_enabled:
+            order = np.argsort(-np.asarray(self._scores), kind="stable")
+        else:
+            order = sorted(
+                range(len(self._scores)),
+                key=self._scores.__getitem__,
+                reverse=True,
+            )
+        self._reorder_population(order)
 
     def _score_population(self) -> None:
         r"""Generates the list of score for each individual of the current
         generation.
         """
-        self._scores = []
-        for individual in self._population:
+        if self._fitness_function is not None:
+            self._score_population_with_function()
+        elif self._numpy_enabled:
+            self._score_population_array()
+        elif self._fitness_cache_size is None:
+            self._scores = [self._evaluate(individual) for individual in self._population_indices]
+        else:
+            self._scores = [
+                self._evaluate_with_cache(individual) for individual in self._population_indices
+            ]
+
+    def _evaluate_with_cache(
+        self,
+        individual: list[int],
+    ) -> float:
+        r"""Evaluates an individual, looking up its score in the fitness cache
+        first. The least recently used entries are discarded when the cache is
+        full.
+        """
+        key = tuple(individual)
+        try:
+            score = self._fitness_cache[key]
+        except KeyError:
+            self._fitness_cache_misses += 1
             score = self._evaluate(individual)
-            self._scores.append(score)
+            self._fitness_cache[key] = score
+            if len(self._fitness_cache) > self._fitness_cache_size:
+                self._fitness_cache.popitem(last=False)
+        else:
+            self._fitness_cache_hits += 1
+            self._fitness_cache.move_to_end(key)
+        return score
+
+    def _score_population_with_function(self) -> None:
+        r"""Generates the list of scores of the current generation using
+        :attr:`fitness_function`. When the fitness cache is enabled, only the
+        individuals missing from the cache are passed to it, each of them only
+        once.
+        """
+        population = self.population
+        if self._fitness_cache_size is None:
+            self._scores = self._call_fitness_function(population)
+            return
+        population_indices = self._population_indices
+        if not isinstance(population_indices, list):
+            population_indices = population_indices.tolist()
+        keys = [tuple(individual) for individual in population_indices]
+        missing_individuals = {}
+        for key, individual in zip(keys, population):
+            if key not in self._fitness_cache and key not in missing_individuals:
+                missing_individuals[key] = individual
+        new_scores = {}
+        if missing_individuals:
+            scores = self._call_fitness_function(list(missing_individuals.values()))
+            new_scores = dict(zip(missing_individuals, scores))
+        self._scores = []
+        for key in keys:
+            if key in new_scores:
+                self._scores.append(new_scores[key])
+            else:
+                self._scores.append(self._fitness_cache[key])
+                self._fitness_cache.move_to_end(key)
+        self._fitness_cache_hits += len(keys) - len(new_scores)
+        self._fitness_cache_misses += len(new_scores)
+        self._fitness_cache.update(new_scores)
+        while len(self._fitness_cache) > self._fitness_cache_size:
+            self._fitness_cache.popitem(last=False)
+
+    def _call_fitness_function(
+        self,
+        population: list,
+    ) -> list:
+        r"""Calls :attr:`fitness_function` on a :obj:`list` of individuals and
+        checks that a score was returned for each of them.
+        """
+        scores = list(self._fitness_function(population, self._target))
+        if len(scores) != len(population):
+            raise ValueError("'fitness_function' must return one score per individual")
+        return scores
 
     def _crossover_population(self) -> None:
         r"""Crossover process used to generate offsprings."""
-        selected_parents = self._population[: self._select_n_parents]
+        if self._numpy_enabled:
+            self._crossover_population_array()
+            return
+        selected_parents = self._population_indices[: self._select_n_parents]
         if self._keep_n_parents > 0:
-            new_generation = self._population[: self._keep_n_parents]
+            new_generation = self._population_indices[: self._keep_n_parents]
         else:
             new_generation = []
         for _ in range(self._population_size - self._keep_n_parents):
-            parents = random.sample(
+            parents = self._rng.sample(
                 range(len(selected_parents)),
                 k=2,
             )
@@ -375,19 +651,167 @@ class GeneticAlgorithm:
             parent_B = selected_parents[parents[1]]
             individual = parent_A[:half_index] + parent_B[half_index:]
             new_generation.append(individual)
-        self._population = new_generation[:]
+        self._population_indices = new_generation[:]
+        self._population = None
 
     def _mutate_population(self) -> None:
         r"""Mutates some individuals of the current generation according to
         :attr:`mutation_chance` and :attr:`mutation_index`.
         """
-        for index, individual in enumerate(self._population):
-            if random.random() < self._mutation_chance:
+        if self._numpy_enabled:
+            self._mutate_population_array()
+            return
+        n_genes = len(self._genes)
+        for index, individual in enumerate(self._population_indices):
+            if self._rng.random() < self._mutation_chance:
                 mutated_individual = individual[:]
                 for i in range(self.__len__()):
-                    if random.random() < self._mutation_index:
-                        mutated_individual[i] = random.choice(self._genes)
-                self._population[index] = mutated_individual
+                    if self._rng.random() < self._mutation_index:
+                        mutated_individual[i] = self._rng.randrange(n_genes)
+                self._population_indices[index] = mutated_individual
+        self._population = None
+
+    def _replace_population(
+        self,
+        population_indices: list[list[int]],
+        scores: list,
+    ) -> None:
+        r"""Replaces the current population (in index form) and its scores."""
+        if self._numpy_enabled:
+            self._population_indices = np.asarray(population_indices)
+        else:
+            self._population_indices = [individual[:] for individual in population_indices]
+        self._scores = scores[:]
+        self._population = None
+
+    def _list_population_indices(self) -> list[list[int]]:
+        r"""Returns a copy of the current population in index form as a
+        :obj:`list` of :obj:`list`'s.
+        """
+        if isinstance(self._population_indices, list):
+            return [individual[:] for individual in self._population_indices]
+        return self._population_indices.tolist()
+
+    def _reorder_population(
+        self,
+        order: list[int],
+    ) -> None:
+        r"""Reorders the population (and their scores) according to a
+        :obj:`list` of indices.
+        """
+        if self._numpy_enabled:
+            self._population_indices = self._population_indices[order]
+        else:
+            self._population_indices = [self._population_indices[index] for index in order]
+        self._scores = [self._scores[index] for index in order]
+        self._population = None
+
+    def _sort_individuals(self) -> None:
+        r"""Sorts the genes of each individual of the current generation."""
+        if not self._numpy_enabled:
+            for individual in self._population_indices:
+                individual.sort(key=self._genes.__getitem__)
+            self._population = None
+            return
+        sorted_indices = sorted(range(len(self._genes)), key=self._genes.__getitem__)
+        ranks = np.empty(len(sorted_indices), dtype=np.intp)
+        ranks[sorted_indices] = np.arange(len(sorted_indices))
+        sorted_ranks = np.sort(ranks[self._population_indices], axis=1)
+        self._population_indices = np.asarray(sorted_indices)[sorted_ranks]
+        self._population = None
+
+    def _index_genes(self) -> None:
+        r"""Creates the lookup table from genes to their indices. Unhashable
+        genes are looked up in :attr:`genes` instead.
+        """
+        try:
+            self._gene_indices = {}
+            for index, gene in enumerate(self._genes):
+                self._gene_indices.setdefault(gene, index)
+        except TypeError:
+            self._gene_indices = None
+
+    def _update_evaluation_powers(self) -> None:
+        r"""Precomputes the evaluation of every possible index difference."""
+        self._evaluation_powers = [
+            self._evaluation_index**difference for difference in range(len(self._genes))
+        ]
+
+    def _genes_to_indices(
+        self,
+        individual: list,
+    ) -> list[int]:
+        r"""Converts an individual from gene values into gene indices."""
+        if self._gene_indices is None:
+            return [self._genes.index(gene) for gene in individual]
+        try:
+            return [self._gene_indices[gene] for gene in individual]
+        except KeyError as err:
+            raise ValueError("individuals must only contain elements present in 'genes'") from err
+
+    def _indices_to_genes(
+        self,
+        individual: list[int],
+    ) -> list:
+        r"""Converts an individual from gene indices into gene values."""
+        return [self._genes[index] for index in individual]
+
+    def _generate_initial_individual_array(self) -> None:
+        r"""Generates the initial population as a matrix of gene indices."""
+        if self._initial_individual is None:
+            self._population_indices = self._numpy_rng.integers(
+                0,
+                len(self._genes),
+                size=(self._population_size, self.__len__()),
+            )
+        else:
+            initial_indices = self._genes_to_indices(self._initial_individual)
+            self._population_indices = np.tile(initial_indices, (self._population_size, 1))
+        self._population = None
+
+    def _score_population_array(self) -> None:
+        r"""Scores all individuals of the current generation at once."""
+        powers = np.asarray(self._evaluation_powers)
+        differences = np.abs(self._population_indices - np.asarray(self._target_indices))
+        self._scores = (powers[differences].sum(axis=1) / self.__len__()).tolist()
+
+    def _crossover_population_array(self) -> None:
+        r"""Crossover process used to generate offsprings, operating on all of
+        them at once.
+        """
+        n_offsprings = self._population_size - self._keep_n_parents
+        selected_parents = self._population_indices[: self._select_n_parents]
+        parents_A = self._numpy_rng.integers(0, len(selected_parents), size=n_offsprings)
+        parents_B = self._numpy_rng.integers(0, len(selected_parents) - 1, size=n_offsprings)
+        parents_B += parents_B >= parents_A
+        half_index = int(self.__len__() / 2)
+        offsprings = np.concatenate(
+            (
+                selected_parents[parents_A, :half_index],
+                selected_parents[parents_B, half_index:],
+            ),
+            axis=1,
+        )
+        self._population_indices = np.concatenate(
+            (self._population_indices[: self._keep_n_parents], offsprings),
+        )
+        self._population = None
+
+    def _mutate_population_array(self) -> None:
+        r"""Mutates some individuals of the current generation according to
+        :attr:`mutation_chance` and :attr:`mutation_index`, operating on all of
+        them at once.
+        """
+        n_individuals, n_genes = self._population_indices.shape
+        mutated_individuals = self._numpy_rng.random(n_individuals) < self._mutation_chance
+        mutated_genes = self._numpy_rng.random((n_individuals, n_genes)) < self._mutation_index
+        mutated_genes &= mutated_individuals[:, np.newaxis]
+        self._population_indices[mutated_genes] = self._numpy_rng.integers(
+            0,
+            len(self._genes),
+            size=np.count_nonzero(mutated_genes),
+        )
+        self._population = None
 
     # ---------- PUBLIC PROPERTIES ----------
 
@@ -406,7 +830,8 @@ class GeneticAlgorithm:
         if any(value not in self._genes for value in target):
             raise ValueError("'target' must only contain elements present in 'genes'")
         self._target = target
-        self._target_indices = [self._genes.index(gene) for gene in self._target]
+        self._target_indices = self._genes_to_indices(self._target)
+        self._fitness_cache.clear()
 
     @property
     def genes(self) -> list:
@@ -420,8 +845,19 @@ class GeneticAlgorithm:
     ) -> None:
         if not isinstance(genes, list):
             raise TypeError("'genes' must be 'list'")
+        population = self.population
         self._genes = genes
-        self._target_indices = [self._genes.index(gene) for gene in self._target]
+        self._index_genes()
+        self._update_evaluation_powers()
+        self._target_indices = self._genes_to_indices(self._target)
+        self._fitness_cache.clear()
+        if population is not None:
+            self._population_indices = [
+                self._genes_to_indices(individual) for individual in population
+            ]
+            if self._numpy_enabled:
+                self._population_indices = np.asarray(self._population_indices)
+            self._population = None
 
     @property
     def initial_individual(self) -> list | None:
@@ -578,6 +1014,8 @@ class GeneticAlgorithm:
         elif evaluation_index >= 1.0:
             raise ValueError("'evaluation_index' must be less than 1.0")
         self._evaluation_index = evaluation_index
+        self._update_evaluation_powers()
+        self._fitness_cache.clear()
 
     @property
     def generation_number(self) -> int | None:
@@ -591,6 +1029,13 @@ class GeneticAlgorithm:
         r"""Read-only property, returns a list with all the population of the
         current generation.
         """
+        if self._population is None and self._population_indices is not None:
+            population_indices = self._population_indices
+            if not isinstance(population_indices, list):
+                population_indices = population_indices.tolist()
+            self._population = [
+                self._indices_to_genes(individual) for individual in population_indices
+            ]
         return self._population
 
     @property
@@ -605,10 +1050,14 @@ class GeneticAlgorithm:
         r"""Read-only property, returns the fittest individual of the current
         population.
         """
-        try:
+        if self._population is not None:
             return self._population[0]
-        except TypeError:
+        if self._population_indices is None:
             return None
+        fittest_individual = self._population_indices[0]
+        if not isinstance(fittest_individual, list):
+            fittest_individual = fittest_individual.tolist()
+        return self._indices_to_genes(fittest_individual)
 
     @property
     def fittest_individual_score(self) -> list | float:
@@ -619,3 +1068,131 @@ class GeneticAlgorithm:
             return self._scores[0]
         except TypeError:
             return None
+
+    @property
+    def seed(self) -> int | random.Random | None:
+        r"""Seed of the random number generator which creates, selects, crosses
+        over, and mutates the individuals of the population. Takes an
+        :obj:`int`, an instance of :class:`random.Random`, or ``None``
+        (default) for the global :mod:`random` module.
+        """
+        return self._seed
+
+    @seed.setter
+    def seed(
+        self,
+        seed: int | random.Random | None,
+    ) -> None:
+        self._rng = _make_rng(seed)
+        self._seed = seed
+        self._numpy_rng = None
+
+    @property
+    def use_numpy(self) -> bool:
+        r"""If ``True``, the population is stored as a matrix of gene indices
+        and scoring, crossover, and mutation are performed as vectorised NumPy
+        operations. NumPy is an optional dependency, which can be installed
+        with ``pip install auxjad[numpy]``; when it is not installed, the pure
+        Python implementation is used instead. Default is ``False``.
+        """
+        return self._use_numpy
+
+    @use_numpy.setter
+    def use_numpy(
+        self,
+        use_numpy: bool,
+    ) -> None:
+        if not isinstance(use_numpy, bool):
+            raise TypeError("'use_numpy' must be 'bool'")
+        self._use_numpy = use_numpy
+        if self._population_indices is None:
+            return
+        if self._numpy_enabled:
+            self._population_indices = np.asarray(self._population_indices)
+        elif not isinstance(self._population_indices, list):
+            self._population_indices = self._population_indices.tolist()
+
+    @property
+    def fitness_cache_size(self) -> int | None:
+        r"""Maximum number of scores kept in the fitness cache. When set to an
+        :obj:`int`, the scores of evaluated individuals are cached and repeated
+        individuals (such as parents kept by :attr:`keep_n_parents`) are not
+        evaluated again; once the cache is full, the least recently used
+        scores are discarded. Default is ``None``, which disables the cache.
+        Unless a :attr:`fitness_function` is set, the cache is not used by
+        the NumPy implementation (see :attr:`use_numpy`), which scores the
+        whole population at once.
+        """
+        return self._fitness_cache_size
+
+    @fitness_cache_size.setter
+    def fitness_cache_size(
+        self,
+        fitness_cache_size: int | None,
+    ) -> None:
+        if fitness_cache_size is not None:
+            if not isinstance(fitness_cache_size, int):
+                raise TypeError("'fitness_cache_size' must be 'int' or 'None'")
+            if fitness_cache_size < 1:
+                raise ValueError("'fitness_cache_size' must be greater than zero")
+            while len(self._fitness_cache) > fitness_cache_size:
+                self._fitness_cache.popitem(last=False)
+        else:
+            self._fitness_cache.clear()
+        self._fitness_cache_size = fitness_cache_size
+
+    @property
+    def best_score_history(self) -> array:
+        r"""Read-only property, returns an :obj:`array.array` with the score of
+        the fittest individual of each generation.
+        """
+        return self._best_score_history
+
+    @property
+    def mean_score_history(self) -> array:
+        r"""Read-only property, returns an :obj:`array.array` with the mean
+        score of the population of each generation.
+        """
+        return self._mean_score_history
+
+    @property
+    def fitness_function(self) -> Callable[[list, list], list] | None:
+        r"""Optional callable used to score the population instead of the
+        built-in evaluation function. It is called once per generation with
+        the whole population (a :obj:`list` of individuals) and
+        :attr:`target`, and must return a :obj:`list` with one score per
+        individual, with higher scores given to fitter individuals. Default is
+        ``None``.
+        """
+        return self._fitness_function
+
+    @fitness_function.setter
+    def fitness_function(
+        self,
+        fitness_function: Callable[[list, list], list] | None,
+    ) -> None:
+        if fitness_function is not None and not callable(fitness_function):
+            raise TypeError("'fitness_function' must be callable or 'None'")
+        self._fitness_function = fitness_function
+        self._fitness_cache.clear()
+
+    @property
+    def fitness_cache_hits(self) -> int:
+        r"""Read-only property, returns the number of evaluations that were
+        found in the fitness cache.
+        """
+        return self._fitness_cache_hits
+
+    @property
+    def fitness_cache_misses(self) -> int:
+        r"""Read-only property, returns the number of evaluations that were not
+        found in the fitness cache.
+        """
+        return self._fitness_cache_misses
+
+    # ---------- PRIVATE PROPERTIES ----------
+
+    @property
+    def _numpy_enabled(self) -> bool:
+        r""":obj:`bool` indicating whether the NumPy implementation is used."""
+        return self._use_numpy and np is not None
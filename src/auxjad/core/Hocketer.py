@@ -3,6 +3,7 @@ import random
 import abjad
 
 from .. import get, mutate
+from ._make_rng import _make_rng
 
 
 class Hocketer:
@@ -1359,6 +1360,8 @@ class Hocketer:
         "_fuse_across_groups_of_beats",
         "_fuse_quadruple_meter",
         "_fuse_triple_meter",
+        "_seed",
+        "_rng",
     )
 
     # ---------- INITIALISER ----------
@@ -1384,7 +1387,9 @@ class Hocketer:
         fuse_across_groups_of_beats: bool = True,
         fuse_quadruple_meter: bool = True,
         fuse_triple_meter: bool = True,
+        seed: int | random.Random | None = None,
     ) -> None:
+        self.seed = seed
         self.contents = contents
         self._voices = None
         self._n_voices = n_voices
@@ -1549,7 +1554,7 @@ class Hocketer:
                             sample_k = self._n_voices
                         else:
                             sample_k = len(pitches)
-                        voices = random.sample(
+                        voices = self._rng.sample(
                             list(range(self._n_voices)),
                             k=sample_k,
                         )
@@ -1572,7 +1577,7 @@ class Hocketer:
                     pitch = self._get_pitch_from_logical_tie(logical_tie)
                     counter = 0
                     while True:
-                        voices = random.choices(
+                        voices = self._rng.choices(
                             list(range(self._n_voices)),
                             weights=self._weights,
                             k=self._k,
@@ -1594,7 +1599,7 @@ class Hocketer:
                 counter = 0
                 voices = []
                 while len(voices) < self._k:
-                    voice = random.choices(
+                    voice = self._rng.choices(
                         list(range(self._n_voices)),
                         weights=self._weights,
                     )[0]
@@ -1995,3 +2000,20 @@ class Hocketer:
             return tuple(output[:])
         else:
             return self._voices
+
+    @property
+    def seed(self) -> int | random.Random | None:
+        r"""Seed of the random number generator which distributes the notes
+        among the voices. Takes an :obj:`int`, an instance of
+        :class:`random.Random`, or ``None`` (default) for the global
+        :mod:`random` module.
+        """
+        return self._seed
+
+    @seed.setter
+    def seed(
+        self,
+        seed: int | random.Random | None,
+    ) -> None:
+        self._rng = _make_rng(seed)
+        self._seed = seed
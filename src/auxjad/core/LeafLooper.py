@@ -1,3 +1,5 @@
+import random
+
 import abjad
 
 from .. import mutate
@@ -1137,6 +1139,7 @@ class LeafLooper(_LooperParent):
         after_rest: int | float | str | tuple[int] | abjad.Duration | abjad.Rest = 0,
         after_rest_in_new_measure: bool = False,
         use_multimeasure_rests: bool = True,
+        seed: int | random.Random | None = None,
     ) -> None:
         self.contents = contents
         self.end_with_max_n_leaves = end_with_max_n_leaves
@@ -1161,6 +1164,7 @@ class LeafLooper(_LooperParent):
             repetition_chance=repetition_chance,
             forward_bias=forward_bias,
             process_on_first_call=process_on_first_call,
+            seed=seed,
         )
 
     # ---------- SPECIAL METHODS ----------
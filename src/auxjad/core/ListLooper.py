@@ -1,5 +1,6 @@
 import copy
-from typing import Any
+import random
+from typing import Any, Iterator
 
 from ._LooperParent import _LooperParent
 
@@ -391,6 +392,7 @@ class ListLooper(_LooperParent):
         head_position: int = 0,
         end_with_max_n_elements: bool = False,
         process_on_first_call: bool = False,
+        seed: int | random.Random | None = None,
     ) -> None:
         self.contents = contents
         self.end_with_max_n_elements = end_with_max_n_elements
@@ -402,6 +404,7 @@ class ListLooper(_LooperParent):
             repetition_chance=repetition_chance,
             forward_bias=forward_bias,
             process_on_first_call=process_on_first_call,
+            seed=seed,
         )
 
     # ---------- SPECIAL METHODS ----------
@@ -443,6 +446,40 @@ class ListLooper(_LooperParent):
             dummy_container.extend(self.__call__())
         return dummy_container[:]
 
+    def iter_output(
+        self,
+        n: int | None = None,
+        *,
+        chunk_size: int = 1,
+    ) -> Iterator[list[Any]]:
+        r"""Goes through the whole looping process (or through ``n``
+        iterations of it) and yields one :obj:`list` for every ``chunk_size``
+        windows. This method replaces the parent's one since the parent's
+        method yields |abjad.Selection|'s.
+        """
+        if n is not None:
+            if not isinstance(n, int):
+                raise TypeError("first positional argument must be 'int'")
+            if n <= 0:
+                raise ValueError("first positional argument must be a positive 'int'")
+        if not isinstance(chunk_size, int):
+            raise TypeError("'chunk_size' must be 'int'")
+        if chunk_size < 1:
+            raise ValueError("'chunk_size' must be greater than zero")
+        dummy_container = []
+        count = 0
+        while n is None or count < n:
+            try:
+                dummy_container.extend(self.__call__())
+            except StopIteration:
+                break
+            count += 1
+            if count % chunk_size == 0:
+                yield dummy_container
+                dummy_container = []
+        if len(dummy_container) > 0:
+            yield dummy_container
+
     # ---------- PRIVATE METHODS ----------
 
     def _slice_contents(self) -> None:
@@ -4,6 +4,8 @@ from typing import Iterator
 import abjad
 
 from .. import get, mutate
+from ._OnsetIndex import _OnsetIndex
+from ._make_rng import _make_rng
 
 
 class Phaser:
@@ -1251,6 +1253,7 @@ class Phaser:
         "_current_window",
         "_is_first_window",
         "_contents_length",
+        "_onset_index",
         "_omit_time_signatures",
         "_boundary_depth",
         "_maximum_dot_count",
@@ -1261,6 +1264,8 @@ class Phaser:
         "_fuse_across_groups_of_beats",
         "_fuse_quadruple_meter",
         "_fuse_triple_meter",
+        "_seed",
+        "_rng",
     )
 
     # ---------- INITIALISER ----------
@@ -1283,7 +1288,9 @@ class Phaser:
         fuse_across_groups_of_beats: bool = True,
         fuse_quadruple_meter: bool = True,
         fuse_triple_meter: bool = True,
+        seed: int | random.Random | None = None,
     ) -> None:
+        self.seed = seed
         self.contents = contents
         self._pivot_point = abjad.Duration(0)
         self.step_size = step_size
@@ -1410,7 +1417,7 @@ class Phaser:
         r"""Moves the pivot point by a certain number of steps of fixed size,
         either forwards or backwards according to the forward bias.
         """
-        step = self._step_size * random.randint(1, self._max_steps)
+        step = self._step_size * self._rng.randint(1, self._max_steps)
         diretion = self._biased_choice(self._forward_bias)
         self._pivot_point += step * diretion
 
@@ -1445,13 +1452,19 @@ class Phaser:
         """
         dummy_container = abjad.mutate.copy(self._contents)
         pivot = self._pivot_point % self._contents_length
-        # splitting leaves at both slicing points
         if pivot > abjad.Duration(0):
-            abjad.mutate.split(dummy_container[:], [pivot])
-            # finding start and end indeces for the window
-            for start in range(len(dummy_container)):
-                if abjad.get.duration(dummy_container[: start + 1]) > pivot:
-                    break
+            # splitting the component sounding at the pivot point
+            start = self._onset_index.index(pivot)
+            offset = self._onset_index[start]
+            if offset < pivot:
+                abjad.mutate.split(
+                    dummy_container[start : start + 1],
+                    [pivot - offset],
+                )
+            # finding the start index of the window
+            while offset < pivot:
+                offset += abjad.get.duration(dummy_container[start])
+                start += 1
             last_leaf = dummy_container[:start].leaf(-1)
             # copying indicators to both leaves
             indicators_tuple = (
@@ -1505,13 +1518,13 @@ class Phaser:
         ):
             abjad.attach(abjad.Tie(), last_leaf)
 
-    @staticmethod
     def _biased_choice(
+        self,
         forward_bias: float,
     ) -> None:
         r"""Returns either +1 or -1 according to a forward bias value."""
         weights = [forward_bias, 1.0 - forward_bias]
-        return random.choices([1, -1], weights=weights)[0]
+        return self._rng.choices([1, -1], weights=weights)[0]
 
     @staticmethod
     def _remove_all_time_signatures(
@@ -1546,6 +1559,7 @@ class Phaser:
         self._current_window = dummy_container[:]
         dummy_container[:] = []
         self._contents_length = abjad.get.duration(self._contents[:])
+        self._onset_index = _OnsetIndex(self._contents)
         self._pivot_point = abjad.Duration(0)
         self._is_first_window = True
 
@@ -1791,6 +1805,23 @@ class Phaser:
             raise TypeError("'process_on_first_call' must be 'bool'")
         self._process_on_first_call = process_on_first_call
 
+    @property
+    def seed(self) -> int | random.Random | None:
+        r"""Seed of the random number generator which sets the number of steps
+        and their direction. Takes an :obj:`int`, an instance of
+        :class:`random.Random`, or ``None`` (default) for the global
+        :mod:`random` module.
+        """
+        return self._seed
+
+    @seed.setter
+    def seed(
+        self,
+        seed: int | random.Random | None,
+    ) -> None:
+        self._rng = _make_rng(seed)
+        self._seed = seed
+
     # ---------- PRIVATE PROPERTIES ----------
 
     @property
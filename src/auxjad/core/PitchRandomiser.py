@@ -5,6 +5,7 @@ import abjad
 
 from .. import mutate
 from .TenneySelector import TenneySelector
+from ._make_rng import _make_rng
 
 
 class PitchRandomiser:
@@ -667,6 +668,8 @@ class PitchRandomiser:
         "_tenney_selector",
         "_current_window",
         "_is_first_window",
+        "_seed",
+        "_rng",
     )
 
     # ---------- INITIALISER ----------
@@ -685,7 +688,9 @@ class PitchRandomiser:
         omit_time_signatures: bool = False,
         process_on_first_call: bool = True,
         use_tenney_selector: bool = False,
+        seed: int | random.Random | None = None,
     ) -> None:
+        self.seed = seed
         self.contents = contents
         self._weights = []
         self.pitches = pitches
@@ -782,7 +787,7 @@ class PitchRandomiser:
         :class:`auxjad.TenneySelector`.
         """
         if not self._use_tenney_selector:
-            return random.choices(
+            return self._rng.choices(
                 self._pitches,
                 weights=self._weights,
             )[0]
@@ -845,7 +850,10 @@ class PitchRandomiser:
         else:
             self._pitches = pitches
         pitch_list = [pitch for pitch in self._pitches]
-        self._tenney_selector = TenneySelector(pitch_list)
+        self._tenney_selector = TenneySelector(
+            pitch_list,
+            seed=None if self._seed is None else self._rng,
+        )
         if self._weights is not None:
             if len(pitch_list) != len(self._weights):
                 self.weights = None
@@ -926,3 +934,23 @@ class PitchRandomiser:
         if self._omit_time_signatures:
             self._remove_all_time_signatures(current_window)
         return current_window
+
+    @property
+    def seed(self) -> int | random.Random | None:
+        r"""Seed of the random number generator which picks the new pitches
+        (also used by the :class:`auxjad.TenneySelector` when
+        :attr:`use_tenney_selector` is ``True``). Takes an :obj:`int`, an
+        instance of :class:`random.Random`, or ``None`` (default) for the
+        global :mod:`random` module.
+        """
+        return self._seed
+
+    @seed.setter
+    def seed(
+        self,
+        seed: int | random.Random | None,
+    ) -> None:
+        self._rng = _make_rng(seed)
+        self._seed = seed
+        if hasattr(self, "_tenney_selector"):
+            self._tenney_selector.seed = None if seed is None else self._rng
@@ -4,6 +4,7 @@ from typing import Any, Iterator
 import abjad
 
 from .. import get, mutate, select
+from ._make_rng import _make_rng
 
 
 class Shuffler:
@@ -1070,6 +1071,8 @@ class Shuffler:
         "_fuse_quadruple_meter",
         "_fuse_triple_meter",
         "_swap_limit",
+        "_seed",
+        "_rng",
     )
 
     # ---------- INITIALISER ----------
@@ -1092,7 +1095,9 @@ class Shuffler:
         fuse_quadruple_meter: bool = True,
         fuse_triple_meter: bool = True,
         swap_limit: int | None = None,
+        seed: int | random.Random | None = None,
     ) -> None:
+        self.seed = seed
         self.contents = contents
         self.pitch_only = pitch_only
         self.preserve_rest_position = preserve_rest_position
@@ -1278,11 +1283,11 @@ class Shuffler:
     ) -> None:
         r"""Random shuffles a :obj:`list`."""
         if self._swap_limit is None:
-            random.shuffle(input_list)
+            self._rng.shuffle(input_list)
         else:
             for _ in range(self._swap_limit):
                 if len(input_list) > 1:
-                    i, j = random.sample(range(len(input_list)), 2)
+                    i, j = self._rng.sample(range(len(input_list)), 2)
                     input_list[i], input_list[j] = input_list[j], input_list[i]
 
     def _replace_list_preserving_rests(
@@ -1786,3 +1791,19 @@ class Shuffler:
         if self._omit_time_signatures:
             self._remove_all_time_signatures(current_window)
         return current_window
+
+    @property
+    def seed(self) -> int | random.Random | None:
+        r"""Seed of the random number generator which shuffles the logical ties
+        or pitches. Takes an :obj:`int`, an instance of :class:`random.Random`,
+        or ``None`` (default) for the global :mod:`random` module.
+        """
+        return self._seed
+
+    @seed.setter
+    def seed(
+        self,
+        seed: int | random.Random | None,
+    ) -> None:
+        self._rng = _make_rng(seed)
+        self._seed = seed
@@ -1,6 +1,11 @@
 import random
+from bisect import bisect_right
+from math import isfinite
 from typing import Any
 
+from ._FenwickTree import _FenwickTree
+from ._make_rng import _make_rng
+
 
 class TenneySelector:
     r"""An implementation of the Dissonant Counterpoint Algorithm by James
@@ -114,6 +119,11 @@ class TenneySelector:
         selected one which will be set to ``0.0``; this will result in a
         uniformly random selection without repetition.
 
+        With the default linear :attr:`curvature`, each call takes logarithmic
+        time on the length of :attr:`contents`, since only the weight of the
+        previously selected element needs to be updated in the cumulative
+        weights used for drawing; other curvatures take linear time.
+
         With linear curvature (default value of ``1.0``):
 
         >>> selector = auxjad.TenneySelector(["A", "B", "C", "D", "E", "F"])
@@ -273,6 +283,18 @@ class TenneySelector:
         >>> selector.weights
         [1.0, 1.0, 1.0, 1.0, 1.0, 1.0]
 
+    :meth:`draw`:
+        Use :meth:`draw` to select ``k`` elements at once. The output is the
+        same as calling the selector ``k`` times, but no intermediate
+        probability lists are created between draws.
+
+        >>> selector = auxjad.TenneySelector(["A", "B", "C", "D", "E", "F"])
+        >>> result = selector.draw(1000)
+        >>> len(result)
+        1000
+        >>> selector.previous_result == result[-1]
+        True
+
     :meth:`reset_probabilities`:
         To reset the probability distribution of all elements to its initial
         value (an uniform distribution), use the method
@@ -362,9 +384,14 @@ class TenneySelector:
         "_contents",
         "_weights",
         "_curvature",
-        "_counter",
+        "_step",
+        "_selection_steps",
         "_previous_index",
         "_probabilities",
+        "_weight_tree",
+        "_weighted_step_tree",
+        "_seed",
+        "_rng",
     )
 
     # ---------- INITIALISER ----------
@@ -375,7 +402,9 @@ class TenneySelector:
         *,
         weights: list | None = None,
         curvature: float = 1.0,
+        seed: int | random.Random | None = None,
     ) -> None:
+        self.seed = seed
         if not isinstance(contents, list):
             raise TypeError("'contents' must be 'list'")
         if weights is not None:
@@ -390,16 +419,15 @@ class TenneySelector:
         if curvature < 0.0:
             raise ValueError("'curvature' must be larger than 0.0")
         # initialising using attributes, not properties, due to cyclic
-        # dependencies, as self._generate_probabilities() is called when setting
-        # each of the attributes below
+        # dependencies, as self._reset_counter() is called when setting each of
+        # the attributes below
         self._contents = contents[:]
         if weights is not None:
             self._weights = weights[:]
         else:
             self._weights = [1.0 for _ in range(self.__len__())]
         self._curvature = curvature
-        self._counter = [1 for _ in range(self.__len__())]
-        self._generate_probabilities()
+        self._reset_counter()
         self._previous_index = None
 
     # ---------- SPECIAL METHODS ----------
@@ -416,12 +444,8 @@ class TenneySelector:
         r"""Calls the selection process and outputs one element of
         :attr:`contents`.
         """
-        self._previous_index = random.choices(
-            [n for n in range(self.__len__())],
-            weights=self._probabilities,
-        )[0]
+        self._previous_index = self._choose_index()
         self._regenerate_counts()
-        self._generate_probabilities()
         return self._contents[self._previous_index]
 
     def __next__(self) -> Any:
@@ -461,46 +485,141 @@ class TenneySelector:
         """
         del self._contents[key]
         del self._weights[key]
-        del self._probabilities[key]
-        del self._counter[key]
+        del self._selection_steps[key]
+        self._clear_probabilities()
 
     # ---------- PUBLIC METHODS ----------
 
+    def draw(
+        self,
+        k: int,
+    ) -> list[Any]:
+        r"""Calls the selection process ``k`` times and outputs a :obj:`list`
+        with the selected elements of :attr:`contents`. The result is the same
+        as calling the selector ``k`` times.
+        """
+        if not isinstance(k, int):
+            raise TypeError("first positional argument must be 'int'")
+        if k <= 0:
+            raise ValueError("first positional argument must be a positive 'int'")
+        cumulative_probabilities = None
+        if self._curvature != 1.0:
+            cumulative_probabilities = [0.0] * self.__len__()
+        results = []
+        for _ in range(k):
+            self._previous_index = self._choose_index(cumulative_probabilities)
+            self._regenerate_counts()
+            results.append(self._contents[self._previous_index])
+        return results
+
     def reset_probabilities(self) -> None:
         r"""Resets the probability distribution of all elements to an uniform
         distribution.
         """
-        self._counter = [1 for _ in range(self.__len__())]
-        self._generate_probabilities()
+        self._reset_counter()
 
     # ---------- PRIVATE METHODS ----------
 
+    def _reset_counter(self) -> None:
+        r"""Sets the count of all elements to one. Counts are stored as the
+        iteration at which each element was last selected, so that the count
+        of an element is the difference between the current iteration and
+        that value.
+        """
+        self._step = 0
+        self._selection_steps = [-1 for _ in range(self.__len__())]
+        self._clear_probabilities()
+
+    def _clear_probabilities(self) -> None:
+        r"""Discards the probabilities and the cumulative weights, which are
+        regenerated when needed.
+        """
+        self._probabilities = None
+        self._weight_tree = None
+        self._weighted_step_tree = None
+
     def _regenerate_counts(self) -> None:
         r"""Increases the count of all elements except for the previously
-        selected one, whose count is reset to zero.
+        selected one, whose count is reset to zero. Only the previously
+        selected element is updated in the cumulative weights.
         """
-        for i in range(self.__len__()):
-            if i == self._previous_index:
-                self._counter[i] = 0
-            else:
-                self._counter[i] += 1
-
-    def _generate_probabilities(
-        self,
-        *,
-        reset: bool = False,
-    ) -> None:
+        self._step += 1
+        previous_step = self._selection_steps[self._previous_index]
+        self._selection_steps[self._previous_index] = self._step
+        self._probabilities = None
+        if self._weighted_step_tree is not None:
+            self._weighted_step_tree.add(
+                self._previous_index,
+                self._weights[self._previous_index] * (self._step - previous_step),
+            )
+
+    def _generate_probabilities(self) -> None:
         r"""Generates the probabilities given the weights of the elements as
         well as their count numbers (which are fed into the growth function).
         """
-        if not isinstance(reset, bool):
-            raise TypeError("'reset' must be 'bool")
-        if reset:
-            self._counter = [1 for _ in range(self.__len__())]
         self._probabilities = []
-        for weight, count in zip(self._weights, self._counter):
+        for weight, selection_step in zip(self._weights, self._selection_steps):
+            count = self._step - selection_step
             self._probabilities.append(weight * self._growth_function(count))
 
+    def _choose_index(
+        self,
+        cumulative_probabilities: list[float] | None = None,
+    ) -> int:
+        r"""Selects an index according to the current probabilities, drawing
+        the same single random number as :func:`random.choices`. With
+        non-linear growth, the cumulative probabilities are written into
+        ``cumulative_probabilities`` if it is given, so that repeated draws do
+        not allocate new lists.
+        """
+        if self._curvature == 1.0:
+            return self._linear_growth_choice()
+        if cumulative_probabilities is None:
+            cumulative_probabilities = [0.0] * self.__len__()
+        total = 0.0
+        step = self._step
+        curvature = self._curvature
+        for index, (weight, selection_step) in enumerate(zip(self._weights, self._selection_steps)):
+            total += weight * (step - selection_step) ** curvature
+            cumulative_probabilities[index] = total
+        if not total > 0.0 or not isfinite(total):
+            # let random.choices() raise its usual exception
+            return self._rng.choices(range(self.__len__()), weights=self.probabilities)[0]
+        return bisect_right(
+            cumulative_probabilities,
+            self._rng.random() * total,
+            0,
+            self.__len__() - 1,
+        )
+
+    def _linear_growth_choice(self) -> int:
+        r"""Selects an index when the growth function is linear. The
+        probability of an element is then its weight multiplied by the
+        current iteration minus its weight multiplied by the iteration at
+        which it was last selected, so the cumulative probabilities are given
+        by two trees of cumulative sums which are searched together. The
+        same single random number as in :func:`random.choices` is drawn.
+        """
+        if self._weight_tree is None:
+            self._weight_tree = _FenwickTree(self._weights)
+            self._weighted_step_tree = _FenwickTree(
+                [
+                    weight * selection_step
+                    for weight, selection_step in zip(self._weights, self._selection_steps)
+                ]
+            )
+        step = self._step
+        weight_tree = self._weight_tree
+        weighted_step_tree = self._weighted_step_tree
+        total = step * weight_tree.total() - weighted_step_tree.total() + 0.0
+        if not total > 0.0:
+            # let random.choices() raise its usual exception
+            return self._rng.choices(range(self.__len__()), weights=self.probabilities)[0]
+        return weight_tree.search_nodes(
+            self._rng.random() * total,
+            lambda node: step * weight_tree.node(node) - weighted_step_tree.node(node),
+        )
+
     def _growth_function(
         self,
         count: int,
@@ -524,7 +643,7 @@ class TenneySelector:
             raise TypeError("'contents' must be 'list")
         self._contents = contents[:]
         self._weights = [1.0 for _ in range(self.__len__())]
-        self._generate_probabilities(reset=True)
+        self._reset_counter()
 
     @property
     def weights(self) -> list[float | int]:
@@ -550,7 +669,7 @@ class TenneySelector:
             self._weights = weights[:]
         else:
             self._weights = [1.0 for _ in range(self.__len__())]
-        self._generate_probabilities(reset=True)
+        self._reset_counter()
 
     @property
     def curvature(self) -> float:
@@ -567,7 +686,7 @@ class TenneySelector:
         if curvature < 0.0:
             raise ValueError("'curvature' must be larger than 0.0")
         self._curvature = curvature
-        self._generate_probabilities()
+        self._probabilities = None
 
     @property
     def previous_index(self) -> int | None:
@@ -587,6 +706,8 @@ class TenneySelector:
     @property
     def probabilities(self) -> list[float]:
         r"""Read-only property, returns the probabilities vector."""
+        if self._probabilities is None:
+            self._generate_probabilities()
         return self._probabilities
 
     @property
@@ -596,4 +717,20 @@ class TenneySelector:
         is initialised to a list of 1's. A 0 is assigned to the index of the
         selected element while all others are increased by 1.
         """
-        return self._counter
+        return [self._step - selection_step for selection_step in self._selection_steps]
+
+    @property
+    def seed(self) -> int | random.Random | None:
+        r"""Seed of the random number generator which selects elements. Takes
+        an :obj:`int`, an instance of :class:`random.Random`, or ``None``
+        (default) for the global :mod:`random` module.
+        """
+        return self._seed
+
+    @seed.setter
+    def seed(
+        self,
+        seed: int | random.Random | None,
+    ) -> None:
+        self._rng = _make_rng(seed)
+        self._seed = seed
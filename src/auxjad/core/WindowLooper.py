@@ -1,9 +1,11 @@
+import random
 from math import ceil
 
 import abjad
 
 from .. import mutate
 from ._LooperParent import _LooperParent
+from ._OnsetIndex import _OnsetIndex
 
 
 class WindowLooper(_LooperParent):
@@ -235,6 +237,43 @@ class WindowLooper(_LooperParent):
 
         ..  figure:: ../_images/WindowLooper-9sldax4dumb.png
 
+    Streaming the output:
+        For long processes, use the method :meth:`iter_output` to go through
+        the looping process yielding one |abjad.Selection| for every
+        ``chunk_size`` windows. Unlike when using this class as an iterator,
+        the chunks are cleaned in the same way as the output of
+        :meth:`output_all`, so that joining them together results in the same
+        music. An optional positional argument ``n`` limits the number of
+        windows, as in :meth:`output_n`.
+
+        >>> container = abjad.Container(r"c'4 d'2 e'4")
+        >>> looper = auxjad.WindowLooper(container,
+        ...                              window_size=(3, 4),
+        ...                              step_size=(1, 4),
+        ...                              )
+        >>> staff = abjad.Staff()
+        >>> for chunk in looper.iter_output(chunk_size=2):
+        ...     staff.extend(chunk)
+        >>> abjad.show(staff)
+
+        ..  docs::
+
+            \new Staff
+            {
+                \time 3/4
+                c'4
+                d'2
+                d'2
+                e'4
+                d'4
+                e'4
+                r4
+                e'4
+                r2
+            }
+
+        ..  figure:: ../_images/WindowLooper-Jc8vsWfy3N.png
+
     :attr:`fill_with_rests`:
         In order to stop the process when the end of the looping window matches
         the end of the :attr:`contents` (and thus appending rests to the
@@ -1259,6 +1298,10 @@ class WindowLooper(_LooperParent):
         "_fill_with_rests",
         "_contents_length",
         "_contents_no_time_signature",
+        "_onset_index",
+        "_preceding_dynamics",
+        "_preceding_open_slurs",
+        "_preceding_tie_head_indicators",
         "_disable_rewrite_meter",
         "_boundary_depth",
         "_maximum_dot_count",
@@ -1300,6 +1343,7 @@ class WindowLooper(_LooperParent):
         after_rest: int | float | str | tuple[int] | abjad.Duration | abjad.Rest = 0,
         after_rest_in_new_measure: bool = False,
         use_multimeasure_rests: bool = True,
+        seed: int | random.Random | None = None,
     ) -> None:
         self.contents = contents
         self.omit_time_signatures = omit_time_signatures
@@ -1324,6 +1368,7 @@ class WindowLooper(_LooperParent):
             repetition_chance=repetition_chance,
             forward_bias=forward_bias,
             process_on_first_call=process_on_first_call,
+            seed=seed,
         )
 
     # ---------- SPECIAL METHODS ----------
@@ -1354,11 +1399,23 @@ class WindowLooper(_LooperParent):
 
     def _slice_contents(self) -> None:
         r"""This method takes a slice of size :attr:`window_size` out of
-        :attr:`contents` starting at the current :attr:`head_position`.
+        :attr:`contents` starting at the current :attr:`head_position`. Only
+        the top-level components overlapping the window (plus the beginning
+        of a logical tie split by the head) are copied and split, so the cost
+        of each call is independent of the length of :attr:`contents`.
         """
         head = self._head_position
         window_size = self._window_size
-        dummy_container = abjad.mutate.copy(self._contents_no_time_signature)
+        contents = self._contents_no_time_signature
+        onset_index = self._onset_index
+        # finding the top-level components overlapping the window
+        first = onset_index.index(head)
+        last = onset_index.stop_index(head + window_size.duration, start=first)
+        # including the beginning of a logical tie split by the head
+        while first > 0 and abjad.get.indicator(contents[first - 1], abjad.Tie):
+            first -= 1
+        dummy_container = abjad.Container(abjad.mutate.copy(contents[first:last]))
+        head -= onset_index[first]
         # splitting leaves at both slicing points
         if head > abjad.Duration(0):
             abjad.mutate.split(
@@ -1368,23 +1425,32 @@ class WindowLooper(_LooperParent):
         else:
             abjad.mutate.split(dummy_container[:], [window_size.duration])
         # finding start and end indeces for the window
-        for start in range(len(dummy_container)):
-            if abjad.get.duration(dummy_container[: start + 1]) > head:
+        offset = abjad.Duration(0)
+        for start, component in enumerate(dummy_container):
+            offset += abjad.get.duration(component)
+            if offset > head:
                 break
+        offset = abjad.Duration(0)
         for end in range(start + 1, len(dummy_container)):
-            if abjad.get.duration(dummy_container[start:end]) == window_size.duration:
+            offset += abjad.get.duration(dummy_container[end - 1])
+            if offset == window_size.duration:
                 break
         else:
             end = len(dummy_container)
-        self._notate_music(dummy_container, start, end)
+        self._notate_music(dummy_container, start, end, first)
 
     def _notate_music(
         self,
         dummy_container: abjad.Container,
         start: int,
         end: int,
+        first_index: int,
     ) -> None:
-        r"""Handles the notation aspects of the looping window."""
+        r"""Handles the notation aspects of the looping window.
+        ``first_index`` is the index of the top-level component of
+        :attr:`contents` which corresponds to the first component of
+        ``dummy_container``.
+        """
         window_size = self._window_size
         # passing on indicators from the head of an initial splitted leaf
         for index in range(start - 1, -1, -1):
@@ -1405,22 +1471,35 @@ class WindowLooper(_LooperParent):
                             is None
                         ):
                             abjad.attach(indicator, dummy_container[start])
+        for indicator in self._preceding_tie_head_indicators[first_index]:
+            if abjad.get.indicator(dummy_container[start], type(indicator)) is None:
+                abjad.attach(indicator, dummy_container[start])
         # removing ties generated by the split mutation
-        abjad.detach(abjad.Tie, dummy_container[start - 1])
+        if start > 0:
+            abjad.detach(abjad.Tie, dummy_container[start - 1])
+            preceding_leaves = dummy_container[start - 1 :: -1].leaves()
+        else:
+            preceding_leaves = []
         abjad.detach(abjad.Tie, dummy_container[end - 1])
-        # handling initial dynamics and slurs
+        # handling initial dynamics and slurs, falling back to the state of
+        # contents before the copied components
         start_head = abjad.select(dummy_container[start:]).logical_tie(0)[0]
         start_tail = abjad.select(dummy_container[start:]).logical_tie(0)[-1]
         if (
             abjad.get.indicator(start_head, abjad.StartSlur) is None
             and abjad.get.indicator(start_tail, abjad.StopSlur) is None
         ):
-            for leaf in dummy_container[start - 1 :: -1].leaves():
+            for leaf in preceding_leaves:
                 if abjad.get.indicator(leaf, abjad.StartSlur) is not None:
-                    abjad.attach(abjad.StartSlur(), start_head)
+                    slur_is_open = True
                     break
                 elif abjad.get.indicator(leaf, abjad.StopSlur) is not None:
+                    slur_is_open = False
                     break
+            else:
+                slur_is_open = self._preceding_open_slurs[first_index]
+            if slur_is_open:
+                abjad.attach(abjad.StartSlur(), start_head)
         if abjad.get.indicator(start_head, abjad.Dynamic) is None and not isinstance(
             start_head,
             (
@@ -1428,11 +1507,14 @@ class WindowLooper(_LooperParent):
                 abjad.MultimeasureRest,
             ),
         ):
-            for leaf in dummy_container[start - 1 :: -1].leaves():
+            for leaf in preceding_leaves:
                 dynamic = abjad.get.indicator(leaf, abjad.Dynamic)
                 if dynamic is not None:
-                    abjad.attach(dynamic, start_head)
                     break
+            else:
+                dynamic = self._preceding_dynamics[first_index]
+            if dynamic is not None:
+                abjad.attach(dynamic, start_head)
         # appending rests if necessary
         contents_dur = abjad.get.duration(dummy_container[start:end])
         if contents_dur < window_size.duration:
@@ -1488,6 +1570,48 @@ class WindowLooper(_LooperParent):
         self._current_window = dummy_container[:]
         dummy_container[:] = []
 
+    def _index_contents(self) -> None:
+        r"""Precomputes the offsets of all top-level components of
+        :attr:`contents` as well as the last dynamic, the slur state and the
+        indicators of the heads of tied components preceding each of them,
+        so that windows can be sliced without traversing the whole of
+        :attr:`contents`.
+        """
+        self._onset_index = _OnsetIndex(self._contents_no_time_signature)
+        self._preceding_dynamics = [None]
+        self._preceding_open_slurs = [False]
+        self._preceding_tie_head_indicators = [()]
+        dynamic = None
+        slur_is_open = False
+        tie_head_indicators = ()
+        previous_component = None
+        for component in self._contents_no_time_signature:
+            if abjad.get.indicator(component, abjad.Tie) and (
+                previous_component is None or not abjad.get.indicator(previous_component, abjad.Tie)
+            ):
+                head_indicators = tuple(
+                    indicator
+                    for indicator in abjad.get.indicators(component)
+                    if not isinstance(indicator, (abjad.TimeSignature, abjad.Tie))
+                )
+                head_types = [type(indicator) for indicator in head_indicators]
+                tie_head_indicators = head_indicators + tuple(
+                    indicator
+                    for indicator in tie_head_indicators
+                    if type(indicator) not in head_types
+                )
+            previous_component = component
+            for leaf in abjad.select(component).leaves():
+                if abjad.get.indicator(leaf, abjad.Dynamic) is not None:
+                    dynamic = abjad.get.indicator(leaf, abjad.Dynamic)
+                if abjad.get.indicator(leaf, abjad.StartSlur) is not None:
+                    slur_is_open = True
+                elif abjad.get.indicator(leaf, abjad.StopSlur) is not None:
+                    slur_is_open = False
+            self._preceding_dynamics.append(dynamic)
+            self._preceding_open_slurs.append(slur_is_open)
+            self._preceding_tie_head_indicators.append(tie_head_indicators)
+
     def _get_lilypond_format(self) -> str:
         r"""Returns interpreter representation of  :attr:`contents`."""
         return self.__repr__()
@@ -1515,6 +1639,7 @@ class WindowLooper(_LooperParent):
         self._contents_length = abjad.get.duration(self._contents[:])
         self._contents_no_time_signature = abjad.mutate.copy(self._contents)
         self._remove_all_time_signatures(self._contents_no_time_signature)
+        self._index_contents()
         self._is_first_window = True
 
     @property
@@ -0,0 +1,98 @@
+class _FenwickTree:
+    r"""Binary indexed (Fenwick) tree of numeric values, used by classes which
+    need both to update individual values and to query prefix sums of them in
+    logarithmic time, such as when sampling an index according to a
+    :obj:`list` of weights which changes after every draw.
+    """
+
+    # ---------- CLASS VARIABLES ----------
+
+    __slots__ = ("_nodes",)
+
+    # ---------- INITIALISER ----------
+
+    def __init__(
+        self,
+        values: list[int | float],
+    ) -> None:
+        self._nodes = [0] + list(values)
+        size = len(self._nodes)
+        for index in range(1, size):
+            parent = index + (index & -index)
+            if parent < size:
+                self._nodes[parent] += self._nodes[index]
+
+    # ---------- SPECIAL METHODS ----------
+
+    def __len__(self) -> int:
+        r"""Returns the number of values in the tree."""
+        return len(self._nodes) - 1
+
+    # ---------- PUBLIC METHODS ----------
+
+    def add(
+        self,
+        index: int,
+        delta: int | float,
+    ) -> None:
+        r"""Adds ``delta`` to the value at ``index``."""
+        index += 1
+        size = len(self._nodes)
+        while index < size:
+            self._nodes[index] += delta
+            index += index & -index
+
+    def prefix_sum(
+        self,
+        stop: int,
+    ) -> int | float:
+        r"""Returns the sum of the values before the index ``stop``."""
+        total = 0
+        while stop > 0:
+            total += self._nodes[stop]
+            stop -= stop & -stop
+        return total
+
+    def total(self) -> int | float:
+        r"""Returns the sum of all values."""
+        return self.prefix_sum(self.__len__())
+
+    def search(
+        self,
+        value: int | float,
+    ) -> int:
+        r"""Returns the smallest index whose inclusive prefix sum is larger
+        than ``value`` (or the last index, if there is none), as done by
+        :func:`bisect.bisect_right` on cumulative sums.
+        """
+        return self.search_nodes(value, lambda node: self._nodes[node])
+
+    def search_nodes(
+        self,
+        value: int | float,
+        node_value,
+    ) -> int:
+        r"""Same as :meth:`search`, but the value of each node of the tree is
+        given by the callable ``node_value``, which takes the position of the
+        node. This allows searching a linear combination of trees with the
+        same length.
+        """
+        size = self.__len__()
+        position = 0
+        step = 1 << size.bit_length()
+        while step > 0:
+            node = position + step
+            if node <= size:
+                current = node_value(node)
+                if current <= value:
+                    position = node
+                    value -= current
+            step >>= 1
+        return min(position, size - 1)
+
+    def node(
+        self,
+        position: int,
+    ) -> int | float:
+        r"""Returns the partial sum stored at a (one-based) node position."""
+        return self._nodes[position]
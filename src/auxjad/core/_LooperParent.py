@@ -4,6 +4,7 @@ from typing import Any, Iterator
 import abjad
 
 from .. import get, mutate
+from ._make_rng import _make_rng
 
 
 class _LooperParent:
@@ -25,6 +26,8 @@ class _LooperParent:
         "_current_window",
         "_is_first_window",
         "_process_on_first_call",
+        "_seed",
+        "_rng",
     )
 
     # ---------- INITIALISER ----------
@@ -39,6 +42,7 @@ class _LooperParent:
         repetition_chance: float = 0.0,
         forward_bias: float = 1.0,
         process_on_first_call: bool = False,
+        seed: int | random.Random | None = None,
     ) -> None:
         if not isinstance(process_on_first_call, bool):
             raise TypeError("'process_on_first_call' must be 'bool'")
@@ -49,6 +53,7 @@ class _LooperParent:
         self.repetition_chance = repetition_chance
         self.forward_bias = forward_bias
         self.process_on_first_call = process_on_first_call
+        self.seed = seed
         self._is_first_window = True
         self._current_window = None
 
@@ -142,15 +147,189 @@ class _LooperParent:
         dummy_container[:] = []
         return output
 
+    def iter_output(
+        self,
+        n: int | None = None,
+        *,
+        chunk_size: int = 1,
+        tie_identical_pitches: bool = False,
+    ) -> Iterator[abjad.Selection]:
+        r"""Goes through the whole looping process (or through ``n``
+        iterations of it) and yields one |abjad.Selection| for every
+        ``chunk_size`` windows. Only the current chunk is kept in memory and
+        post-processed, while the time signature, the dynamics and the ties at
+        its boundary are carried over to the next one, so that joining all
+        yielded selections results in the same output as :meth:`output_all`
+        (or :meth:`output_n`). Chunks are extended beyond ``chunk_size``
+        windows while a hairpin is left open at their end.
+        """
+        if n is not None:
+            if not isinstance(n, int):
+                raise TypeError("first positional argument must be 'int'")
+            if n <= 0:
+                raise ValueError("first positional argument must be a positive 'int'")
+        if not isinstance(chunk_size, int):
+            raise TypeError("'chunk_size' must be 'int'")
+        if chunk_size < 1:
+            raise ValueError("'chunk_size' must be greater than zero")
+        if not isinstance(tie_identical_pitches, bool):
+            raise TypeError("'tie_identical_pitches' must be 'bool'")
+        time_signature = None
+        effective_dynamic = None
+        previous_dynamic = None
+        current_dynamic = None
+        follows_stop_hairpin = False
+        dummy_container = abjad.Container()
+        n_windows = 0
+        count = 0
+        new_window = self._get_next_window()
+        while new_window is not None:
+            dummy_container.append(new_window)
+            n_windows += 1
+            count += 1
+            if n is None or count < n:
+                new_window = self._get_next_window()
+            else:
+                new_window = None
+            # ties need to be added before the chunk is yielded
+            if tie_identical_pitches and new_window is not None:
+                leaf1 = abjad.select(new_window).leaf(0)
+                leaf2 = abjad.select(dummy_container).leaf(-1)
+                if get.leaves_are_tieable((leaf1, leaf2)):
+                    abjad.attach(abjad.Tie(), dummy_container[-1])
+            if new_window is not None and (
+                n_windows < chunk_size or self._has_open_hairpin(dummy_container)
+            ):
+                continue
+            # time signatures, using the last one of the previous chunk
+            head = abjad.select(dummy_container).leaf(0)
+            if (
+                time_signature is not None
+                and abjad.get.indicator(head, abjad.TimeSignature) is None
+            ):
+                abjad.attach(time_signature, head)
+            mutate.remove_repeated_time_signatures(dummy_container[:])
+            if abjad.get.indicator(head, abjad.TimeSignature) == time_signature:
+                abjad.detach(abjad.TimeSignature, head)
+            for leaf in abjad.select(dummy_container).leaves()[::-1]:
+                if abjad.get.indicator(leaf, abjad.TimeSignature) is not None:
+                    time_signature = abjad.get.indicator(leaf, abjad.TimeSignature)
+                    break
+            # dynamics and hairpins, using dummy leaves to stand for the state
+            # at the end of the previous chunk
+            if effective_dynamic is not None:
+                dummy_container.insert(0, abjad.Note("c'4"))
+                abjad.attach(effective_dynamic, dummy_container[0])
+                mutate.reposition_dynamics(dummy_container[:], remove_repeated_dynamics=False)
+                del dummy_container[0]
+            else:
+                mutate.reposition_dynamics(dummy_container[:], remove_repeated_dynamics=False)
+            prefix = []
+            if current_dynamic is not None:
+                prefix.append(abjad.Note("c'4"))
+                abjad.attach(current_dynamic, prefix[-1])
+            if previous_dynamic is not None and previous_dynamic != current_dynamic:
+                prefix.append(abjad.Rest("r4"))
+                abjad.attach(previous_dynamic, prefix[-1])
+            (
+                effective_dynamic,
+                previous_dynamic,
+                current_dynamic,
+                follows_stop_hairpin,
+            ) = self._update_boundary_dynamics(
+                dummy_container,
+                effective_dynamic,
+                previous_dynamic,
+                current_dynamic,
+                follows_stop_hairpin,
+            )
+            dummy_container[0:0] = prefix
+            mutate.remove_repeated_dynamics(dummy_container[:])
+            del dummy_container[: len(prefix)]
+            output = dummy_container[:]
+            dummy_container[:] = []
+            n_windows = 0
+            yield output
+
     # ---------- PRIVATE METHODS ----------
 
+    def _get_next_window(self) -> abjad.Selection | None:
+        r"""Calls the looping process for one iteration, returning ``None``
+        instead of raising :exc:`StopIteration` when the process is done.
+        """
+        try:
+            return self.__call__()
+        except StopIteration:
+            return None
+
+    @staticmethod
+    def _has_open_hairpin(
+        container: abjad.Container,
+    ) -> bool:
+        r"""Returns whether the last hairpin of an |abjad.Container| (or a
+        dynamic or hairpin on its last rest) would still be affected by the
+        music following it.
+        """
+        leaves = abjad.select(container).leaves()
+        if isinstance(leaves[-1], (abjad.Rest, abjad.MultimeasureRest)) and (
+            abjad.get.indicator(leaves[-1], abjad.Dynamic) is not None
+            or abjad.get.indicator(leaves[-1], abjad.StartHairpin) is not None
+        ):
+            return True
+        for leaf in leaves[::-1]:
+            if abjad.get.indicator(leaf, abjad.StartHairpin) is not None:
+                return True
+            if abjad.get.indicator(leaf, abjad.Dynamic) is not None:
+                return False
+            if abjad.get.indicator(leaf, abjad.StopHairpin) is not None and not isinstance(
+                leaf, (abjad.Rest, abjad.MultimeasureRest)
+            ):
+                return False
+        return False
+
+    @staticmethod
+    def _update_boundary_dynamics(
+        container: abjad.Container,
+        effective_dynamic: abjad.Dynamic | None,
+        previous_dynamic: abjad.Dynamic | None,
+        current_dynamic: abjad.Dynamic | None,
+        follows_stop_hairpin: bool,
+    ) -> tuple:
+        r"""Removes stop hairpins repeated across the boundary with the
+        previous chunk and returns the dynamics state at the end of an
+        |abjad.Container|, mirroring the state kept by
+        |auxjad.mutate.reposition_dynamics()| and
+        |auxjad.mutate.remove_repeated_dynamics()|.
+        """
+        for leaf in abjad.select(container).leaves():
+            dynamic = abjad.get.indicator(leaf, abjad.Dynamic)
+            start_hairpin = abjad.get.indicator(leaf, abjad.StartHairpin)
+            if abjad.get.indicator(leaf, abjad.StopHairpin) is not None:
+                if follows_stop_hairpin:
+                    abjad.detach(abjad.StopHairpin, leaf)
+                follows_stop_hairpin = True
+            elif start_hairpin is not None or dynamic is not None:
+                follows_stop_hairpin = False
+            if dynamic is not None:
+                effective_dynamic = dynamic
+            if isinstance(leaf, (abjad.Rest, abjad.MultimeasureRest)):
+                if dynamic is not None:
+                    previous_dynamic = dynamic
+            else:
+                if start_hairpin is not None:
+                    current_dynamic = None
+                elif dynamic is not None:
+                    current_dynamic = dynamic
+                previous_dynamic = current_dynamic
+        return effective_dynamic, previous_dynamic, current_dynamic, follows_stop_hairpin
+
     def _move_head(self) -> None:
         r"""Moves the head by a certain number of steps of fixed size, either
         forwards or backwards according to the forward bias.
         """
         if not self._is_first_window or self._process_on_first_call:
-            if self._repetition_chance == 0.0 or random.random() > self._repetition_chance:
-                step = self._step_size * random.randint(1, self._max_steps)
+            if self._repetition_chance == 0.0 or self._rng.random() > self._repetition_chance:
+                step = self._step_size * self._rng.randint(1, self._max_steps)
                 diretion = self._biased_choice(self._forward_bias)
                 self._head_position += step * diretion
         self._is_first_window = False
@@ -161,13 +340,13 @@ class _LooperParent:
         """
         pass
 
-    @staticmethod
     def _biased_choice(
+        self,
         forward_bias: float,
     ) -> None:
         r"""Returns either +1 or -1 according to a forward bias value."""
         weights = [forward_bias, 1.0 - forward_bias]
-        return random.choices([1, -1], weights=weights)[0]
+        return self._rng.choices([1, -1], weights=weights)[0]
 
     @staticmethod
     def _remove_all_time_signatures(
@@ -317,6 +496,23 @@ class _LooperParent:
             raise TypeError("'process_on_first_call' must be 'bool'")
         self._process_on_first_call = process_on_first_call
 
+    @property
+    def seed(self) -> int | random.Random | None:
+        r"""Seed of the random number generator which sets the repetitions, the
+        number of steps, and their direction. Takes an :obj:`int`, an instance
+        of :class:`random.Random`, or ``None`` (default) for the global
+        :mod:`random` module.
+        """
+        return self._seed
+
+    @seed.setter
+    def seed(
+        self,
+        seed: int | random.Random | None,
+    ) -> None:
+        self._rng = _make_rng(seed)
+        self._seed = seed
+
     @property
     def current_window(self) -> abjad.Selection | None:
         r"""Read-only property, returns the window at the current head
@@ -0,0 +1,72 @@
+from bisect import bisect_left, bisect_right
+
+import abjad
+
+
+class _OnsetIndex:
+    r"""Sorted list of the start offsets of the top-level components of an
+    |abjad.Container|, used by classes which need to find the components
+    sounding at a given offset without summing the durations of all
+    preceding components. Lookups take logarithmic time. Instances are not
+    updated when the container is mutated, so they should be rebuilt
+    whenever the :attr:`contents` of their owner are set.
+    """
+
+    # ---------- CLASS VARIABLES ----------
+
+    __slots__ = ("_onsets",)
+
+    # ---------- INITIALISER ----------
+
+    def __init__(
+        self,
+        container: abjad.Container,
+    ) -> None:
+        self._onsets = [abjad.Offset(0)]
+        for component in container:
+            self._onsets.append(self._onsets[-1] + abjad.get.duration(component))
+
+    # ---------- SPECIAL METHODS ----------
+
+    def __len__(self) -> int:
+        r"""Returns the number of indexed components."""
+        return len(self._onsets) - 1
+
+    def __getitem__(
+        self,
+        index: int,
+    ) -> abjad.Offset:
+        r"""Returns the start offset of the component at ``index``. An index
+        equal to the number of components returns the end offset of the last
+        one.
+        """
+        return self._onsets[index]
+
+    # ---------- PUBLIC METHODS ----------
+
+    def index(
+        self,
+        offset: abjad.Offset | abjad.Duration,
+    ) -> int:
+        r"""Returns the index of the component sounding at ``offset``."""
+        return min(bisect_right(self._onsets, offset) - 1, self.__len__() - 1)
+
+    def stop_index(
+        self,
+        offset: abjad.Offset | abjad.Duration,
+        *,
+        start: int = 0,
+    ) -> int:
+        r"""Returns the index after the last component starting before
+        ``offset``, searching only from ``start`` onwards.
+        """
+        return min(bisect_left(self._onsets, offset, lo=start + 1), self.__len__())
+
+    # ---------- PUBLIC PROPERTIES ----------
+
+    @property
+    def duration(self) -> abjad.Duration:
+        r"""Read-only property, returns the total duration of the indexed
+        components.
+        """
+        return abjad.Duration(self._onsets[-1])
@@ -0,0 +1,20 @@
+import random
+
+
+def _make_rng(
+    seed: int | random.Random | None,
+) -> random.Random:
+    r"""Returns the random number generator for a ``seed`` argument, used by
+    the ``seed`` setters of the classes of this package. An :obj:`int` seeds a
+    new instance of :class:`random.Random`, an instance of
+    :class:`random.Random` is used as it is (so that it can be shared between
+    objects), and ``None`` returns the global :mod:`random` module. Although
+    :obj:`bool` is a subclass of :obj:`int`, it is not accepted as a seed.
+    """
+    if seed is None:
+        return random
+    if isinstance(seed, random.Random):
+        return seed
+    if isinstance(seed, int) and not isinstance(seed, bool):
+        return random.Random(seed)
+    raise TypeError("'seed' must be 'int', 'random.Random', or 'None'")
@@ -1,9 +1,37 @@
+import random
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Iterator
 
 import abjad
 
 from .. import mutate
 from ..core.GeneticAlgorithm import GeneticAlgorithm
+from ..core._make_rng import _make_rng
+
+
+def _evolve_island(
+    pitch_ga: GeneticAlgorithm,
+    attack_point_ga: GeneticAlgorithm,
+    pitch_score_bias: float,
+    n_generations: int,
+) -> tuple:
+    r"""Iterates an island (a pair of pitch and attack point genetic
+    algorithms) by ``n_generations``, returning both genetic algorithms
+    together with the best and the mean combined scores of each generation.
+    """
+    best_scores = []
+    mean_scores = []
+    for _ in range(n_generations):
+        scores = GeneticAlgorithmMusicMaker._evolve_genetic_algorithms(
+            pitch_ga,
+            attack_point_ga,
+            pitch_score_bias,
+        )
+        best_scores.append(scores[0])
+        mean_scores.append(sum(scores) / len(scores))
+    return pitch_ga, attack_point_ga, best_scores, mean_scores
 
 
 class GeneticAlgorithmMusicMaker:
@@ -846,6 +874,89 @@ class GeneticAlgorithmMusicMaker:
 
         ..  figure:: ../_images/GeneticAlgorithmMusicMaker-5aInHHwMol.png
 
+    :meth:`run_until`:
+        Use :meth:`run_until` to iterate the genetic algorithms up to a maximum
+        number of generations, stopping early when the score of the fittest
+        measure reaches ``target_score`` or when it has not improved for
+        ``patience`` generations. It returns the number of generations run,
+        and the fittest measure can then be read from :attr:`fittest_measure`.
+        Unlike calling the object, this method does not make a measure at each
+        generation, since measures are only made when
+        :attr:`fittest_measure` is read.
+        The score of the fittest measure and the mean score of each generation
+        are recorded in :attr:`best_score_history` and
+        :attr:`mean_score_history`.
+
+        >>> maker = auxjad.GeneticAlgorithmMusicMaker(
+        ...     pitch_target=["c'", "d'", "e'", "f'"],
+        ...     pitch_genes=["c'", "d'", "e'", "f'", "g'", "a'", "b'", "c''"],
+        ...     attack_point_target=[0, 4, 8, 12],
+        ...     attack_point_genes=list(range(16)),
+        ... )
+        >>> maker.run_until(100, target_score=0.5, patience=20)
+        9
+        >>> maker.fittest_individual_score
+        0.5
+        >>> len(maker.best_score_history)
+        9
+
+    :attr:`measure_cache_size`:
+        As the population converges, the fittest individuals often alternate
+        between a few candidates. Set :attr:`measure_cache_size` to the
+        maximum number of measures to be cached, and measures of individuals
+        which were already made will be copied from the cache instead of being
+        made again (a measure is never made again while the fittest
+        individuals stay the same, regardless of this cache).
+        The properties :attr:`measure_cache_hits` and
+        :attr:`measure_cache_misses` count the measures that were and were not
+        found in the cache, and :meth:`clear_measure_cache` empties it.
+
+        >>> maker = auxjad.GeneticAlgorithmMusicMaker(
+        ...     pitch_target=["c'", "d'", "e'", "f'"],
+        ...     pitch_genes=["c'", "d'", "e'", "f'", "g'", "a'", "b'", "c''"],
+        ...     attack_point_target=[0, 4, 8, 12],
+        ...     attack_point_genes=list(range(16)),
+        ...     measure_cache_size=64,
+        ... )
+        >>> notes = maker.output_n(20)
+        >>> maker.measure_cache_hits
+        3
+        >>> maker.measure_cache_misses
+        7
+
+    :meth:`run_islands`:
+        Use :meth:`run_islands` to evolve several independent populations
+        (islands) in parallel using a pool of worker processes. Every
+        ``migration_interval`` generations, the ``migration_size`` fittest
+        individuals of each island replace the least fit individuals of the
+        next one, and at the end the islands are merged back into this object,
+        keeping its fittest :attr:`population_size` individuals. Afterwards,
+        :attr:`fittest_measure`, :attr:`scores` and the other properties work
+        as after calling the object, and the best and mean scores across all
+        islands are recorded in :attr:`best_score_history` and
+        :attr:`mean_score_history`. Each island draws from its own random
+        generator derived from :attr:`seed`, so the result does not depend on
+        ``max_workers``; setting it to ``1`` runs all islands in the current
+        process. A custom ``fitness_function`` of the genetic algorithms must
+        be picklable.
+
+        >>> maker = auxjad.GeneticAlgorithmMusicMaker(
+        ...     pitch_target=["c'", "d'", "e'", "f'"],
+        ...     pitch_genes=["c'", "d'", "e'", "f'", "g'", "a'", "b'", "c''"],
+        ...     attack_point_target=[0, 4, 8, 12],
+        ...     attack_point_genes=list(range(16)),
+        ...     seed=7,
+        ... )
+        >>> maker.run_islands(30,
+        ...                   n_islands=4,
+        ...                   migration_interval=10,
+        ...                   migration_size=2,
+        ...                   )
+        >>> maker.generation_number
+        29
+        >>> len(maker.best_score_history)
+        30
+
     :meth:`reset`:
         Use the :meth:`reset` method to reset the genetic algorithm at any
         point:
@@ -908,13 +1019,20 @@ class GeneticAlgorithmMusicMaker:
         "_pitch_ga",
         "_attack_point_ga",
         "_fittest_measure",
+        "_fittest_measure_genome",
         "_fittest_pitch_individual",
         "_fittest_attack_point_individual",
-        "_pitch_population",
-        "_attack_point_population",
         "_scores",
         "_target_music",
         "_total_duration",
+        "_best_score_history",
+        "_mean_score_history",
+        "_measure_cache",
+        "_measure_cache_size",
+        "_measure_cache_hits",
+        "_measure_cache_misses",
+        "_seed",
+        "_rng",
     )
 
     # ---------- INITIALISER ----------
@@ -940,6 +1058,9 @@ class GeneticAlgorithmMusicMaker:
         time_signatures: list | None = None,
         attack_points_mode: bool = False,
         pitch_score_bias: float = 0.5,
+        seed: int | random.Random | None = None,
+        use_numpy: bool = False,
+        measure_cache_size: int | None = None,
     ) -> None:
         if len(pitch_target) != len(attack_point_target):
             raise ValueError("'pitch_target' and 'attack_point_target' must have the same length")
@@ -980,6 +1101,16 @@ class GeneticAlgorithmMusicMaker:
         self.time_signatures = time_signatures
         self.attack_points_mode = attack_points_mode
         self.pitch_score_bias = pitch_score_bias
+        self.seed = seed
+        self.use_numpy = use_numpy
+        self._best_score_history = array("d")
+        self._mean_score_history = array("d")
+        self._fittest_measure = None
+        self._fittest_measure_genome = None
+        self._measure_cache = OrderedDict()
+        self._measure_cache_hits = 0
+        self._measure_cache_misses = 0
+        self.measure_cache_size = measure_cache_size
         self._target_individual_to_measure()
 
     # ---------- SPECIAL METHODS ----------
@@ -1004,14 +1135,7 @@ class GeneticAlgorithmMusicMaker:
         :attr:`population_size` via reproduction and mutation processes and
         scores each individual using the evaluation function.
         """
-        self._pitch_ga._generate_population()
-        self._pitch_ga._score_population()
-        self._attack_point_ga._generate_population()
-        for attack_point_individual in self._attack_point_ga._population:
-            attack_point_individual.sort()
-        self._attack_point_ga._score_population()
-        self._sort_population_by_evaluation()
-        self._fittest_individual_to_measure()
+        self._evolve()
         return self.fittest_measure
 
     def __next__(self) -> None:
@@ -1032,9 +1156,131 @@ class GeneticAlgorithmMusicMaker:
         r"""Resets that genetic algorithm."""
         self._pitch_ga.reset()
         self._attack_point_ga.reset()
-        self._pitch_population = None
-        self._attack_point_population = None
         self._scores = None
+        self._best_score_history = array("d")
+        self._mean_score_history = array("d")
+        self._fittest_measure = None
+        self._fittest_measure_genome = None
+
+    def clear_measure_cache(self) -> None:
+        r"""Empties the measure cache and resets its hit and miss counters."""
+        self._measure_cache.clear()
+        self._measure_cache_hits = 0
+        self._measure_cache_misses = 0
+
+    def run_until(
+        self,
+        max_generations: int,
+        *,
+        target_score: float | None = None,
+        patience: int | None = None,
+    ) -> int:
+        r"""Calls the genetic algorithm process for up to ``max_generations``
+        iterations, stopping early once the score of the fittest individual
+        reaches ``target_score`` or has not improved for ``patience``
+        consecutive generations. Returns the number of generations run.
+        """
+        if not isinstance(max_generations, int):
+            raise TypeError("first positional argument must be 'int'")
+        if max_generations <= 0:
+            raise ValueError("first positional argument must be a positive 'int'")
+        if target_score is not None and not isinstance(target_score, (int, float)):
+            raise TypeError("'target_score' must be 'float' or 'None'")
+        if patience is not None:
+            if not isinstance(patience, int):
+                raise TypeError("'patience' must be 'int' or 'None'")
+            if patience <= 0:
+                raise ValueError("'patience' must be a positive 'int'")
+        best_score = None
+        n_stale_generations = 0
+        for n_generations in range(1, max_generations + 1):
+            self._evolve()
+            score = self._scores[0]
+            if target_score is not None and score >= target_score:
+                break
+            if best_score is None or score > best_score:
+                best_score = score
+                n_stale_generations = 0
+            else:
+                n_stale_generations += 1
+                if patience is not None and n_stale_generations >= patience:
+                    break
+        return n_generations
+
+    def run_islands(
+        self,
+        n_generations: int,
+        *,
+        n_islands: int = 4,
+        migration_interval: int = 10,
+        migration_size: int = 1,
+        max_workers: int | None = None,
+    ) -> None:
+        r"""Evolves ``n_islands`` independent populations for
+        ``n_generations`` iterations using a pool of worker processes. Every
+        ``migration_interval`` generations, the ``migration_size`` fittest
+        individuals of each island replace the least fit individuals of the
+        next one. The islands are then merged back, keeping the fittest
+        :attr:`population_size` individuals.
+        """
+        if not isinstance(n_generations, int):
+            raise TypeError("first positional argument must be 'int'")
+        if n_generations <= 0:
+            raise ValueError("first positional argument must be a positive 'int'")
+        if not isinstance(n_islands, int):
+            raise TypeError("'n_islands' must be 'int'")
+        if n_islands < 1:
+            raise ValueError("'n_islands' must be greater than zero")
+        if not isinstance(migration_interval, int):
+            raise TypeError("'migration_interval' must be 'int'")
+        if migration_interval < 1:
+            raise ValueError("'migration_interval' must be greater than zero")
+        if not isinstance(migration_size, int):
+            raise TypeError("'migration_size' must be 'int'")
+        if migration_size < 0:
+            raise ValueError("'migration_size' must be a non-negative 'int'")
+        if migration_size >= self.population_size:
+            raise ValueError("'migration_size' must be smaller than 'population_size'")
+        if max_workers is not None:
+            if not isinstance(max_workers, int):
+                raise TypeError("'max_workers' must be 'int'")
+            if max_workers < 1:
+                raise ValueError("'max_workers' must be greater than zero")
+        islands = [
+            self._make_island(random.Random(self._rng.getrandbits(64))) for _ in range(n_islands)
+        ]
+        executor = None
+        if max_workers != 1:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            map_function = map if executor is None else executor.map
+            n_generations_run = 0
+            while n_generations_run < n_generations:
+                n_epoch_generations = min(
+                    migration_interval,
+                    n_generations - n_generations_run,
+                )
+                results = list(
+                    map_function(
+                        _evolve_island,
+                        [island[0] for island in islands],
+                        [island[1] for island in islands],
+                        [self._pitch_score_bias] * n_islands,
+                        [n_epoch_generations] * n_islands,
+                    )
+                )
+                islands = [result[:2] for result in results]
+                for best_scores in zip(*(result[2] for result in results)):
+                    self._best_score_history.append(max(best_scores))
+                for mean_scores in zip(*(result[3] for result in results)):
+                    self._mean_score_history.append(sum(mean_scores) / n_islands)
+                n_generations_run += n_epoch_generations
+                if n_generations_run < n_generations and migration_size > 0:
+                    self._migrate_individuals(islands, migration_size)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        self._merge_islands(islands)
 
     def output_n(self, n: int) -> abjad.Selection:
         r"""Goes through ``n`` iterations of the genetic algorithm process and
@@ -1054,43 +1300,164 @@ class GeneticAlgorithmMusicMaker:
 
     # ---------- PRIVATE METHODS ----------
 
-    def _sort_population_by_evaluation(self) -> None:
-        r"""Sorts the population (and their scores) according to the evaluation
-        of its individuals.
+    def _evolve(self) -> None:
+        r"""Iterates both genetic algorithms by one generation without
+        making the fittest measure.
         """
-        self._scores = []
-        for pitch_score, attack_score in zip(self._pitch_ga._scores, self._attack_point_ga._scores):
-            combined_score = pitch_score * self._pitch_score_bias
-            combined_score += attack_score * (1.0 - self._pitch_score_bias)
-            combined_score /= 2
-            self._scores.append(combined_score)
-        zipped_lists = list(
-            zip(
-                self._scores,
-                self._pitch_ga._population,
-                self._attack_point_ga._population,
-            )
+        self._scores = self._evolve_genetic_algorithms(
+            self._pitch_ga,
+            self._attack_point_ga,
+            self._pitch_score_bias,
+        )
+        self._best_score_history.append(self._scores[0])
+        self._mean_score_history.append(sum(self._scores) / len(self._scores))
+
+    @staticmethod
+    def _evolve_genetic_algorithms(
+        pitch_ga: GeneticAlgorithm,
+        attack_point_ga: GeneticAlgorithm,
+        pitch_score_bias: float,
+    ) -> list[float]:
+        r"""Iterates a pair of pitch and attack point genetic algorithms by
+        one generation, returning the combined scores of their population.
+        """
+        pitch_ga._generate_population()
+        pitch_ga._score_population()
+        attack_point_ga._generate_population()
+        attack_point_ga._sort_individuals()
+        attack_point_ga._score_population()
+        return GeneticAlgorithmMusicMaker._sort_population_by_evaluation(
+            pitch_ga,
+            attack_point_ga,
+            pitch_score_bias,
         )
-        zipped_lists.sort(
-            key=lambda tuple_triple: tuple_triple[0],
+
+    @staticmethod
+    def _sort_population_by_evaluation(
+        pitch_ga: GeneticAlgorithm,
+        attack_point_ga: GeneticAlgorithm,
+        pitch_score_bias: float,
+    ) -> list[float]:
+        r"""Sorts the populations of a pair of pitch and attack point genetic
+        algorithms according to the combined evaluation of their individuals,
+        returning the sorted combined scores.
+        """
+        scores = []
+        for pitch_score, attack_score in zip(pitch_ga._scores, attack_point_ga._scores):
+            combined_score = pitch_score * pitch_score_bias
+            combined_score += attack_score * (1.0 - pitch_score_bias)
+            combined_score /= 2
+            scores.append(combined_score)
+        order = sorted(
+            range(len(scores)),
+            key=scores.__getitem__,
             reverse=True,
         )
-        self._pitch_population = [pitch_gene for _, pitch_gene, _ in zipped_lists]
-        self._attack_point_population = [
-            attack_point_gene for _, _, attack_point_gene in zipped_lists
+        pitch_ga._reorder_population(order)
+        attack_point_ga._reorder_population(order)
+        return [scores[index] for index in order]
+
+    def _make_island(
+        self,
+        rng: random.Random,
+    ) -> tuple:
+        r"""Makes a copy of the pitch and attack point genetic algorithms
+        (including their current population, if any) drawing from ``rng``.
+        """
+        island = []
+        for ga in (self._pitch_ga, self._attack_point_ga):
+            island_ga = GeneticAlgorithm(
+                target=ga.target,
+                genes=ga.genes,
+                initial_individual=ga.initial_individual,
+                population_size=ga.population_size,
+                select_n_parents=ga.select_n_parents,
+                keep_n_parents=ga.keep_n_parents,
+                mutation_chance=ga.mutation_chance,
+                mutation_index=ga.mutation_index,
+                evaluation_index=ga.evaluation_index,
+                seed=rng,
+                use_numpy=ga.use_numpy,
+                fitness_cache_size=ga.fitness_cache_size,
+                fitness_function=ga.fitness_function,
+            )
+            if ga._population_indices is not None:
+                island_ga._replace_population(ga._list_population_indices(), ga._scores)
+                island_ga._generation_number = ga._generation_number
+            island.append(island_ga)
+        return tuple(island)
+
+    def _migrate_individuals(
+        self,
+        islands: list,
+        migration_size: int,
+    ) -> None:
+        r"""Replaces the ``migration_size`` least fit individuals of each
+        island by the fittest individuals of the previous island, in a ring.
+        """
+        emigrants = [
+            [
+                (ga._list_population_indices()[:migration_size], ga._scores[:migration_size])
+                for ga in island
+            ]
+            for island in islands
         ]
-        self._scores = [score for score, _, _ in zipped_lists]
-        self._pitch_ga._population = self._pitch_population[:]
-        self._attack_point_ga._population = self._attack_point_population[:]
+        for index, island in enumerate(islands):
+            for ga, (individuals, scores) in zip(island, emigrants[index - 1]):
+                population_indices = ga._list_population_indices()
+                population_scores = ga._scores[:]
+                population_indices[-migration_size:] = individuals
+                population_scores[-migration_size:] = scores
+                ga._replace_population(population_indices, population_scores)
+            self._sort_population_by_evaluation(
+                island[0],
+                island[1],
+                self._pitch_score_bias,
+            )
+
+    def _merge_islands(
+        self,
+        islands: list,
+    ) -> None:
+        r"""Merges the populations of all islands into the pitch and attack
+        point genetic algorithms, keeping only the fittest individuals.
+        """
+        population_size = self.population_size
+        for island_index, ga in enumerate((self._pitch_ga, self._attack_point_ga)):
+            population_indices = []
+            scores = []
+            for island in islands:
+                population_indices.extend(island[island_index]._list_population_indices())
+                scores.extend(island[island_index]._scores)
+            ga._replace_population(population_indices, scores)
+            ga._generation_number = islands[0][island_index]._generation_number
+        scores = self._sort_population_by_evaluation(
+            self._pitch_ga,
+            self._attack_point_ga,
+            self._pitch_score_bias,
+        )
+        for ga in (self._pitch_ga, self._attack_point_ga):
+            ga._replace_population(
+                ga._list_population_indices()[:population_size],
+                ga._scores[:population_size],
+            )
+        self._scores = scores[:population_size]
 
     def _fittest_individual_to_measure(self) -> None:
         r"""Converts the fittest pitch and attack point individuals to a
-        measure of music.
+        measure of music, unless the measure of this same pair of individuals
+        has already been made.
         """
-        self._fittest_measure = self._make_measure(
-            self.fittest_attack_point_individual[:],
-            self.fittest_pitch_individual[:],
+        genome = (
+            tuple(self.fittest_attack_point_individual),
+            tuple(self.fittest_pitch_individual),
         )
+        if self._fittest_measure is None or genome != self._fittest_measure_genome:
+            self._fittest_measure = self._make_measure(
+                list(genome[0]),
+                list(genome[1]),
+            )
+            self._fittest_measure_genome = genome
 
     def _target_individual_to_measure(self) -> None:
         r"""Converts the target pitch and attack point individuals to a
@@ -1106,17 +1473,14 @@ class GeneticAlgorithmMusicMaker:
         attack_points: list,
         pitches: list,
     ) -> tuple:
-        r"""Sorts pitches and attack points."""
-        zipped_lists = []
-        # zipping while removing simultaneous attacks
+        r"""Sorts pitches and attack points. Simultaneous attacks are removed,
+        keeping the pitch of the first of them.
+        """
+        first_pitches = {}
         for attack_point, pitch in zip(attack_points, pitches):
-            if attack_point not in (p for p, _ in zipped_lists):
-                zipped_lists.append((attack_point, pitch))
-        zipped_lists.sort(
-            key=lambda tuple_pair: tuple_pair[0],
-        )
-        attack_points = [attack_point for attack_point, _ in zipped_lists]
-        pitches = [pitch for _, pitch in zipped_lists]
+            first_pitches.setdefault(attack_point, pitch)
+        attack_points = sorted(first_pitches)
+        pitches = [first_pitches[attack_point] for attack_point in attack_points]
         return attack_points, pitches
 
     def _convert_attack_points_to_durations(
@@ -1142,9 +1506,50 @@ class GeneticAlgorithmMusicMaker:
         self,
         attack_points,
         pitches,
-    ) -> None:
+    ) -> abjad.Selection:
         r"""Converts a list of pitch and attack point individuals into a
-        measure of music.
+        measure of music. When the measure cache is enabled, measures are
+        looked up by their sorted attack points and pitches together with the
+        current notation settings, and a copy of the cached measure is
+        returned.
+        """
+        if self._measure_cache_size is None:
+            return self._render_measure(attack_points, pitches)
+        sorted_attack_points, sorted_pitches = self._sort_by_attack_point(
+            attack_points[:],
+            pitches[:],
+        )
+        key = (
+            tuple(sorted_attack_points),
+            tuple(sorted_pitches),
+            self._omit_time_signature,
+            None if self._time_signatures is None else tuple(self._time_signatures),
+            self._attack_points_mode,
+            self._units_per_window,
+            self._duration_unit,
+        )
+        try:
+            measure = self._measure_cache[key]
+        except KeyError:
+            self._measure_cache_misses += 1
+            measure = self._render_measure(attack_points, pitches)
+            self._measure_cache[key] = measure
+            if len(self._measure_cache) > self._measure_cache_size:
+                self._measure_cache.popitem(last=False)
+        except TypeError:
+            return self._render_measure(attack_points, pitches)
+        else:
+            self._measure_cache_hits += 1
+            self._measure_cache.move_to_end(key)
+        return abjad.mutate.copy(measure)
+
+    def _render_measure(
+        self,
+        attack_points,
+        pitches,
+    ) -> abjad.Selection:
+        r"""Makes the measure of music of a list of pitch and attack point
+        individuals.
         """
         dummy_container = abjad.Container()
         sorted_attack_points, sorted_pitches = self._sort_by_attack_point(
@@ -1162,17 +1567,15 @@ class GeneticAlgorithmMusicMaker:
             )
             dummy_container = abjad.Container(notes)
         else:
-            notes = abjad.Selection()
-            for i in range(self._units_per_window):
-                if i in sorted_attack_points:
-                    pitch_index = sorted_attack_points.index(i)
-                    notes += abjad.LeafMaker()(
-                        [sorted_pitches[pitch_index]],
-                        [self._duration_unit],
-                    )
-                else:
-                    rest = abjad.Rest(self._duration_unit)
-                    notes += abjad.select(rest).leaves()
+            # one bucket per unit of the grid, rests are created for empty ones
+            pitch_grid = [None] * self._units_per_window
+            for attack_point, pitch in zip(sorted_attack_points, sorted_pitches):
+                if attack_point < self._units_per_window:
+                    pitch_grid[attack_point] = pitch
+            notes = abjad.LeafMaker()(
+                pitch_grid,
+                [self._duration_unit] * self._units_per_window,
+            )
             dummy_container = abjad.Container(notes)
         # adding time signature
         if not self._omit_time_signature:
@@ -1207,6 +1610,7 @@ class GeneticAlgorithmMusicMaker:
             raise TypeError("'duration_unit' must be 'abjad.Duration'")
         self._duration_unit = duration_unit
         self._total_duration = self._units_per_window * self._duration_unit
+        self._fittest_measure = None
 
     @property
     def units_per_window(self) -> int:
@@ -1226,6 +1630,7 @@ class GeneticAlgorithmMusicMaker:
             )
         self._units_per_window = units_per_window
         self._total_duration = self._units_per_window * self._duration_unit
+        self._fittest_measure = None
 
     @property
     def omit_time_signature(self) -> bool:
@@ -1242,6 +1647,7 @@ class GeneticAlgorithmMusicMaker:
         if not isinstance(omit_time_signature, bool):
             raise TypeError("'omit_time_signature' must be 'bool'")
         self._omit_time_signature = omit_time_signature
+        self._fittest_measure = None
 
     @property
     def time_signatures(self) -> list:
@@ -1268,6 +1674,7 @@ class GeneticAlgorithmMusicMaker:
                     "'time_signatures' must be a 'list' of 'abjad.TimeSignature' or 'None'"
                 )
         self._time_signatures = time_signatures
+        self._fittest_measure = None
 
     @property
     def attack_points_mode(self) -> bool:
@@ -1284,6 +1691,7 @@ class GeneticAlgorithmMusicMaker:
         if not isinstance(attack_points_mode, bool):
             raise TypeError("'attack_points_mode' must be 'bool'")
         self._attack_points_mode = attack_points_mode
+        self._fittest_measure = None
 
     @property
     def pitch_target(self) -> list:
@@ -1494,11 +1902,51 @@ class GeneticAlgorithmMusicMaker:
             raise ValueError("'pitch_score_bias' must be between 0.0 and 1.0")
         self._pitch_score_bias = pitch_score_bias
 
+    @property
+    def seed(self) -> int | random.Random | None:
+        r"""Seed of the random number generator shared by both instances of
+        the genetic algorithm. It can take an :obj:`int`, an instance of
+        :class:`random.Random`, or ``None`` (default), in which case the global
+        :mod:`random` module is used.
+        """
+        return self._seed
+
+    @seed.setter
+    def seed(
+        self,
+        seed: int | random.Random | None,
+    ) -> None:
+        self._rng = _make_rng(seed)
+        self._seed = seed
+        ga_seed = None if seed is None else self._rng
+        self._pitch_ga.seed = ga_seed
+        self._attack_point_ga.seed = ga_seed
+
+    @property
+    def use_numpy(self) -> bool:
+        r"""If ``True``, both instances of the genetic algorithm use their
+        vectorised NumPy implementation (see
+        :attr:`auxjad.GeneticAlgorithm.use_numpy`). Default is ``False``.
+        """
+        return self._pitch_ga.use_numpy
+
+    @use_numpy.setter
+    def use_numpy(
+        self,
+        use_numpy: bool,
+    ) -> None:
+        self._pitch_ga.use_numpy = use_numpy
+        self._attack_point_ga.use_numpy = use_numpy
+
     @property
     def fittest_measure(self) -> abjad.Selection | None:
         r"""Read-only property, returns the fittest individual of the current
-        population as an |abjad.Selection|.
+        population as an |abjad.Selection|. It is only made when read, and it
+        is not made again until the fittest individuals change.
         """
+        if self.fittest_pitch_individual is None:
+            return None
+        self._fittest_individual_to_measure()
         return abjad.mutate.copy(self._fittest_measure)
 
     @property
@@ -1518,19 +1966,75 @@ class GeneticAlgorithmMusicMaker:
         """
         return self._pitch_ga._generation_number
 
+    @property
+    def measure_cache_size(self) -> int | None:
+        r"""Maximum number of measures kept in the measure cache. When set to
+        an :obj:`int`, measures made from the same attack points and pitches
+        with the same notation settings are copied from the cache instead of
+        being made again; once the cache is full, the least recently used
+        measures are discarded. Default is ``None``, which disables the cache.
+        """
+        return self._measure_cache_size
+
+    @measure_cache_size.setter
+    def measure_cache_size(
+        self,
+        measure_cache_size: int | None,
+    ) -> None:
+        if measure_cache_size is not None:
+            if not isinstance(measure_cache_size, int):
+                raise TypeError("'measure_cache_size' must be 'int' or 'None'")
+            if measure_cache_size < 1:
+                raise ValueError("'measure_cache_size' must be greater than zero")
+            while len(self._measure_cache) > measure_cache_size:
+                self._measure_cache.popitem(last=False)
+        else:
+            self._measure_cache.clear()
+        self._measure_cache_size = measure_cache_size
+
+    @property
+    def measure_cache_hits(self) -> int:
+        r"""Read-only property, returns the number of measures that were found
+        in the measure cache.
+        """
+        return self._measure_cache_hits
+
+    @property
+    def measure_cache_misses(self) -> int:
+        r"""Read-only property, returns the number of measures that were not
+        found in the measure cache.
+        """
+        return self._measure_cache_misses
+
+    @property
+    def best_score_history(self) -> array:
+        r"""Read-only property, returns an :obj:`array.array` with the score of
+        the fittest measure of each generation.
+        """
+        return self._best_score_history
+
+    @property
+    def mean_score_history(self) -> array:
+        r"""Read-only property, returns an :obj:`array.array` with the mean
+        score of the population of each generation.
+        """
+        return self._mean_score_history
+
     @property
     def pitch_population(self) -> list | None:
         r"""Read-only property, returns a list with all the population of the
-        current generation.
+        current generation. Individuals are converted from their indices into
+        genes only when this property is read.
         """
-        return self._pitch_population
+        return self._pitch_ga.population
 
     @property
     def attack_point_population(self) -> list | None:
         r"""Read-only property, returns a list with all the population of the
-        current generation.
+        current generation. Individuals are converted from their indices into
+        genes only when this property is read.
         """
-        return self._attack_point_population
+        return self._attack_point_ga.population
 
     @property
     def scores(self) -> list:
@@ -1544,24 +2048,14 @@ class GeneticAlgorithmMusicMaker:
         r"""Read-only property, returns the fittest individual of the current
         population.
         """
-        try:
-            return self._pitch_population[0]
-        except AttributeError:
-            return None
-        except TypeError:
-            return None
+        return self._pitch_ga.fittest_individual
 
     @property
     def fittest_attack_point_individual(self) -> list | None:
         r"""Read-only property, returns the fittest individual of the current
         population.
         """
-        try:
-            return self._attack_point_population[0]
-        except AttributeError:
-            return None
-        except TypeError:
-            return None
+        return self._attack_point_ga.fittest_individual
 
     @property
     def fittest_individual_score(self) -> list | float:
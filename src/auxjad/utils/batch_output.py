@@ -0,0 +1,164 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+import abjad
+
+
+def _format_result(
+    result: Any,
+) -> Any:
+    r"""Converts |abjad.Selection|'s (or tuples of them) into LilyPond
+    strings of |abjad.Staff|'s, leaving any other type untouched.
+    """
+    if isinstance(result, tuple):
+        return tuple(_format_result(item) for item in result)
+    if isinstance(result, abjad.Selection):
+        return abjad.lilypond(abjad.Staff(result))
+    return result
+
+
+def _run_task(
+    factory: Callable[[], Any],
+    seed: int,
+    method: str,
+    n: int | None,
+    lilypond: bool,
+) -> Any:
+    r"""Seeds :mod:`random`, instantiates an object from ``factory`` and
+    calls one of its output methods.
+    """
+    random.seed(seed)
+    instance = factory()
+    if n is None:
+        result = getattr(instance, method)()
+    else:
+        result = getattr(instance, method)(n)
+    if lilypond:
+        result = _format_result(result)
+    return result
+
+
+def batch_output(
+    factory: Callable[[], Any],
+    seeds: list[int],
+    *,
+    n: int | None = None,
+    method: str | None = None,
+    lilypond: bool = False,
+    max_workers: int | None = None,
+) -> list[Any]:
+    r"""Takes a callable which instantiates any of Auxjad's core classes and
+    a list of seeds, and generates one output per seed using a pool of
+    worker processes. Returns a :obj:`list` with the outputs in the same order
+    as the seeds.
+
+    Basic usage:
+        For each seed, the :mod:`random` module is seeded before ``factory``
+        is called, and then the output method of the new instance is called.
+        By default, this is ``output_all()``, or ``output_n(n)`` when the
+        keyword argument ``n`` is given. Since each task is seeded on its own,
+        the results do not depend on the number of workers nor on the order
+        in which tasks are completed.
+
+        >>> container = abjad.Container(r"c'4 d'4 e'4 f'4")
+        >>> factory = functools.partial(auxjad.WindowLooper,
+        ...                             container,
+        ...                             window_size=(3, 4),
+        ...                             step_size=(1, 16),
+        ...                             max_steps=4,
+        ...                             )
+        >>> results = auxjad.batch_output(factory, [1, 2, 3], n=4)
+        >>> len(results)
+        3
+        >>> type(results[0])
+        <class 'abjad.select.Selection'>
+
+        The ``factory`` must be picklable, so it should be either a class, a
+        function defined at the top level of a module, or a
+        :func:`functools.partial` object built from them. Lambdas and nested
+        functions cannot be used.
+
+    ``method``:
+        Use the keyword argument ``method`` to call an output method with a
+        different name, such as ``shuffle_n()`` of :class:`auxjad.Shuffler`.
+
+        >>> factory = functools.partial(auxjad.Shuffler, container)
+        >>> results = auxjad.batch_output(factory,
+        ...                               range(500),
+        ...                               n=8,
+        ...                               method='shuffle_n',
+        ...                               )
+
+    ``lilypond``:
+        Set ``lilypond`` to ``True`` to receive LilyPond strings (of an
+        |abjad.Staff| containing the output) instead of |abjad.Selection|'s.
+        Tuples of selections, such as the ones output by
+        :class:`auxjad.CrossFader`, are converted into tuples of strings. This
+        is faster than transferring Abjad objects between processes.
+
+        >>> results = auxjad.batch_output(factory,
+        ...                               [1, 2, 3],
+        ...                               n=2,
+        ...                               method='shuffle_n',
+        ...                               lilypond=True,
+        ...                               )
+        >>> print(results[0])
+        \new Staff
+        {
+            \time 4/4
+            f'4
+            c'4
+            e'4
+            d'4
+            d'4
+            c'4
+            f'4
+            e'4
+        }
+
+    ``max_workers``:
+        The number of worker processes is set by ``max_workers``, which
+        defaults to the number of processors of the machine. Setting it to
+        ``1`` runs all tasks in the current process, restoring the state of
+        the :mod:`random` module afterwards.
+    """
+    if not callable(factory):
+        raise TypeError("first positional argument must be callable")
+    seeds = list(seeds)
+    if not all(isinstance(seed, int) and not isinstance(seed, bool) for seed in seeds):
+        raise TypeError("second positional argument must be a 'list' of 'int'")
+    if n is not None:
+        if not isinstance(n, int):
+            raise TypeError("'n' must be 'int'")
+        if n <= 0:
+            raise ValueError("'n' must be a positive 'int'")
+    if method is None:
+        method = "output_all" if n is None else "output_n"
+    if not isinstance(method, str):
+        raise TypeError("'method' must be 'str'")
+    if not isinstance(lilypond, bool):
+        raise TypeError("'lilypond' must be 'bool'")
+    if max_workers is not None:
+        if not isinstance(max_workers, int):
+            raise TypeError("'max_workers' must be 'int'")
+        if max_workers < 1:
+            raise ValueError("'max_workers' must be greater than zero")
+    n_seeds = len(seeds)
+    if max_workers == 1:
+        state = random.getstate()
+        try:
+            return [_run_task(factory, seed, method, n, lilypond) for seed in seeds]
+        finally:
+            random.setstate(state)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                _run_task,
+                [factory] * n_seeds,
+                seeds,
+                [method] * n_seeds,
+                [n] * n_seeds,
+                [lilypond] * n_seeds,
+            )
+        )
@@ -205,7 +205,7 @@ def test_CartographySelector_no_repeat():
     result = ""
     for _ in range(30):
         result += str(selector(no_repeat=True))
-    assert result == "210421021020304024230120241202"
+    assert result == "201042103210102040402423023032"
 
 
 def test_CartographySelector_mirror_swap_odd_elements():
@@ -264,3 +264,110 @@ def test_CartographySelector__next__():
     result += next(selector)
     result += next(selector)
     assert result == "CBBEAE"
+
+
+def test_CartographySelector_seed():
+    rng = random.Random(3914)
+    selector1 = auxjad.CartographySelector([0, 1, 2, 3, 4], seed=rng)
+    result1 = [selector1() for _ in range(20)]
+    selector1.shuffle()
+    selector2 = auxjad.CartographySelector([0, 1, 2, 3, 4], seed=3914)
+    result2 = [selector2() for _ in range(20)]
+    selector2.shuffle()
+    assert result1 == result2
+    assert selector1.contents == selector2.contents
+    assert selector1.seed is rng
+    with pytest.raises(TypeError):
+        auxjad.CartographySelector([0, 1, 2, 3, 4], seed=True)
+    with pytest.raises(TypeError):
+        selector1.seed = 1.5
+
+
+def test_CartographySelector_draw():
+    selector1 = auxjad.CartographySelector([0, 1, 2, 3, 4], seed=22)
+    selector2 = auxjad.CartographySelector([0, 1, 2, 3, 4], seed=22)
+    assert selector1.draw(30) == [selector2() for _ in range(30)]
+    result = selector1.draw(50, no_repeat=True)
+    assert result == [selector2(no_repeat=True) for _ in range(50)]
+    assert all(first != second for first, second in zip(result, result[1:]))
+    assert selector1.previous_index == selector2.previous_index
+    with pytest.raises(TypeError):
+        selector1.draw(2.0)
+    with pytest.raises(ValueError):
+        selector1.draw(0)
+
+
+def test_CartographySelector_no_repeat_excludes_previous_index():
+    r"""Confirm no_repeat draws a single random number per call from the
+    distribution without the previous index, and that the cached cumulative
+    weights follow changes of contents and decay rate.
+    """
+    selector = auxjad.CartographySelector([0, 1, 2, 3, 4], seed=17)
+    selector()
+    reference = random.Random()
+    for _ in range(200):
+        previous_index = selector.previous_index
+        reference.setstate(selector._rng.getstate())
+        reference.random()
+        selector(no_repeat=True)
+        assert selector.previous_index != previous_index
+        assert selector._rng.getstate() == reference.getstate()
+    selector.decay_rate = 0.5
+    assert selector._cumulative_weights == pytest.approx([1.0, 1.5, 1.75, 1.875, 1.9375])
+    del selector[3:]
+    assert selector._cumulative_weights == pytest.approx([1.0, 1.5, 1.75])
+    selector = auxjad.CartographySelector(["A"])
+    selector()
+    with pytest.raises(ValueError):
+        selector(no_repeat=True)
+
+
+def test_CartographySelector_ring_buffer_transformations():
+    r"""Confirm content transformations applied to the ring buffer storing
+    the contents keep the same semantics as list operations.
+    """
+    selector = auxjad.CartographySelector([0, 1, 2, 3, 4], seed=4)
+    reference = [0, 1, 2, 3, 4]
+    for element in range(5, 25):
+        selector.drop_first_and_append(element)
+        reference = reference[1:] + [element]
+        selector.rotate(anticlockwise=element % 3 == 0)
+        if element % 3 == 0:
+            reference = reference[-1:] + reference[:-1]
+        else:
+            reference = reference[1:] + reference[:1]
+        selector.drop_n_and_append(-element, n=element % 5)
+        reference = reference[: element % 5] + reference[element % 5 + 1 :] + [-element]
+        selector.drop_last_and_prepend(element * 10)
+        reference = [element * 10] + reference[:-1]
+        selector.mirror_swap(1)
+        reference[1], reference[-2] = reference[-2], reference[1]
+        assert [selector[index] for index in range(-5, 5)] == reference[-5:] + reference
+        assert selector[1:4] == reference[1:4]
+        assert selector() == reference[selector.previous_index]
+        assert selector.previous_result == reference[selector.previous_index]
+    assert selector.contents == reference
+    assert selector.weights == pytest.approx([1.0, 0.75, 0.5625, 0.421875, 0.31640625])
+    with pytest.raises(IndexError):
+        selector[5]
+
+
+def test_CartographySelector_transformations_keep_previous_contents():
+    r"""Confirm lists previously read from ``contents`` are not changed by
+    content transformations which shift elements.
+    """
+    selector = auxjad.CartographySelector([0, 1, 2, 3, 4])
+    contents = selector.contents
+    selector.drop_first_and_append(5)
+    assert contents == [0, 1, 2, 3, 4]
+    contents = selector.contents
+    selector.drop_last_and_prepend(6)
+    assert contents == [1, 2, 3, 4, 5]
+    contents = selector.contents
+    selector.drop_n_and_append(7, n=2)
+    assert contents == [6, 1, 2, 3, 4]
+    contents = selector.contents
+    selector.rotate()
+    selector.mirror_swap(0)
+    assert contents == [6, 1, 3, 4, 7]
+    assert selector.contents == [6, 3, 4, 7, 1]
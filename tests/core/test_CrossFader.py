@@ -1434,3 +1434,65 @@ def test_CrossFader_20():
             }
         >>
         """)
+
+
+def test_CrossFader_21():
+    fade_out_container = abjad.Container(r"e'8 fs'4. r2")
+    fade_in_container = abjad.Container(r"c''4 <d'' f''>4 r2")
+    outputs = []
+    for precompute_masks in (False, True):
+        fader = auxjad.CrossFader(
+            fade_out_container,
+            fade_in_container,
+            initial_repetitions=2,
+            final_repetitions=3,
+            repetition_chance=0.5,
+            precompute_masks=precompute_masks,
+            seed=13,
+        )
+        selection_a, selection_b = fader.output_all()
+        score = abjad.Score([abjad.Staff(selection_a), abjad.Staff(selection_b)])
+        outputs.append(abjad.lilypond(score))
+    assert outputs[0] == outputs[1]
+
+
+def test_CrossFader_22():
+    fade_out_container = abjad.Container(r"e'8 fs'4. r2")
+    fade_in_container = abjad.Container(r"c''4 d''4 r2")
+    fader = auxjad.CrossFader(
+        fade_out_container,
+        fade_in_container,
+        render_cache_size=10,
+        seed=3,
+    )
+    selection_a1, selection_b1 = fader.output_all()
+    misses = fader.render_cache_misses
+    assert fader.render_cache_hits == 0
+    assert misses >= 2
+    fader.seed = 3
+    selection_a2, selection_b2 = fader.output_all()
+    assert abjad.lilypond(abjad.Staff(selection_a1)) == abjad.lilypond(abjad.Staff(selection_a2))
+    assert abjad.lilypond(abjad.Staff(selection_b1)) == abjad.lilypond(abjad.Staff(selection_b2))
+    assert fader.render_cache_misses == misses
+    assert fader.render_cache_hits > 0
+    fader.clear_render_cache()
+    assert fader.render_cache_hits == 0
+    assert fader.render_cache_misses == 0
+
+
+def test_CrossFader_23():
+    fade_out_container = abjad.Container(r"c'4 d'4 e'4 f'4")
+    fade_in_container = abjad.Container(r"g'2 a'2")
+    outputs = []
+    for global_seed in (1, 2, 3):
+        random.seed(global_seed)
+        fader = auxjad.CrossFader(fade_out_container, fade_in_container, seed=7)
+        selection_a, selection_b = fader.output_all()
+        score = abjad.Score([abjad.Staff(selection_a), abjad.Staff(selection_b)])
+        outputs.append(abjad.lilypond(score))
+    assert outputs[0] == outputs[1] == outputs[2]
+    random.seed(4)
+    fader.seed = 7
+    selection_a, selection_b = fader.output_all()
+    score = abjad.Score([abjad.Staff(selection_a), abjad.Staff(selection_b)])
+    assert abjad.lilypond(score) == outputs[0]
@@ -230,6 +230,40 @@ class TestDeBruijnCorrectness:
         )
         assert db_generator.output_all() == expected
 
+    @pytest.mark.parametrize(
+        "order, k, cyclic",
+        [
+            (1, 2, True),
+            (4, 2, True),
+            (3, 3, True),
+            (2, 5, True),
+            (3, 12, True),
+            (1, 2, False),
+            (4, 2, False),
+            (3, 3, False),
+            (3, 12, False),
+        ],
+    )
+    def test_fkm_valid(self, order, k, cyclic):
+        db_generator = auxjad.DeBruijnGenerator(
+            list(range(k)), order=order, algorithm="fkm", cyclic=cyclic
+        )
+        if cyclic:
+            assert is_valid_de_bruijn_cyclic(db_generator.output_all(), order, k)
+        else:
+            assert is_valid_de_bruijn_linear(db_generator.output_all(), order, k)
+
+    def test_fkm_is_lexicographically_smallest(self):
+        db_generator = auxjad.DeBruijnGenerator([0, 1], order=4, algorithm="fkm", cyclic=True)
+        assert db_generator.output_all() == [0, 0, 0, 0, 1, 0, 0, 1, 1, 0, 1, 0, 1, 1, 1, 1]
+        db_generator = auxjad.DeBruijnGenerator(["A", "B", "C"], order=2, algorithm="fkm")
+        assert db_generator.output_all() == ["A", "A", "B", "A", "C", "B", "B", "C", "C", "A"]
+
+    def test_fkm_large_order_and_alphabet(self):
+        db_generator = auxjad.DeBruijnGenerator(list(range(12)), order=6, algorithm="fkm")
+        assert db_generator.sequence_length == 12**6 + 5
+        assert db_generator.output_n(7) == [0, 0, 0, 0, 0, 0, 1]
+
     def test_pcr1_and_pcr2_differ_for_order_4_binary(self):
         db_generator_pcr1 = auxjad.DeBruijnGenerator([0, 1], order=4, algorithm="pcr1", cyclic=True)
         db_generator_pcr2 = auxjad.DeBruijnGenerator([0, 1], order=4, algorithm="pcr2", cyclic=True)
@@ -619,6 +653,99 @@ class TestCyclicSetter:
             db_generator.cyclic = 1
 
 
+class TestLazy:
+    def test_lazy_default_is_false(self):
+        db_generator = auxjad.DeBruijnGenerator([0, 1], order=2)
+        assert db_generator.lazy is False
+
+    def test_lazy_not_bool_raises(self):
+        with pytest.raises(TypeError):
+            auxjad.DeBruijnGenerator([0, 1], order=2, lazy=1)
+
+    @pytest.mark.parametrize("algorithm", ["pcr1", "pcr2", "fkm"])
+    @pytest.mark.parametrize("cyclic", [True, False])
+    def test_lazy_matches_eager(self, algorithm, cyclic):
+        eager_generator = auxjad.DeBruijnGenerator(
+            ["A", "B", "C"], order=3, algorithm=algorithm, cyclic=cyclic
+        )
+        lazy_generator = auxjad.DeBruijnGenerator(
+            ["A", "B", "C"], order=3, algorithm=algorithm, cyclic=cyclic, lazy=True
+        )
+        assert lazy_generator.sequence_length == eager_generator.sequence_length
+        assert lazy_generator.sequence == eager_generator.sequence
+        assert lazy_generator.output_n(5) == eager_generator.output_n(5)
+        assert lazy_generator.output_all() == eager_generator.output_all()
+        if cyclic:
+            assert lazy_generator.output_n(40) == eager_generator.output_n(40)
+        else:
+            with pytest.raises(StopIteration):
+                lazy_generator()
+
+    def test_lazy_does_not_generate_sequence(self):
+        db_generator = auxjad.DeBruijnGenerator(
+            list(range(12)), order=6, algorithm="pcr1", lazy=True
+        )
+        assert db_generator._sequence is None
+        assert db_generator.sequence_length == 12**6 + 5
+        assert db_generator.output_n(8) == [0, 0, 0, 0, 0, 0, 1, 0]
+        assert db_generator.last_selected_index_of_sequence == 7
+
+    def test_lazy_setter_triggers_reset(self):
+        db_generator = auxjad.DeBruijnGenerator([0, 1], order=3)
+        db_generator.output_n(3)
+        db_generator.lazy = True
+        assert db_generator.last_selected_index_of_sequence is None
+        assert db_generator.output_all() == [0, 0, 0, 1, 0, 1, 1, 1, 0, 0]
+        with pytest.raises(TypeError):
+            db_generator.lazy = "True"
+
+
+class TestRandomAccess:
+    @pytest.mark.parametrize("algorithm", ["pcr1", "pcr2", "fkm"])
+    @pytest.mark.parametrize("cyclic", [True, False])
+    @pytest.mark.parametrize("lazy", [True, False])
+    def test_element_at_and_window_position(self, algorithm, cyclic, lazy):
+        db_generator = auxjad.DeBruijnGenerator(
+            ["A", "B", "C"], order=3, algorithm=algorithm, cyclic=cyclic, lazy=lazy
+        )
+        sequence = db_generator.sequence
+        assert [db_generator.element_at(i) for i in range(len(sequence))] == sequence
+        assert db_generator.element_at(-1) == sequence[-1]
+        wrapped_sequence = sequence + sequence[:2] if cyclic else sequence
+        for first in "ABC":
+            for second in "ABC":
+                for third in "ABC":
+                    position = db_generator.window_position([first, second, third])
+                    assert wrapped_sequence[position : position + 3] == [first, second, third]
+        assert db_generator.last_selected_index_of_sequence is None
+
+    @pytest.mark.parametrize("lazy", [True, False])
+    def test_seek(self, lazy):
+        db_generator = auxjad.DeBruijnGenerator(
+            [0, 1, 2, 3], order=3, algorithm="pcr2", cyclic=True, lazy=lazy
+        )
+        sequence = db_generator.sequence
+        db_generator.seek(30)
+        assert db_generator.previous_element == sequence[29]
+        assert db_generator.output_n(40) == sequence[30:] + sequence[:6]
+        db_generator.seek(0)
+        assert db_generator.previous_element is None
+        assert db_generator.output_n(3) == sequence[:3]
+        db_generator.seek(-2)
+        assert db_generator.output_all() == sequence[-2:]
+
+    def test_random_access_raises(self):
+        db_generator = auxjad.DeBruijnGenerator([0, 1], order=2)
+        with pytest.raises(IndexError):
+            db_generator.element_at(5)
+        with pytest.raises(TypeError):
+            db_generator.seek(1.0)
+        with pytest.raises(ValueError):
+            db_generator.window_position([0, 1, 1])
+        with pytest.raises(ValueError):
+            db_generator.window_position([0, 2])
+
+
 class TestIndexingAndSlicing:
     def test_getitem_returns_correct_element(self):
         db_generator = auxjad.DeBruijnGenerator([10, 20, 30], order=2)
@@ -1500,3 +1500,30 @@ def test_Echoer_30():
             \pp
         }
         """)
+
+
+def test_Echoer_31():
+    container = abjad.Container(r"c'4\mf d'4 e'2")
+    echoer1 = auxjad.Echoer(container, repetition_chance=0.5, seed=7)
+    echoer2 = auxjad.Echoer(container, repetition_chance=0.5, seed=7, render_cache_size=10)
+    staff1 = abjad.Staff(echoer1.output_all())
+    staff2 = abjad.Staff(echoer2.output_all())
+    assert abjad.lilypond(staff1) == abjad.lilypond(staff2)
+    n_windows = echoer2.render_cache_hits + echoer2.render_cache_misses
+    assert echoer2.render_cache_misses == 7
+    echoer2.reset()
+    staff3 = abjad.Staff(echoer2())
+    assert echoer2.render_cache_hits + echoer2.render_cache_misses == n_windows + 1
+    assert abjad.lilypond(staff3) == abjad.String.normalize(r"""
+        \new Staff
+        {
+            \time 4/4
+            c'4
+            \mf
+            d'4
+            e'2
+        }
+        """)
+    echoer2.clear_render_cache()
+    assert echoer2.render_cache_hits == 0
+    assert echoer2.render_cache_misses == 0
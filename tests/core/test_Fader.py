@@ -1518,3 +1518,160 @@ def test_Fader_33():
             )
         }
         """)
+
+
+def test_Fader_34():
+    container = abjad.Container(r"c'8 d'8 e'8 f'8 g'8 a'8 b'8 c''8")
+    fader1 = auxjad.Fader(container, max_steps=2, seed=5623)
+    fader2 = auxjad.Fader(container, max_steps=2, seed=random.Random(5623))
+    staff1 = abjad.Staff(fader1.output_all())
+    random.seed(2)
+    staff2 = abjad.Staff(fader2.output_all())
+    assert abjad.lilypond(staff1) == abjad.lilypond(staff2)
+
+
+def test_Fader_35():
+    container = abjad.Container(r"<c' e' g'>4 ~ <c' e' g'>16 d'8. e'4 <f' a'>4")
+    fader = auxjad.Fader(container, mask=[1, 1, 1, 1, 1, 1, 1])
+    assert len(fader) == 7
+    staff = abjad.Staff(fader())
+    original = abjad.lilypond(staff)
+    fader.mask = [1, 0, 1, 1, 0, 1, 1]
+    staff = abjad.Staff(fader())
+    assert abjad.lilypond(staff) == abjad.String.normalize(r"""
+        \new Staff
+        {
+            \time 4/4
+            <c' g'>4
+            ~
+            <c' g'>16
+            d'8.
+            r4
+            <f' a'>4
+        }
+        """)
+    fader.mask = [0, 0, 1, 1, 1, 1, 0]
+    staff = abjad.Staff(fader())
+    assert abjad.lilypond(staff) == abjad.String.normalize(r"""
+        \new Staff
+        {
+            \time 4/4
+            g'4
+            ~
+            g'16
+            d'8.
+            e'4
+            f'4
+        }
+        """)
+    fader.mask = [0, 0, 0, 0, 0, 0, 0]
+    staff = abjad.Staff(fader())
+    assert abjad.lilypond(staff) == abjad.String.normalize(r"""
+        \new Staff
+        {
+            \time 4/4
+            R1
+        }
+        """)
+    fader.mask = [1, 1, 1, 1, 1, 1, 1]
+    staff = abjad.Staff(fader())
+    assert abjad.lilypond(staff) == original
+
+
+def test_Fader_36():
+    container = abjad.Container(r"c'16 d'16 e'16 f'16 " * 8)
+    fader = auxjad.Fader(container, mode="in", max_steps=4, seed=3)
+    assert len(fader) == 32
+    previous_count = 0
+    for _ in fader:
+        count = sum(fader.mask)
+        assert previous_count <= count <= previous_count + 4
+        previous_count = count
+    assert fader.mask == [1] * 32
+    fader.mode = "out"
+    fader.mask = [1] * 32
+    fader.process_on_first_call = True
+    fader()
+    assert 28 <= sum(fader.mask) < 32
+    mask = fader.mask
+    mask[0] = 1 - mask[0]
+    assert fader.mask != mask
+
+
+def test_Fader_37():
+    container = abjad.Container(r"c'4 <d' f'>4 e'8 f'8 g'4")
+    fader1 = auxjad.Fader(container, max_steps=2, repetition_chance=0.5, seed=71)
+    fader2 = auxjad.Fader(
+        container,
+        max_steps=2,
+        repetition_chance=0.5,
+        precompute_masks=True,
+        seed=71,
+    )
+    assert fader2.precompute_masks
+    staff1 = abjad.Staff(fader1.output_all())
+    staff2 = abjad.Staff(fader2.output_all())
+    assert abjad.lilypond(staff1) == abjad.lilypond(staff2)
+    assert fader1.mask == fader2.mask == [0, 0, 0, 0, 0, 0]
+    fader1.reset()
+    fader2.reset()
+    staff1 = abjad.Staff(fader1.output_n(3))
+    staff2 = abjad.Staff(fader2.output_n(3))
+    assert abjad.lilypond(staff1) == abjad.lilypond(staff2)
+    assert fader1.mask == fader2.mask
+    staff1 = abjad.Staff(fader1.current_window)
+    staff2 = abjad.Staff(fader2.current_window)
+    assert abjad.lilypond(staff1) == abjad.lilypond(staff2)
+
+
+def test_Fader_38():
+    container = abjad.Container(r"c'4 d'4 e'4 f'4")
+    fader = auxjad.Fader(container, mask=[1, 0, 1, 0], render_cache_size=2)
+    assert fader.render_cache_size == 2
+    staff1 = abjad.Staff(fader())
+    fader.mask = [1, 1, 1, 1]
+    fader()
+    fader.mask = [1, 0, 1, 0]
+    staff2 = abjad.Staff(fader())
+    assert abjad.lilypond(staff1) == abjad.lilypond(staff2)
+    assert abjad.lilypond(staff2) == abjad.String.normalize(r"""
+        \new Staff
+        {
+            \time 4/4
+            c'4
+            r4
+            e'4
+            r4
+        }
+        """)
+    assert fader.render_cache_hits == 1
+    assert fader.render_cache_misses == 2
+    assert staff1[0] is not staff2[0]
+    fader.disable_rewrite_meter = True
+    fader()
+    assert fader.render_cache_misses == 3
+    fader.mask = [0, 0, 0, 0]
+    fader()
+    assert fader.render_cache_misses == 4
+    fader.disable_rewrite_meter = False
+    fader.mask = [1, 1, 1, 1]
+    fader()
+    assert fader.render_cache_hits == 1
+    assert fader.render_cache_misses == 5
+    fader.clear_render_cache()
+    assert fader.render_cache_hits == 0
+    assert fader.render_cache_misses == 0
+    fader()
+    assert fader.render_cache_misses == 1
+    with pytest.raises(ValueError):
+        fader.render_cache_size = 0
+
+
+def test_Fader_39():
+    container = abjad.Container(r"c'4 d'4 e'4 f'4")
+    with pytest.raises(TypeError):
+        auxjad.Fader(container, seed=False)
+    fader = auxjad.Fader(container, seed=1)
+    with pytest.raises(TypeError):
+        fader.seed = True
+    assert fader.seed == 1
@@ -1,5 +1,8 @@
+import importlib
 import random
 
+import pytest
+
 import auxjad
 
 
@@ -179,3 +182,217 @@ def test_GeneticAlgorithm_08():
     assert ga.fittest_individual == ["A", "C", "E", "D", "E"]
     next(ga)
     assert ga.fittest_individual == ["A", "C", "D", "D", "E"]
+
+
+def test_GeneticAlgorithm_09():
+    ga1 = auxjad.GeneticAlgorithm(
+        target=["A", "B", "C", "D", "E"],
+        genes=["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"],
+        seed=89226,
+    )
+    ga2 = auxjad.GeneticAlgorithm(
+        target=["A", "B", "C", "D", "E"],
+        genes=["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"],
+        seed=89226,
+    )
+    for _ in range(5):
+        ga1()
+        random.seed(1)
+        ga2()
+        assert ga1.fittest_individual == ga2.fittest_individual
+        assert ga1.scores == ga2.scores
+
+
+def test_GeneticAlgorithm_10():
+    pytest.importorskip("numpy")
+    ga1 = auxjad.GeneticAlgorithm(
+        target=["A", "B", "C", "D", "E"],
+        genes=["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"],
+        keep_n_parents=2,
+        seed=7215,
+        use_numpy=True,
+    )
+    ga2 = auxjad.GeneticAlgorithm(
+        target=["A", "B", "C", "D", "E"],
+        genes=["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"],
+        keep_n_parents=2,
+        seed=7215,
+        use_numpy=True,
+    )
+    for _ in range(10):
+        ga1()
+        ga2()
+    assert ga1.population == ga2.population
+    assert ga1.scores == sorted(ga1.scores, reverse=True)
+    assert len(ga1.population) == 100
+    assert ga1.fittest_individual == ga1.population[0]
+    assert ga1.fittest_individual_score > 0.6
+    ga1.use_numpy = False
+    ga1()
+    assert ga1.generation_number == 10
+    ga1.use_numpy = True
+    ga1()
+    assert ga1.generation_number == 11
+    assert ga1.scores == sorted(ga1.scores, reverse=True)
+
+
+def test_GeneticAlgorithm_11():
+    ga = auxjad.GeneticAlgorithm(
+        target=[[0, 1], [2, 3], [4, 5]],
+        genes=[[0, 1], [2, 3], [4, 5], [6, 7]],
+        population_size=20,
+        select_n_parents=5,
+        seed=31,
+    )
+    for _ in range(5):
+        ga()
+    assert all(gene in ga.genes for individual in ga.population for gene in individual)
+    assert ga.fittest_individual == ga.population[0]
+    ga = auxjad.GeneticAlgorithm(
+        target=["A", "B", "C", "D", "E"],
+        genes=["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"],
+        seed=31,
+    )
+    ga()
+    population = ga.population
+    ga.genes = ["J", "I", "H", "G", "F", "E", "D", "C", "B", "A"]
+    assert ga.population == population
+    ga.evaluation_index = 0.5
+    ga()
+    assert ga.generation_number == 1
+    with pytest.raises(ValueError):
+        ga.genes = ["A", "B", "C", "D", "E"]
+
+
+def test_GeneticAlgorithm_12():
+    ga1 = auxjad.GeneticAlgorithm(
+        target=["A", "B", "C", "D", "E"],
+        genes=["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"],
+        keep_n_parents=5,
+        fitness_cache_size=1000,
+        seed=6124,
+    )
+    ga2 = auxjad.GeneticAlgorithm(
+        target=["A", "B", "C", "D", "E"],
+        genes=["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"],
+        keep_n_parents=5,
+        seed=6124,
+    )
+    for _ in range(10):
+        ga1()
+        ga2()
+    assert ga1.scores == ga2.scores
+    assert ga1.population == ga2.population
+    assert ga1.fitness_cache_hits + ga1.fitness_cache_misses == 1000
+    assert ga1.fitness_cache_hits >= 5 * 9
+    assert ga2.fitness_cache_hits == 0
+    ga1.fitness_cache_size = 10
+    assert len(ga1._fitness_cache) == 10
+    ga1.evaluation_index = 0.5
+    assert len(ga1._fitness_cache) == 0
+    ga1.clear_fitness_cache()
+    assert ga1.fitness_cache_hits == 0
+    assert ga1.fitness_cache_misses == 0
+    with pytest.raises(ValueError):
+        ga1.fitness_cache_size = 0
+    with pytest.raises(TypeError):
+        ga1.fitness_cache_size = 1.5
+
+
+def test_GeneticAlgorithm_13():
+    calls = []
+
+    def count_matches(population, target):
+        calls.append(len(population))
+        return [
+            sum(gene == target_gene for gene, target_gene in zip(individual, target)) / len(target)
+            for individual in population
+        ]
+
+    ga1 = auxjad.GeneticAlgorithm(
+        target=["A", "B", "C", "D", "E"],
+        genes=["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"],
+        keep_n_parents=3,
+        fitness_function=count_matches,
+        seed=8171,
+    )
+    for _ in range(5):
+        ga1()
+    assert calls == [100] * 5
+    assert ga1.scores == count_matches(ga1.population, ga1.target)
+    assert ga1.scores == sorted(ga1.scores, reverse=True)
+    calls.clear()
+    ga2 = auxjad.GeneticAlgorithm(
+        target=["A", "B", "C", "D", "E"],
+        genes=["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"],
+        keep_n_parents=3,
+        fitness_function=count_matches,
+        fitness_cache_size=500,
+        seed=8171,
+    )
+    for _ in range(5):
+        ga2()
+    assert ga2.population == ga1.population
+    assert ga2.scores == ga1.scores
+    assert sum(calls) == ga2.fitness_cache_misses
+    assert ga2.fitness_cache_hits + ga2.fitness_cache_misses == 500
+    with pytest.raises(TypeError):
+        ga2.fitness_function = "count_matches"
+    with pytest.raises(ValueError):
+        ga2.fitness_function = lambda population, target: [1.0]
+        ga2()
+
+
+def test_GeneticAlgorithm_14():
+    ga = auxjad.GeneticAlgorithm(
+        target=["A", "B", "C", "D", "E"],
+        genes=["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"],
+        seed=3,
+    )
+    n_generations = ga.run_until(100, target_score=1.0)
+    assert n_generations == 11
+    assert ga.generation_number == 10
+    assert ga.fittest_individual == ["A", "B", "C", "D", "E"]
+    assert len(ga.best_score_history) == 11
+    assert len(ga.mean_score_history) == 11
+    assert ga.best_score_history[-1] == 1.0
+    assert all(mean <= best for mean, best in zip(ga.mean_score_history, ga.best_score_history))
+    ga.reset()
+    assert len(ga.best_score_history) == 0
+    ga = auxjad.GeneticAlgorithm(
+        target=["A", "B", "C", "D", "E"],
+        genes=["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"],
+        keep_n_parents=1,
+        seed=3,
+    )
+    n_generations = ga.run_until(100, patience=5)
+    history = ga.best_score_history
+    assert n_generations < 100
+    assert history[-6] == history[-1] == max(history)
+    assert max(history[:-5]) == max(history)
+    with pytest.raises(ValueError):
+        ga.run_until(0)
+    with pytest.raises(TypeError):
+        ga.run_until(10, patience=1.5)
+
+
+def test_GeneticAlgorithm_15(monkeypatch):
+    module = importlib.import_module("auxjad.core.GeneticAlgorithm")
+    monkeypatch.setattr(module, "np", None)
+    ga1 = auxjad.GeneticAlgorithm(
+        target=["A", "B", "C", "D", "E"],
+        genes=["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"],
+        seed=9215,
+        use_numpy=True,
+    )
+    ga2 = auxjad.GeneticAlgorithm(
+        target=["A", "B", "C", "D", "E"],
+        genes=["A", "B", "C", "D", "E", "F", "G", "H", "I", "J"],
+        seed=9215,
+    )
+    assert ga1.use_numpy
+    for _ in range(5):
+        ga1()
+        ga2()
+    assert ga1.population == ga2.population
+    assert ga1.scores == ga2.scores
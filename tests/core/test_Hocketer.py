@@ -1207,3 +1207,16 @@ def test_Hocketer_23():
     ]
     hocketer.n_voices = 4
     assert hocketer.pitch_ranges is None
+
+
+def test_Hocketer_24():
+    container = abjad.Container(r"c'8 d'8 e'8 f'8 g'8 a'8 b'8 c''8")
+    hocketer1 = auxjad.Hocketer(container, n_voices=3, seed=4410)
+    hocketer2 = auxjad.Hocketer(container, n_voices=3, seed=4410)
+    music1 = hocketer1()
+    random.seed(4)
+    music2 = hocketer2()
+    for selection1, selection2 in zip(music1, music2):
+        staff1 = abjad.Staff(selection1)
+        staff2 = abjad.Staff(selection2)
+        assert abjad.lilypond(staff1) == abjad.lilypond(staff2)
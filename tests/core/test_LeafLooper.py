@@ -1028,3 +1028,33 @@ def test_LeafLooper_30():
             r8
         }
         """)
+
+
+def test_LeafLooper_31():
+    container = abjad.Container(r"c'4 \p d'4 d'4 e'4 \f f'2")
+    looper = auxjad.LeafLooper(container, window_size=2)
+    chunks = list(looper.iter_output(4, chunk_size=3, tie_identical_pitches=True))
+    assert len(chunks) == 2
+    staff = abjad.Staff()
+    for chunk in chunks:
+        staff.extend(chunk)
+    assert abjad.lilypond(staff) == abjad.String.normalize(r"""
+        \new Staff
+        {
+            \time 2/4
+            c'4
+            \p
+            d'4
+            ~
+            d'4
+            d'4
+            ~
+            d'4
+            e'4
+            \f
+            ~
+            \time 3/4
+            e'4
+            f'2
+        }
+        """)
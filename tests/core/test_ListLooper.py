@@ -336,3 +336,14 @@ def test_ListLooper_19():
         end_with_max_n_elements=True,
     )
     assert looper.output_all() == ["A", "B", "C", "B", "C", "D"]
+
+
+def test_ListLooper_20():
+    input_list = ["A", "B", "C", "D"]
+    looper = auxjad.ListLooper(input_list, window_size=3)
+    assert list(looper.iter_output(chunk_size=2)) == [
+        ["A", "B", "C", "B", "C", "D"],
+        ["C", "D", "D"],
+    ]
+    looper = auxjad.ListLooper(input_list, window_size=3)
+    assert list(looper.iter_output(2)) == [["A", "B", "C"], ["B", "C", "D"]]
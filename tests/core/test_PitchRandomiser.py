@@ -552,3 +552,15 @@ def test_PitchRandomiser_20():
     score = abjad.Score([staff])
     randomiser = auxjad.PitchRandomiser(score, pitches)
     assert isinstance(randomiser(), abjad.Selection)
+
+
+def test_PitchRandomiser_21():
+    container = abjad.Container(r"c'8 d'8 e'8 f'8 g'8 a'8 b'8 c''8")
+    pitches = [0, 2, 4, 5, 7, 9, 11]
+    randomiser1 = auxjad.PitchRandomiser(container, pitches, use_tenney_selector=True, seed=53)
+    randomiser2 = auxjad.PitchRandomiser(container, pitches, use_tenney_selector=True)
+    randomiser2.seed = 53
+    staff1 = abjad.Staff(randomiser1.output_n(3))
+    random.seed(5)
+    staff2 = abjad.Staff(randomiser2.output_n(3))
+    assert abjad.lilypond(staff1) == abjad.lilypond(staff2)
@@ -943,3 +943,13 @@ def test_Shuffler_swap_limit():
             d'8
         }
         """)
+
+
+def test_Shuffler_seed():
+    container = abjad.Container(r"c'4 d'4 e'4 f'4 g'4 a'4 b'4 c''4")
+    shuffler1 = auxjad.Shuffler(container, seed=27)
+    shuffler2 = auxjad.Shuffler(container, seed=27)
+    staff1 = abjad.Staff(shuffler1.shuffle_n(4))
+    random.seed(98123)
+    staff2 = abjad.Staff(shuffler2.shuffle_n(4))
+    assert abjad.lilypond(staff1) == abjad.lilypond(staff2)
@@ -278,3 +278,66 @@ def test_TenneySelector_using_None_weights_for_uniform_weights():
     assert selector.weights == [1.0, 1.0, 5.0, 5.0, 10.0, 20.0]
     selector.weights = None
     assert selector.weights == [1.0, 1.0, 1.0, 1.0, 1.0, 1.0]
+
+
+def test_TenneySelector_seed():
+    r"""Confirm instances with the same seed draw identical streams which are
+    independent of the global random module."""
+    selector1 = auxjad.TenneySelector(["A", "B", "C", "D", "E", "F"], seed=1234)
+    selector2 = auxjad.TenneySelector(["A", "B", "C", "D", "E", "F"], seed=1234)
+    result1 = [selector1() for _ in range(20)]
+    random.seed(1)
+    result2 = [selector2() for _ in range(20)]
+    assert result1 == result2
+    assert selector1.seed == 1234
+    with pytest.raises(TypeError):
+        selector1.seed = "1234"
+
+
+def test_TenneySelector_linear_curvature_draws_match_probabilities():
+    r"""Confirm draws with linear curvature, which use cumulative weight trees,
+    match sampling the probabilities vector with random.choices(), including
+    after weights, deletions and resets change it."""
+    selector = auxjad.TenneySelector(
+        list(range(50)),
+        weights=[1.0 + (index % 7) * 0.5 for index in range(50)],
+        seed=8,
+    )
+    reference = random.Random()
+    for iteration in range(300):
+        if iteration == 100:
+            del selector[10:20]
+        elif iteration == 200:
+            selector.reset_probabilities()
+        reference.setstate(selector._rng.getstate())
+        expected = reference.choices(range(len(selector)), weights=selector.probabilities)[0]
+        selector()
+        assert selector.previous_index == expected
+    assert selector.counter[selector.previous_index] == 0
+    assert selector.probabilities[selector.previous_index] == 0.0
+
+
+def test_TenneySelector_draw():
+    r"""Confirm draw() outputs the same elements as calling the selector
+    repeatedly, leaving it in the same state."""
+    for curvature in (1.0, 0.5, 2.0):
+        selector1 = auxjad.TenneySelector(
+            ["A", "B", "C", "D", "E", "F"],
+            weights=[1.0, 2.0, 1.0, 3.0, 1.0, 0.5],
+            curvature=curvature,
+            seed=61,
+        )
+        selector2 = auxjad.TenneySelector(
+            ["A", "B", "C", "D", "E", "F"],
+            weights=[1.0, 2.0, 1.0, 3.0, 1.0, 0.5],
+            curvature=curvature,
+            seed=61,
+        )
+        assert selector1.draw(40) == [selector2() for _ in range(40)]
+        assert selector1.previous_index == selector2.previous_index
+        assert selector1.counter == selector2.counter
+        assert selector1.probabilities == selector2.probabilities
+    with pytest.raises(TypeError):
+        selector1.draw("3")
+    with pytest.raises(ValueError):
+        selector1.draw(-1)
@@ -1447,3 +1447,112 @@ def test_WindowLooper_33():
             r4
         }
         """)
+
+
+def test_WindowLooper_34():
+    container = abjad.Container(
+        r"c'4 \mf ( d'4 e'4 f'4 " * 49 + r"c'4 \p d'4 ( e'2 ~ e'4 f'4 g'2 )"
+    )
+    looper = auxjad.WindowLooper(
+        container,
+        window_size=(3, 4),
+        step_size=(1, 4),
+        head_position=(199, 4),
+    )
+    notes = looper.output_n(3)
+    staff = abjad.Staff(notes)
+    assert abjad.lilypond(staff) == abjad.String.normalize(r"""
+        \new Staff
+        {
+            \time 3/4
+            e'2
+            \p
+            (
+            f'4
+            )
+            e'4
+            (
+            f'4
+            g'4
+            )
+            f'4
+            (
+            g'2
+            )
+        }
+        """)
+
+
+def test_WindowLooper_35():
+    container = abjad.Container(r"c'4 \p \< d'4 e'4 f'4 \f \> g'4 a'4 \p r4 b'4 \p")
+    looper = auxjad.WindowLooper(
+        container,
+        window_size=(3, 4),
+        step_size=(1, 4),
+    )
+    chunks = list(looper.iter_output(chunk_size=2))
+    assert len(chunks) == 4
+    staff = abjad.Staff()
+    for chunk in chunks:
+        staff.extend(chunk)
+    assert abjad.lilypond(staff) == abjad.String.normalize(r"""
+        \new Staff
+        {
+            \time 3/4
+            c'4
+            \p
+            d'4
+            e'4
+            d'4
+            e'4
+            f'4
+            \f
+            e'4
+            \p
+            f'4
+            \f
+            g'4
+            f'4
+            \>
+            g'4
+            a'4
+            \p
+            g'4
+            \f
+            a'4
+            \p
+            r4
+            a'4
+            r4
+            b'4
+            r4
+            b'4
+            r4
+            b'4
+            r2
+        }
+        """)
+    looper = auxjad.WindowLooper(
+        container,
+        window_size=(3, 4),
+        step_size=(1, 4),
+    )
+    assert abjad.lilypond(staff) == abjad.lilypond(abjad.Staff(looper.output_all()))
+
+
+def test_WindowLooper_36():
+    container = abjad.Container(r"c'4 d'4 e'4 f'4 g'4 a'4 b'4 c''4")
+    kwargs = {
+        "window_size": (3, 4),
+        "step_size": (1, 8),
+        "max_steps": 3,
+        "repetition_chance": 0.25,
+        "forward_bias": 0.8,
+    }
+    looper1 = auxjad.WindowLooper(container, seed=721, **kwargs)
+    looper2 = auxjad.WindowLooper(container, seed=721, **kwargs)
+    staff1 = abjad.Staff(looper1.output_n(6))
+    random.seed(3)
+    staff2 = abjad.Staff(looper2.output_n(6))
+    assert abjad.lilypond(staff1) == abjad.lilypond(staff2)
+    assert looper1.seed == 721
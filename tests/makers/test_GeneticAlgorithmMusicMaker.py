@@ -1,6 +1,7 @@
 import random
 
 import abjad
+import pytest
 
 import auxjad
 
@@ -815,3 +816,234 @@ def test_GeneticAlgorithmMusicMaker_13():
         units_per_window=16,
     )
     assert maker.total_duration == abjad.Duration((1, 2))
+
+
+def test_GeneticAlgorithmMusicMaker_14():
+    kwargs = {
+        "pitch_target": ["c'", "d'", "e'", "f'"],
+        "pitch_genes": ["c'", "d'", "e'", "f'", "g'", "a'", "b'", "c''"],
+        "attack_point_target": [0, 4, 8, 12],
+        "attack_point_genes": list(range(16)),
+    }
+    maker1 = auxjad.GeneticAlgorithmMusicMaker(seed=6290, **kwargs)
+    maker2 = auxjad.GeneticAlgorithmMusicMaker(seed=6290, **kwargs)
+    staff1 = abjad.Staff(maker1.output_n(3))
+    random.seed(6)
+    staff2 = abjad.Staff(maker2.output_n(3))
+    assert abjad.lilypond(staff1) == abjad.lilypond(staff2)
+    assert maker1.seed == 6290
+
+
+def test_GeneticAlgorithmMusicMaker_15():
+    pytest.importorskip("numpy")
+    maker = auxjad.GeneticAlgorithmMusicMaker(
+        pitch_target=["c'", "d'", "e'", "f'"],
+        pitch_genes=["c'", "d'", "e'", "f'", "g'", "a'", "b'", "c''"],
+        attack_point_target=[0, 4, 8, 12],
+        attack_point_genes=list(range(16)),
+        seed=1,
+        use_numpy=True,
+    )
+    for _ in range(10):
+        maker()
+    assert maker.use_numpy
+    assert maker.scores == sorted(maker.scores, reverse=True)
+    assert maker.fittest_attack_point_individual == [0, 4, 8, 12]
+    assert all(individual == sorted(individual) for individual in maker.attack_point_population)
+
+
+def test_GeneticAlgorithmMusicMaker_16():
+    maker = auxjad.GeneticAlgorithmMusicMaker(
+        pitch_target=["c'", "d'", "e'", "f'"],
+        pitch_genes=["c'", "d'", "e'", "f'", "g'", "a'", "b'", "c''"],
+        attack_point_target=[0, 4, 8, 12],
+        attack_point_genes=list(range(16)),
+        seed=1,
+    )
+    n_generations = maker.run_until(100, target_score=0.5)
+    assert n_generations == 3
+    assert maker.generation_number == 2
+    assert maker.fittest_individual_score == 0.5
+    assert len(maker.best_score_history) == 3
+    assert len(maker.mean_score_history) == 3
+    staff = abjad.Staff(maker.fittest_measure)
+    assert abjad.lilypond(staff) == abjad.String.normalize(r"""
+        \new Staff
+        {
+            \time 4/4
+            c'4
+            d'4
+            e'4
+            f'4
+        }
+        """)
+    maker.reset()
+    assert len(maker.best_score_history) == 0
+    n_generations = maker.run_until(100, patience=3)
+    assert n_generations < 100
+    assert maker.best_score_history[-4] == max(maker.best_score_history)
+    with pytest.raises(TypeError):
+        maker.run_until(10, target_score="0.5")
+
+
+def test_GeneticAlgorithmMusicMaker_17():
+    kwargs = {
+        "pitch_target": ["c'", "d'", "e'", "f'"],
+        "pitch_genes": ["c'", "d'", "e'", "f'", "g'", "a'", "b'", "c''"],
+        "attack_point_target": [0, 4, 8, 12],
+        "attack_point_genes": list(range(16)),
+        "seed": 4402,
+    }
+    maker1 = auxjad.GeneticAlgorithmMusicMaker(**kwargs)
+    maker2 = auxjad.GeneticAlgorithmMusicMaker(**kwargs)
+    assert maker1.fittest_measure is None
+    for _ in range(5):
+        measure = maker1()
+    maker2.run_until(5)
+    assert maker2._fittest_measure is None
+    staff1 = abjad.Staff(measure)
+    staff2 = abjad.Staff(maker2.fittest_measure)
+    assert abjad.lilypond(staff1) == abjad.lilypond(staff2)
+    cached_measure = maker2._fittest_measure
+    maker2.fittest_measure
+    assert maker2._fittest_measure is cached_measure
+    maker2.attack_points_mode = True
+    staff3 = abjad.Staff(maker2.fittest_measure)
+    assert abjad.lilypond(staff3) != abjad.lilypond(staff2)
+
+
+def test_GeneticAlgorithmMusicMaker_18():
+    kwargs = {
+        "pitch_target": ["c'", "d'", "e'", "f'"],
+        "pitch_genes": ["c'", "d'", "e'", "f'", "g'", "a'", "b'", "c''"],
+        "attack_point_target": [0, 4, 8, 12],
+        "attack_point_genes": list(range(16)),
+        "mutation_chance": 0.5,
+        "seed": 2,
+    }
+    maker1 = auxjad.GeneticAlgorithmMusicMaker(measure_cache_size=64, **kwargs)
+    maker2 = auxjad.GeneticAlgorithmMusicMaker(**kwargs)
+    staff1 = abjad.Staff(maker1.output_n(20))
+    staff2 = abjad.Staff(maker2.output_n(20))
+    assert abjad.lilypond(staff1) == abjad.lilypond(staff2)
+    assert maker1.measure_cache_hits > 0
+    assert maker1.measure_cache_misses > 0
+    assert maker2.measure_cache_hits == 0
+    assert maker2.measure_cache_misses == 0
+    maker1.clear_measure_cache()
+    assert maker1.measure_cache_hits == 0
+    assert maker1.measure_cache_misses == 0
+    maker1.omit_time_signature = True
+    measure1 = maker1.fittest_measure
+    maker1.omit_time_signature = False
+    maker1.fittest_measure
+    assert maker1.measure_cache_hits == 0
+    assert maker1.measure_cache_misses == 2
+    maker1.omit_time_signature = True
+    measure2 = maker1.fittest_measure
+    assert maker1.measure_cache_hits == 1
+    assert maker1.measure_cache_misses == 2
+    assert measure1 is not measure2
+    assert abjad.lilypond(abjad.Staff(measure1)) == abjad.lilypond(abjad.Staff(measure2))
+    maker1.measure_cache_size = 1
+    maker1.omit_time_signature = False
+    maker1.fittest_measure
+    maker1.omit_time_signature = True
+    maker1.fittest_measure
+    assert maker1.measure_cache_hits == 1
+    assert maker1.measure_cache_misses == 4
+    with pytest.raises(ValueError):
+        maker1.measure_cache_size = 0
+
+
+def test_GeneticAlgorithmMusicMaker_19():
+    maker = auxjad.GeneticAlgorithmMusicMaker(
+        pitch_target=["c'", "d'", "e'", "f'"],
+        pitch_genes=["c'", "d'", "e'", "f'", "g'", "a'", "b'", "c''"],
+        attack_point_target=[0, 2, 4, 6],
+        attack_point_genes=list(range(8)),
+        duration_unit=abjad.Duration((1, 32)),
+        units_per_window=8,
+        attack_points_mode=True,
+    )
+    assert maker._sort_by_attack_point([5, 1, 5, 3, 1], ["c'", "d'", "e'", "f'", "g'"]) == (
+        [1, 3, 5],
+        ["d'", "f'", "c'"],
+    )
+    measure = maker._make_measure([5, 1, 5, 3], ["c'", "d'", "e'", "f'"])
+    staff = abjad.Staff(abjad.mutate.copy(measure))
+    assert abjad.lilypond(staff) == abjad.String.normalize(r"""
+        \new Staff
+        {
+            \time 1/4
+            r32
+            d'32
+            r32
+            f'32
+            r32
+            c'32
+            r16
+        }
+        """)
+
+
+def test_GeneticAlgorithmMusicMaker_20():
+    def make_maker():
+        return auxjad.GeneticAlgorithmMusicMaker(
+            pitch_target=["c'", "d'", "e'", "f'"],
+            pitch_genes=["c'", "d'", "e'", "f'", "g'", "a'", "b'", "c''"],
+            attack_point_target=[0, 4, 8, 12],
+            attack_point_genes=list(range(16)),
+            population_size=20,
+            seed=3,
+        )
+
+    maker_serial = make_maker()
+    maker_serial.run_islands(12, n_islands=3, migration_interval=5, migration_size=2, max_workers=1)
+    maker_parallel = make_maker()
+    maker_parallel.run_islands(
+        12, n_islands=3, migration_interval=5, migration_size=2, max_workers=2
+    )
+    assert maker_serial.scores == maker_parallel.scores
+    assert maker_serial.pitch_population == maker_parallel.pitch_population
+    assert maker_serial.attack_point_population == maker_parallel.attack_point_population
+    assert len(maker_serial.scores) == 20
+    assert maker_serial.scores == sorted(maker_serial.scores, reverse=True)
+    assert maker_serial.generation_number == 11
+    assert len(maker_serial.best_score_history) == 12
+    assert len(maker_serial.mean_score_history) == 12
+    assert maker_serial.fittest_individual_score == maker_serial.scores[0]
+    staff = abjad.Staff(maker_serial.fittest_measure)
+    assert abjad.lilypond(staff) == abjad.lilypond(abjad.Staff(maker_parallel.fittest_measure))
+    maker_serial()
+    assert maker_serial.generation_number == 12
+    assert len(maker_serial.scores) == 20
+    with pytest.raises(ValueError):
+        maker_serial.run_islands(5, migration_size=20, max_workers=1)
+    with pytest.raises(TypeError):
+        maker_serial.run_islands(5, n_islands=2.0, max_workers=1)
+
+
+def test_GeneticAlgorithmMusicMaker_21():
+    random.seed(18311)
+    maker = auxjad.GeneticAlgorithmMusicMaker(
+        pitch_target=["c'", "d'", "e'", "f'"],
+        pitch_genes=["c'", "d'", "e'", "f'", "g'", "a'", "b'", "c''"],
+        attack_point_target=[0, 4, 8, 12],
+        attack_point_genes=list(range(16)),
+        population_size=20,
+    )
+    assert maker.pitch_population is None
+    assert maker.attack_point_population is None
+    for _ in range(5):
+        maker()
+    assert len(maker.pitch_population) == len(maker.scores) == 20
+    assert len(maker.attack_point_population) == 20
+    assert maker.pitch_population[0] == maker.fittest_pitch_individual
+    assert maker.attack_point_population[0] == maker.fittest_attack_point_individual
+    maker()
+    assert maker.pitch_population[0] == maker.fittest_pitch_individual
+    assert maker.attack_point_population[0] == maker.fittest_attack_point_individual
+    maker.reset()
+    assert maker.pitch_population is None
+    assert maker.attack_point_population is None
@@ -0,0 +1,65 @@
+import functools
+
+import abjad
+import pytest
+
+import auxjad
+
+
+def test_batch_output_01():
+    container = abjad.Container(r"c'4 d'4 e'4 f'4")
+    factory = functools.partial(auxjad.Shuffler, container)
+    results = auxjad.batch_output(
+        factory,
+        [1, 2, 3],
+        n=2,
+        method="shuffle_n",
+        lilypond=True,
+    )
+    assert len(results) == 3
+    assert results[0] == abjad.String.normalize(r"""
+        \new Staff
+        {
+            \time 4/4
+            f'4
+            c'4
+            e'4
+            d'4
+            d'4
+            c'4
+            f'4
+            e'4
+        }
+        """)
+
+
+def test_batch_output_02():
+    container = abjad.Container(r"c'4 d'4 e'4 f'4 g'4 a'4")
+    factory = functools.partial(
+        auxjad.WindowLooper,
+        container,
+        window_size=(3, 4),
+        step_size=(1, 16),
+        max_steps=4,
+        repetition_chance=0.25,
+    )
+    seeds = list(range(8))
+    results_1 = auxjad.batch_output(factory, seeds, n=6, lilypond=True, max_workers=1)
+    results_2 = auxjad.batch_output(factory, seeds, n=6, lilypond=True, max_workers=3)
+    assert results_1 == results_2
+    results_3 = auxjad.batch_output(factory, seeds[::-1], n=6, lilypond=True, max_workers=2)
+    assert results_1 == results_3[::-1]
+
+
+def test_batch_output_03():
+    factory = functools.partial(auxjad.ListLooper, [1, 2, 3, 4], window_size=2)
+    assert auxjad.batch_output(factory, [0, 1]) == [
+        [1, 2, 2, 3, 3, 4, 4],
+        [1, 2, 2, 3, 3, 4, 4],
+    ]
+    with pytest.raises(ValueError):
+        auxjad.batch_output(factory, [0, 1], max_workers=0)
+    with pytest.raises(TypeError):
+        auxjad.batch_output(factory, [True, False])
+    with pytest.raises(TypeError):
+        auxjad.batch_output(factory, [0, True], max_workers=1)